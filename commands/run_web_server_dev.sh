@@ -1,4 +1,10 @@
 #!/bin/sh
 
+# Start every run with an empty shared metrics directory (multi-worker Prometheus metrics)
+if [ -n "$PROMETHEUS_MULTIPROC_DIR" ]; then
+    rm -rf "$PROMETHEUS_MULTIPROC_DIR"
+    mkdir -p "$PROMETHEUS_MULTIPROC_DIR"
+fi
+
 # Run web server
 uvicorn main:app --host 0.0.0.0 --port 8000 --reload --reload-dir /usr/src/fastapi
@@ -0,0 +1,115 @@
+"""
+Benchmark the per-page CPU cost of the movie list read path.
+
+Compares the former path (full `MovieModel` entities, `MovieListItemSchema.model_validate`
+per row, then response model validation and JSON encoding as FastAPI does it) with the
+column-projected path (plain rows serialized straight to JSON).
+
+Runs against an in-memory SQLite database, so no PostgreSQL service is needed:
+
+    python -m benchmarks.movie_list_serialization --movies 10000 --pages 2000
+"""
+import argparse
+import datetime
+import json
+import time
+
+from pydantic import TypeAdapter
+from pydantic_core import to_json
+from sqlalchemy import create_engine, insert, select
+from sqlalchemy.orm import Session
+
+from crud import build_paginated_movies_list_stmt
+from database import Base, CountryModel, MovieModel
+from database.models.movies import MovieStatusEnum
+from schemas import MovieListItemSchema, MovieListResponseSchema
+
+PER_PAGE = 20
+
+
+def seed_movies(session: Session, movies_count: int) -> None:
+    session.execute(insert(CountryModel).values(code="US"))
+    session.execute(
+        insert(MovieModel),
+        [
+            {
+                "name": f"Movie {i}",
+                "date": datetime.date(2000, 1, 1) + datetime.timedelta(days=i % 9000),
+                "score": float(i % 100),
+                "overview": "A long enough overview of the movie plot. " * 8,
+                "status": MovieStatusEnum.RELEASED,
+                "budget": 1_000_000 + i,
+                "revenue": 5_000_000.0 + i,
+                "country_id": 1,
+            }
+            for i in range(movies_count)
+        ],
+    )
+    session.commit()
+
+
+def _orm_page(session: Session, offset: int, response_adapter: TypeAdapter) -> bytes:
+    stmt = select(MovieModel).order_by(*MovieModel.default_order_by()).offset(offset).limit(PER_PAGE)
+    movies = session.execute(stmt).scalars().all()
+    response = MovieListResponseSchema(
+        movies=[MovieListItemSchema.model_validate(movie) for movie in movies],
+        prev_page=None,
+        next_page=None,
+        total_pages=1,
+        total_items=len(movies),
+    )
+    validated = response_adapter.validate_python(response.model_dump())
+    body = json.dumps(response_adapter.dump_python(validated, mode="json")).encode()
+    session.expunge_all()
+    return body
+
+
+def _rows_page(session: Session, offset: int) -> bytes:
+    rows = session.execute(build_paginated_movies_list_stmt(offset, PER_PAGE)).mappings().all()
+    movies = [dict(row) for row in rows]
+    for movie in movies:
+        movie.pop("version")
+    return to_json({
+        "movies": movies,
+        "prev_page": None,
+        "next_page": None,
+        "total_pages": 1,
+        "total_items": len(rows),
+    })
+
+
+def _measure(label: str, render_page, pages: int, movies_count: int) -> float:
+    start = time.process_time()
+    for page in range(pages):
+        render_page((page * PER_PAGE) % max(movies_count - PER_PAGE, 1))
+    per_page_us = (time.process_time() - start) / pages * 1_000_000
+    print(f"{label:<28} {per_page_us:10.1f} us CPU per page")
+    return per_page_us
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--movies", type=int, default=10_000)
+    parser.add_argument("--pages", type=int, default=2_000)
+    args = parser.parse_args()
+
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    response_adapter = TypeAdapter(MovieListResponseSchema)
+
+    with Session(engine) as session:
+        seed_movies(session, args.movies)
+
+        _orm_page(session, 0, response_adapter)
+        _rows_page(session, 0)
+
+        before = _measure("ORM + double validation", lambda offset: _orm_page(session, offset, response_adapter),
+                          args.pages, args.movies)
+        after = _measure("column rows + to_json", lambda offset: _rows_page(session, offset),
+                         args.pages, args.movies)
+
+    print(f"speedup: {before / after:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""
+Benchmark catalog-read latency while a burst of logins verifies passwords.
+
+A reader serves one movie list page every few milliseconds on the event loop while a burst of
+concurrent logins runs bcrypt verification either inline, as handlers used to, or on the
+password process pool. Inline verification stalls every read queued behind it; with the pool
+read latency stays flat.
+
+Runs against an in-memory SQLite database, so no PostgreSQL service is needed:
+
+    python -m benchmarks.password_hashing_event_loop --logins 16 --rounds 12
+"""
+import argparse
+import asyncio
+import statistics
+import time
+from typing import Awaitable, Callable, List
+
+from pydantic_core import to_json
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from benchmarks.movie_list_serialization import PER_PAGE, seed_movies
+from crud import build_paginated_movies_list_stmt
+from database import Base
+from security.password_service import PasswordService
+from security.passwords import pwd_context
+
+PASSWORD = "Benchmark-Password1!"
+READ_INTERVAL_SECONDS = 0.005
+
+
+def _read_page(session: Session) -> bytes:
+    rows = session.execute(build_paginated_movies_list_stmt(0, PER_PAGE)).mappings().all()
+    return to_json([dict(row) for row in rows])
+
+
+async def _read_latencies(session: Session, stop: asyncio.Event) -> List[float]:
+    """
+    Issue a catalog read every `READ_INTERVAL_SECONDS` and record how long after its
+    scheduled start each read completed.
+    """
+    latencies = []
+    next_start = time.perf_counter()
+    while not stop.is_set():
+        next_start += READ_INTERVAL_SECONDS
+        await asyncio.sleep(max(next_start - time.perf_counter(), 0))
+        _read_page(session)
+        latencies.append(time.perf_counter() - next_start)
+    return latencies
+
+
+async def _run_scenario(
+    label: str, session: Session, logins: int, verify: Callable[[str, str], Awaitable[bool]], hashed_password: str
+) -> None:
+    stop = asyncio.Event()
+    reader = asyncio.create_task(_read_latencies(session, stop))
+    await asyncio.sleep(0.05)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(verify(PASSWORD, hashed_password) for _ in range(logins)))
+    burst_seconds = time.perf_counter() - start
+
+    stop.set()
+    latencies = sorted(await reader)
+    p50 = statistics.median(latencies) * 1000
+    p99 = latencies[int(len(latencies) * 0.99) - 1] * 1000 if len(latencies) > 1 else latencies[0] * 1000
+    print(
+        f"{label:<24} burst {burst_seconds:6.2f} s  reads {len(latencies):5d}  "
+        f"p50 {p50:8.2f} ms  p99 {p99:8.2f} ms  max {latencies[-1] * 1000:8.2f} ms"
+    )
+
+
+async def _run(args: argparse.Namespace) -> None:
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    hashed_password = pwd_context.copy(bcrypt__rounds=args.rounds).hash(PASSWORD)
+
+    async def verify_inline(plain_password: str, hashed: str) -> bool:
+        return pwd_context.verify(plain_password, hashed)
+
+    service = PasswordService(max_workers=args.workers, queue_size=args.logins)
+    service.start()
+    await service.verify(PASSWORD, hashed_password)
+
+    with Session(engine) as session:
+        seed_movies(session, args.movies)
+        await _run_scenario("idle", session, 0, verify_inline, hashed_password)
+        await _run_scenario("inline bcrypt", session, args.logins, verify_inline, hashed_password)
+        await _run_scenario("password process pool", session, args.logins, service.verify, hashed_password)
+
+    service.shutdown()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--movies", type=int, default=1_000)
+    parser.add_argument("--logins", type=int, default=16)
+    parser.add_argument("--rounds", type=int, default=12)
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+    asyncio.run(_run(args))
+
+
+if __name__ == "__main__":
+    main()
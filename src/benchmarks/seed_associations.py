@@ -0,0 +1,141 @@
+"""
+Benchmark the row-building stages of the CSV seeder.
+
+Compares the former path (`DataFrame.iterrows` with the comma-separated `genre`, `crew` and
+`orig_lang` fields split row by row in Python) with the vectorized path of `CSVDatabaseSeeder`
+(`str.split`/`explode` and map-based ID lookups), and checks both build the same rows.
+
+Runs on synthetic, already preprocessed data, so neither a database nor the IMDB CSV is needed:
+
+    python -m benchmarks.seed_associations --rows 10000 100000 1000000
+"""
+import argparse
+import datetime
+import time
+from types import SimpleNamespace
+from typing import Dict, List, Tuple
+
+import numpy as np
+import pandas as pd
+
+from database.populate import CSVDatabaseSeeder
+
+COUNTRIES = 60
+GENRES = 20
+ACTORS = 50_000
+LANGUAGES = 40
+
+
+def synthetic_movies(rows: int, seed: int = 0) -> pd.DataFrame:
+    """Build a frame shaped like the output of `CSVDatabaseSeeder._preprocess_csv`."""
+    rng = np.random.default_rng(seed)
+    genres = rng.integers(0, GENRES, size=(rows, 3))
+    crew = np.sort(rng.integers(0, ACTORS, size=(rows, 4)), axis=1)
+    languages = rng.integers(0, LANGUAGES, size=(rows, 2))
+    return pd.DataFrame({
+        "names": [f"Movie {i}" for i in range(rows)],
+        "date_x": [datetime.date(1950, 1, 1) + datetime.timedelta(days=i % 27_000) for i in range(rows)],
+        "score": rng.integers(0, 100, size=rows),
+        "overview": "A long enough overview of the movie plot.",
+        "status": "Released",
+        "budget_x": rng.uniform(1e5, 3e8, size=rows),
+        "revenue": rng.uniform(0, 2e9, size=rows),
+        "country": [f"C{code:02d}" for code in rng.integers(0, COUNTRIES, size=rows)],
+        "genre": [", ".join(f"Genre {g}" for g in dict.fromkeys(row[:1 + i % 3])) for i, row in enumerate(genres)],
+        "crew": [",".join(f"Actor{a}" for a in dict.fromkeys(row)) for row in crew],
+        "orig_lang": [
+            ", ".join(f"Language{lang}" for lang in dict.fromkeys(row[:1 + i % 2])) for i, row in enumerate(languages)
+        ],
+    })
+
+
+def reference_map(names: List[str]) -> Dict[str, object]:
+    return {name: SimpleNamespace(id=i) for i, name in enumerate(names, start=1)}
+
+
+def _former_movies_data(data: pd.DataFrame, country_map: Dict[str, object]) -> List[Dict[str, object]]:
+    movies_data: List[Dict[str, object]] = []
+    for _, row in data.iterrows():
+        country = country_map[row['country']]
+        movies_data.append({
+            "name": row['names'],
+            "date": row['date_x'],
+            "score": float(row['score']),
+            "overview": row['overview'],
+            "status": row['status'],
+            "budget": float(row['budget_x']),
+            "revenue": float(row['revenue']),
+            "country_id": country.id
+        })
+    return movies_data
+
+
+def _former_associations(
+    data: pd.DataFrame,
+    movie_ids: List[int],
+    genre_map: Dict[str, object],
+    actor_map: Dict[str, object],
+    language_map: Dict[str, object]
+) -> Tuple[List[Dict[str, int]], List[Dict[str, int]], List[Dict[str, int]]]:
+    movie_genres_data: List[Dict[str, int]] = []
+    movie_actors_data: List[Dict[str, int]] = []
+    movie_languages_data: List[Dict[str, int]] = []
+    for i, (_, row) in enumerate(data.iterrows()):
+        movie_id = movie_ids[i]
+        for genre_name in row['genre'].split(','):
+            genre_name = genre_name.strip()
+            if genre_name:
+                movie_genres_data.append({"movie_id": movie_id, "genre_id": genre_map[genre_name].id})
+        for actor_name in row['crew'].split(','):
+            actor_name = actor_name.strip()
+            if actor_name:
+                movie_actors_data.append({"movie_id": movie_id, "actor_id": actor_map[actor_name].id})
+        for lang_name in row['orig_lang'].split(','):
+            lang_name = lang_name.strip()
+            if lang_name:
+                movie_languages_data.append({"movie_id": movie_id, "language_id": language_map[lang_name].id})
+    return movie_genres_data, movie_actors_data, movie_languages_data
+
+
+def _measure(label: str, build) -> Tuple[float, tuple]:
+    start = time.perf_counter()
+    result = build()
+    elapsed = time.perf_counter() - start
+    print(f"  {label:<12} {elapsed:9.2f} s")
+    return elapsed, result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    args = parser.parse_args()
+
+    country_map = reference_map([f"C{code:02d}" for code in range(COUNTRIES)])
+    genre_map = reference_map([f"Genre {genre}" for genre in range(GENRES)])
+    actor_map = reference_map([f"Actor{actor}" for actor in range(ACTORS)])
+    language_map = reference_map([f"Language{lang}" for lang in range(LANGUAGES)])
+
+    for rows in args.rows:
+        data = synthetic_movies(rows)
+        movie_ids = list(range(1, rows + 1))
+        print(f"{rows} rows:")
+
+        before, former = _measure("iterrows", lambda: (
+            _former_movies_data(data, country_map),
+            *_former_associations(data, movie_ids, genre_map, actor_map, language_map),
+        ))
+        after, vectorized = _measure("vectorized", lambda: (
+            CSVDatabaseSeeder._prepare_movies_data(data, country_map),
+            *CSVDatabaseSeeder._prepare_associations(data, movie_ids, genre_map, actor_map, language_map),
+        ))
+
+        assert former[0] == vectorized[0], "movie rows differ"
+        for former_rows, vectorized_rows in zip(former[1:], vectorized[1:]):
+            assert sorted(map(tuple, map(dict.values, former_rows))) == sorted(
+                map(tuple, map(dict.values, vectorized_rows))
+            ), "association rows differ"
+        print(f"  speedup: {before / after:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
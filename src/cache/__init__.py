@@ -0,0 +1,3 @@
+from cache.lru import LRUCache
+from cache.movies import movie_detail_cache
+from cache.tokens import access_token_cache
@@ -0,0 +1,122 @@
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Generic, Hashable, Optional, Tuple, TypeVar
+
+ValueT = TypeVar("ValueT")
+
+
+class LRUCache(Generic[ValueT]):
+    """
+    A bounded in-process cache with LRU eviction and per-entry expiry.
+
+    Entries expire after `ttl_seconds` unless a different TTL is given when they are stored.
+    The cache keeps hit, miss and eviction counters for monitoring. It is meant to be used
+    from a single event loop and performs no locking.
+
+    `invalidate` and `clear` stamp the keys they drop with a running generation. A reader that
+    takes the generation before loading a value and passes it to `set` cannot store a value
+    loaded before a concurrent invalidation: `set` drops it when the key was stamped later.
+    Only the last `maxsize` stamps are kept; an older one is folded into a floor that applies
+    to every key, so a reader racing a long-gone invalidation may skip caching, never cache a
+    stale value.
+    """
+
+    def __init__(self, maxsize: int, ttl_seconds: float) -> None:
+        self._maxsize = maxsize
+        self._ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[Hashable, Tuple[float, ValueT]]" = OrderedDict()
+        self._generation = 0
+        self._invalidated_at: "OrderedDict[Hashable, int]" = OrderedDict()
+        self._invalidated_floor = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Optional[ValueT]:
+        """
+        Return the cached value for `key`, or None on a miss or an expired entry.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        expires_at, value = entry
+        if time.monotonic() >= expires_at:
+            del self._entries[key]
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def generation(self) -> int:
+        """
+        Return the current generation, to be passed to `set` once the value is loaded.
+        """
+        return self._generation
+
+    def set(
+        self,
+        key: Hashable,
+        value: ValueT,
+        ttl_seconds: Optional[float] = None,
+        generation: Optional[int] = None,
+    ) -> None:
+        """
+        Store `value` under `key`, evicting the least recently used entry when the cache is full.
+
+        When `generation` is given and `key` was invalidated since it was taken, the value is
+        stale and is not stored.
+        """
+        if self._maxsize <= 0:
+            return
+        if generation is not None and self._invalidated_at.get(key, self._invalidated_floor) > generation:
+            return
+        ttl = self._ttl_seconds if ttl_seconds is None else ttl_seconds
+        if ttl <= 0:
+            return
+
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def invalidate(self, key: Hashable) -> None:
+        """
+        Drop the entry stored under `key`, if any, and stamp it with a new generation.
+        """
+        self._entries.pop(key, None)
+        self._generation += 1
+        self._invalidated_at[key] = self._generation
+        self._invalidated_at.move_to_end(key)
+        while len(self._invalidated_at) > max(self._maxsize, 1):
+            _, self._invalidated_floor = self._invalidated_at.popitem(last=False)
+
+    def clear(self) -> None:
+        """
+        Drop every entry and stamp every key with a new generation. Counters are kept.
+        """
+        self._entries.clear()
+        self._generation += 1
+        self._invalidated_at.clear()
+        self._invalidated_floor = self._generation
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Return the current size and the hit/miss/eviction counters.
+        """
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "maxsize": self._maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+        }
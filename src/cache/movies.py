@@ -0,0 +1,11 @@
+from typing import Tuple
+
+from cache.lru import LRUCache
+from config import get_settings
+
+settings = get_settings()
+
+movie_detail_cache: LRUCache[Tuple[str, bytes]] = LRUCache(
+    maxsize=settings.MOVIE_DETAIL_CACHE_SIZE,
+    ttl_seconds=settings.MOVIE_DETAIL_CACHE_TTL_SECONDS,
+)
@@ -0,0 +1,9 @@
+from cache.lru import LRUCache
+from config import get_settings
+
+settings = get_settings()
+
+access_token_cache: LRUCache[dict] = LRUCache(
+    maxsize=settings.ACCESS_TOKEN_CACHE_SIZE,
+    ttl_seconds=settings.ACCESS_TOKEN_CACHE_TTL_SECONDS,
+)
@@ -1,5 +1,6 @@
 from config.settings import BaseAppSettings
 from config.dependencies import (
     get_settings,
+    get_container,
     get_jwt_auth_manager,
 )
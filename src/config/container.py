@@ -0,0 +1,123 @@
+import asyncio
+import logging
+from dataclasses import dataclass
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import QueuePool
+
+from config.dependencies import get_settings
+from config.settings import BaseAppSettings
+from database.replicas import ReplicaRouter
+from database.session_postgresql import postgresql_engine, postgresql_replica_engines, AsyncPostgresqlSessionLocal
+from security.interfaces import JWTAuthManagerInterface
+from security.token_manager import JWTAuthManager
+
+logger = logging.getLogger(__name__)
+
+SHARED_SECRET_SETTINGS = ("SECRET_KEY_ACCESS", "SECRET_KEY_REFRESH")
+
+
+@dataclass(frozen=True)
+class Container:
+    """
+    Application-lifetime objects shared by every request of a worker.
+    """
+
+    settings: BaseAppSettings
+    engine: AsyncEngine
+    session_factory: sessionmaker
+    replicas: ReplicaRouter
+    jwt_manager: JWTAuthManagerInterface
+
+    async def warm_up(self, connections: int) -> None:
+        """
+        Open up to `connections` pooled database connections, so the first requests after a
+        start skip connection setup. Capped at the pool size, since overflow connections are
+        closed as soon as they are returned; engines without a queue pool keep no connections.
+
+        Best effort: a connection that fails is logged and releases the others, and the
+        application starts anyway, opening connections on demand.
+        """
+        if not isinstance(self.engine.pool, QueuePool):
+            return
+        count = min(connections, self.engine.pool.size())
+        if count <= 0:
+            return
+
+        async def _open_connection() -> None:
+            try:
+                async with self.engine.connect() as connection:
+                    await connection.execute(text("SELECT 1"))
+                    await barrier.wait()
+            except asyncio.BrokenBarrierError:
+                pass
+            except Exception:
+                await barrier.abort()
+                raise
+
+        barrier = asyncio.Barrier(count)
+        results = await asyncio.gather(*(_open_connection() for _ in range(count)), return_exceptions=True)
+        errors = [result for result in results if isinstance(result, Exception)]
+        if errors:
+            logger.warning(
+                "Could not pre-warm %d of %d database connections: %r", len(errors), count, errors[0]
+            )
+
+    async def close(self) -> None:
+        await self.replicas.close()
+        await self.engine.dispose()
+
+
+def check_multi_worker_settings(settings: BaseAppSettings) -> None:
+    """
+    Refuse to run several workers with per-process secret keys.
+
+    Without `SECRET_KEY_ACCESS` and `SECRET_KEY_REFRESH` in the environment each process
+    generates its own keys, and tokens issued by one worker are rejected by the others.
+
+    :raises RuntimeError: If `WEB_CONCURRENCY` is above 1 and a secret key is not set explicitly.
+    """
+    if settings.WEB_CONCURRENCY <= 1:
+        return
+
+    missing = [name for name in SHARED_SECRET_SETTINGS if name not in settings.model_fields_set]
+    if missing:
+        raise RuntimeError(
+            f"Running {settings.WEB_CONCURRENCY} workers requires shared secret keys; "
+            f"set {', '.join(missing)} in the environment."
+        )
+
+
+def create_container() -> Container:
+    """
+    Build the application container. Called once per worker from the lifespan hook.
+
+    The engine follows `DATABASE_BACKEND`; read replicas are only used with PostgreSQL.
+    """
+    settings = get_settings()
+    check_multi_worker_settings(settings)
+    if settings.DATABASE_BACKEND == "sqlite":
+        from database.session_sqlite import get_sqlite_engine, get_sqlite_session_factory
+
+        engine, session_factory, replica_engines = get_sqlite_engine(), get_sqlite_session_factory(), []
+    else:
+        engine, session_factory = postgresql_engine, AsyncPostgresqlSessionLocal
+        replica_engines = postgresql_replica_engines
+    return Container(
+        settings=settings,
+        engine=engine,
+        session_factory=session_factory,
+        replicas=ReplicaRouter(
+            primary_session_factory=session_factory,
+            replica_engines=replica_engines,
+            health_check_interval_seconds=settings.DB_REPLICA_HEALTH_CHECK_INTERVAL_SECONDS,
+            health_check_timeout_seconds=settings.DB_REPLICA_HEALTH_CHECK_TIMEOUT_SECONDS,
+        ),
+        jwt_manager=JWTAuthManager(
+            secret_key_access=settings.SECRET_KEY_ACCESS,
+            secret_key_refresh=settings.SECRET_KEY_REFRESH,
+            algorithm=settings.JWT_SIGNING_ALGORITHM,
+        ),
+    )
@@ -1,35 +1,70 @@
-from fastapi import Depends
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+from fastapi import Depends, Request
 
 from config.settings import Settings, BaseAppSettings
 from security.interfaces import JWTAuthManagerInterface
 from security.token_manager import JWTAuthManager
 
+if TYPE_CHECKING:
+    from config.container import Container
+
 
+@lru_cache
 def get_settings() -> BaseAppSettings:
     """
-    Retrieve the application settings
+    Retrieve the application settings.
+
+    The environment is read once per process; every later call returns the same instance.
     """
     return Settings()
 
 
-def get_jwt_auth_manager(settings: BaseAppSettings = Depends(get_settings)) -> JWTAuthManagerInterface:
+def get_container(request: Request) -> "Container":
+    """
+    Return the application container created by the lifespan hook of `main.py`.
+
+    Args:
+        request (Request): The incoming request, used to reach the application state.
+
+    Returns:
+        Container: The container shared by every request of this worker.
+
+    Raises:
+        RuntimeError: If the application was started without running its lifespan.
+    """
+    container = getattr(request.app.state, "container", None)
+    if container is None:
+        raise RuntimeError(
+            "The application container is not initialized; the app must be run with its lifespan "
+            "(e.g. with `async with lifespan(app)` around an ASGI test client)."
+        )
+    return container
+
+
+def get_jwt_auth_manager(
+    container: "Container" = Depends(get_container),
+    settings: BaseAppSettings = Depends(get_settings),
+) -> JWTAuthManagerInterface:
     """
-    Create and return a JWT authentication manager instance.
+    Return the JWT authentication manager shared by every request.
 
-    This function uses the provided application settings to instantiate a JWTAuthManager, which implements
-    the JWTAuthManagerInterface. The manager is configured with secret keys for access and refresh tokens
-    as well as the JWT signing algorithm specified in the settings.
+    The manager is created once with the application container and configured with the secret
+    keys and signing algorithm from the settings. When `get_settings` is overridden, a manager
+    for the overriding settings is built instead.
 
     Args:
-        settings (BaseAppSettings, optional): The application settings instance.
-        Defaults to the output of get_settings().
+        container (Container): The application container.
+        settings (BaseAppSettings): The application settings.
 
     Returns:
-        JWTAuthManagerInterface: An instance of JWTAuthManager configured with
-        the appropriate secret keys and algorithm.
+        JWTAuthManagerInterface: The application's JWTAuthManager instance.
     """
+    if settings is container.settings:
+        return container.jwt_manager
     return JWTAuthManager(
         secret_key_access=settings.SECRET_KEY_ACCESS,
         secret_key_refresh=settings.SECRET_KEY_REFRESH,
-        algorithm=settings.JWT_SIGNING_ALGORITHM
+        algorithm=settings.JWT_SIGNING_ALGORITHM,
     )
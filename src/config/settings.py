@@ -1,6 +1,9 @@
 import os
+import secrets
 from pathlib import Path
+from typing import List, Literal, Optional
 
+from pydantic import Field
 from pydantic_settings import BaseSettings
 
 
@@ -15,7 +18,73 @@ class BaseAppSettings(BaseSettings):
     PASSWORD_RESET_TEMPLATE_NAME: str = "password_reset_request.html"
     PASSWORD_RESET_COMPLETE_TEMPLATE_NAME: str = "password_reset_complete.html"
 
+    EMAIL_FROM: str = "no-reply@theater.local"
+    SMTP_HOST: str = "localhost"
+    SMTP_PORT: int = 1025
+    SMTP_USER: Optional[str] = None
+    SMTP_PASSWORD: Optional[str] = None
+    SMTP_USE_TLS: bool = False
+    SMTP_POOL_SIZE: int = 4
+    SMTP_TIMEOUT_SECONDS: float = 10.0
+
+    EMAIL_OUTBOX_BATCH_SIZE: int = 50
+    EMAIL_OUTBOX_POLL_INTERVAL_SECONDS: float = 2.0
+    EMAIL_OUTBOX_MAX_ATTEMPTS: int = 5
+    EMAIL_OUTBOX_BACKOFF_SECONDS: float = 30.0
+    EMAIL_OUTBOX_LEASE_SECONDS: float = 300.0
+
+    DEBUG: bool = False
+    WEB_CONCURRENCY: int = 1
+    MAX_QUERIES_PER_REQUEST: Optional[int] = None
+    SERVER_TIMING_ENABLED: bool = True
+    SLOW_QUERY_THRESHOLD_MS: Optional[float] = 200.0
+
+    DATABASE_BACKEND: Literal["postgresql", "sqlite"] = "postgresql"
+    SQLITE_BUSY_TIMEOUT_MS: int = 5000
+    SQLITE_CACHE_SIZE_KIB: int = 65536
+    SQLITE_MMAP_SIZE_BYTES: int = 268_435_456
+
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT_SECONDS: float = 30.0
+    DB_POOL_RECYCLE_SECONDS: int = 1800
+    DB_POOL_PRE_PING: bool = True
+    DB_POOL_PREWARM_CONNECTIONS: int = 5
+    DB_CONNECT_TIMEOUT_SECONDS: float = 10.0
+
+    DB_REPLICA_URLS: List[str] = []
+    DB_REPLICA_HEALTH_CHECK_INTERVAL_SECONDS: float = 5.0
+    DB_REPLICA_HEALTH_CHECK_TIMEOUT_SECONDS: float = 2.0
+    READ_YOUR_WRITES_SECONDS: int = 5
+
     LOGIN_TIME_DAYS: int = 7
+    MAX_REFRESH_TOKENS_PER_USER: int = 10
+
+    TOKEN_SWEEP_INTERVAL_SECONDS: int = 300
+    TOKEN_SWEEP_BATCH_SIZE: int = 1000
+    TOKEN_SWEEP_MAX_BATCHES: int = 100
+
+    AUTH_RATE_LIMIT_IP_BURST: int = 20
+    AUTH_RATE_LIMIT_IP_REFILL_PER_SECOND: float = 0.5
+    AUTH_RATE_LIMIT_EMAIL_BURST: int = 5
+    AUTH_RATE_LIMIT_EMAIL_REFILL_PER_SECOND: float = 0.1
+    AUTH_RATE_LIMIT_MAX_KEYS: int = 100_000
+
+    BCRYPT_ROUNDS: int = 14
+    PASSWORD_HASH_WORKERS: Optional[int] = None
+    PASSWORD_HASH_QUEUE_SIZE: int = 32
+    PASSWORD_HASH_TIMEOUT_SECONDS: float = 10.0
+
+    MOVIES_COUNT_MODE: Literal["exact", "cached", "approximate"] = "cached"
+    MOVIES_COUNT_CACHE_TTL_SECONDS: int = 300
+
+    MOVIE_DETAIL_CACHE_SIZE: int = 1024
+    MOVIE_DETAIL_CACHE_TTL_SECONDS: int = 60
+
+    MOVIES_BULK_CREATE_MAX_ITEMS: int = 1000
+
+    ACCESS_TOKEN_CACHE_SIZE: int = 10_000
+    ACCESS_TOKEN_CACHE_TTL_SECONDS: int = 3600
 
 
 class Settings(BaseAppSettings):
@@ -25,6 +94,6 @@ class Settings(BaseAppSettings):
     POSTGRES_DB_PORT: int = int(os.getenv("POSTGRES_DB_PORT", 5432))
     POSTGRES_DB: str = os.getenv("POSTGRES_DB", "test_db")
 
-    SECRET_KEY_ACCESS: str = os.getenv("SECRET_KEY_ACCESS", os.urandom(32))
-    SECRET_KEY_REFRESH: str = os.getenv("SECRET_KEY_REFRESH", os.urandom(32))
+    SECRET_KEY_ACCESS: str = Field(default_factory=lambda: secrets.token_urlsafe(32))
+    SECRET_KEY_REFRESH: str = Field(default_factory=lambda: secrets.token_urlsafe(32))
     JWT_SIGNING_ALGORITHM: str = os.getenv("JWT_SIGNING_ALGORITHM", "HS256")
@@ -0,0 +1,6 @@
+from counters.base import CachedCounter
+from counters.movies import (
+    MoviesCountModeEnum,
+    movies_counter,
+    get_movies_total,
+)
@@ -0,0 +1,53 @@
+import time
+from typing import Optional
+
+
+class CachedCounter:
+    """
+    An in-process cached counter with a time-to-live.
+
+    The value is loaded lazily by the caller and kept until it expires or is invalidated.
+    Writers can adjust a cached value in place, so the count stays exact for writes made
+    through this process while the TTL bounds drift caused by other processes.
+    """
+
+    def __init__(self, ttl_seconds: float) -> None:
+        self._ttl_seconds = ttl_seconds
+        self._value: Optional[int] = None
+        self._expires_at = 0.0
+
+    def get(self) -> Optional[int]:
+        """
+        Return the cached value, or None if it is missing or expired.
+        """
+        if self._value is None or time.monotonic() >= self._expires_at:
+            return None
+        return self._value
+
+    def set(self, value: int) -> None:
+        """
+        Store a freshly loaded value and restart its TTL.
+        """
+        self._value = value
+        self._expires_at = time.monotonic() + self._ttl_seconds
+
+    def increment(self, amount: int = 1) -> None:
+        """
+        Adjust the cached value after rows were added. Does nothing if nothing is cached.
+        """
+        if self._value is not None:
+            self._value += amount
+
+    def decrement(self, amount: int = 1) -> None:
+        """
+        Adjust the cached value after rows were removed. Does nothing if nothing is cached.
+        """
+        if self._value is not None:
+            self._value = max(self._value - amount, 0)
+
+    def invalidate(self) -> None:
+        """
+        Drop the cached value so the next read reloads it.
+        """
+        self._value = None
+        self._expires_at = 0.0
@@ -0,0 +1,43 @@
+import enum
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from config import get_settings
+from counters.base import CachedCounter
+from crud import get_movies_count, get_movies_count_estimate
+
+
+class MoviesCountModeEnum(str, enum.Enum):
+    EXACT = "exact"
+    CACHED = "cached"
+    APPROXIMATE = "approximate"
+
+
+movies_counter = CachedCounter(ttl_seconds=get_settings().MOVIES_COUNT_CACHE_TTL_SECONDS)
+
+
+async def get_movies_total(db: AsyncSession, mode: MoviesCountModeEnum) -> int:
+    """
+    Return the total number of movies according to the configured counting mode.
+
+    - exact: run `count(id)` on every call.
+    - cached: run `count(id)` once, then serve the in-process cached value until it expires.
+      Writes made by other processes, such as the seeder, show up only once the TTL expires.
+    - approximate: like cached, but load the planner estimate from `pg_class.reltuples`,
+      falling back to an exact count when the table has never been analyzed.
+    """
+    if mode == MoviesCountModeEnum.EXACT:
+        return await get_movies_count(db)
+
+    total = movies_counter.get()
+    if total is not None:
+        return total
+
+    total = None
+    if mode == MoviesCountModeEnum.APPROXIMATE:
+        total = await get_movies_count_estimate(db)
+    if total is None:
+        total = await get_movies_count(db)
+
+    movies_counter.set(total)
+    return total
@@ -1,18 +1,42 @@
 from .accounts import (
     get_user_by_email,
+    get_active_user_group,
     get_user_group_by_name,
+    get_user_group_id,
+    is_duplicate_email_error,
+    create_user_with_activation_token,
     create_new_user,
     get_activation_token,
     create_refresh_token,
     get_refresh_token,
     get_user_by_id,
     create_activation_token,
+    prune_refresh_tokens,
+    delete_expired_tokens,
 )
 from .movies import (
     get_movies_count,
+    get_movies_count_estimate,
+    movie_list_columns,
+    apply_movie_filters,
+    build_paginated_movies_list_stmt,
+    build_movies_list_by_cursor_stmt,
+    build_movies_search_stmt,
     get_paginated_movies_list,
+    get_movies_list_by_cursor,
+    search_movies,
     get_movie_by_name_and_date,
+    resolve_reference_ids,
     create_movie_in_db,
+    bulk_create_movies_in_db,
     get_movie_by_id_from_db,
+    get_movie_version,
     update_movie_in_db,
+    delete_movie_in_db,
+)
+from .notifications import (
+    enqueue_email,
+    claim_outbox_batch,
+    mark_emails_sent,
+    mark_email_failed,
 )
@@ -1,13 +1,29 @@
-from datetime import datetime, timezone
-from typing import cast
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Optional, Tuple, Type, cast
 
-from sqlalchemy import select
-from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy import select, insert, delete, literal, DateTime, any_, func
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import joinedload
 
-from database import UserModel, UserGroupModel, ActivationTokenModel, RefreshTokenModel
+from database import (
+    UserModel,
+    UserGroupModel,
+    UserGroupEnum,
+    ActivationTokenModel,
+    RefreshTokenModel,
+    accounts_validators,
+)
+from database.dialects import is_postgresql, is_unique_violation
+from database.models.accounts import TokenBaseModel
 from schemas import UserRegistrationRequestSchema, UserActivationRequestSchema
+from security.password_service import password_service
+from security.utils import generate_secure_token
+from crud.notifications import enqueue_email
+
+ACTIVATION_TOKEN_TTL = timedelta(days=1)
+
+_user_group_ids: Dict[str, int] = {}
 
 
 async def get_user_by_email(db: AsyncSession, email: str) -> UserModel:
@@ -22,12 +38,110 @@ async def get_user_by_id(db: AsyncSession, user_id: int) -> UserModel:
     return result.scalars().first()
 
 
+async def get_active_user_group(db: AsyncSession, user_id: int) -> Optional[UserGroupEnum]:
+    """
+    Return the group of an active user, or None for an unknown or inactive user.
+    """
+    stmt = (
+        select(UserGroupModel.name)
+        .join(UserModel.group)
+        .where(UserModel.id == user_id, UserModel.is_active.is_(True))
+    )
+    return await db.scalar(stmt)
+
+
 async def get_user_group_by_name(db: AsyncSession, name: str) -> UserGroupModel:
     stmt = select(UserGroupModel).where(UserGroupModel.name == name)
     result = await db.execute(stmt)
     return result.scalars().first()
 
 
+async def get_user_group_id(db: AsyncSession, name: str) -> Optional[int]:
+    """
+    Return the id of a user group, cached in process after the first lookup.
+
+    Groups are seeded once and never renamed or deleted, so the cache needs no invalidation.
+    """
+    group_id = _user_group_ids.get(name)
+    if group_id is None:
+        result = await db.execute(select(UserGroupModel.id).where(UserGroupModel.name == name))
+        group_id = result.scalar_one_or_none()
+        if group_id is not None:
+            _user_group_ids[name] = group_id
+    return group_id
+
+
+def is_duplicate_email_error(error: IntegrityError) -> bool:
+    """
+    Tell whether `error` was raised by the unique index on `users.email`.
+    """
+    return is_unique_violation(error, "ix_users_email", UserModel.__tablename__, ["email"])
+
+
+async def create_user_with_activation_token(
+    db: AsyncSession,
+    user_data: UserRegistrationRequestSchema,
+    user_group_id: int,
+    activation_email_template: Optional[str] = None,
+) -> Tuple[int, str, str]:
+    """
+    Insert a user and their activation token in one statement and one transaction.
+
+    The password is hashed on the password process pool first. The user row is inserted by
+    a data-modifying CTE whose `RETURNING id` feeds the activation token insert, so the
+    whole registration costs one statement and one commit. Databases without data-modifying
+    CTEs, such as SQLite, run the two inserts as separate statements of the same transaction.
+    A duplicate email surfaces as an `IntegrityError` from the unique index on `users.email`
+    instead of a separate lookup; see `is_duplicate_email_error`.
+    With `activation_email_template`, the activation email is queued in the same transaction.
+
+    :return: The new user id, the normalized email and the activation token.
+    """
+    email = accounts_validators.validate_email(str(user_data.email).lower())
+    hashed_password = await password_service.hash(user_data.password)
+    users = UserModel.__table__
+    activation_tokens = ActivationTokenModel.__table__
+    token = generate_secure_token()
+    expires_at = datetime.now(timezone.utc) + ACTIVATION_TOKEN_TTL
+
+    insert_user = (
+        insert(users)
+        .values(email=email, hashed_password=hashed_password, group_id=user_group_id)
+        .returning(users.c.id)
+    )
+
+    try:
+        if is_postgresql(db):
+            new_user = insert_user.cte("new_user")
+            stmt = (
+                insert(activation_tokens)
+                .from_select(
+                    ["token", "expires_at", "user_id"],
+                    select(literal(token), literal(expires_at, DateTime(timezone=True)), new_user.c.id),
+                )
+                .add_cte(new_user)
+                .returning(activation_tokens.c.user_id, activation_tokens.c.token)
+            )
+            result = await db.execute(stmt)
+            user_id, activation_token = result.one()
+        else:
+            user_id = (await db.execute(insert_user)).scalar_one()
+            await db.execute(insert(activation_tokens).values(token=token, expires_at=expires_at, user_id=user_id))
+            activation_token = token
+        if activation_email_template is not None:
+            enqueue_email(
+                db,
+                recipient=email,
+                template_name=activation_email_template,
+                context={"email": email, "activation_token": activation_token},
+            )
+        await db.commit()
+    except SQLAlchemyError as e:
+        await db.rollback()
+        raise e
+    return user_id, email, activation_token
+
+
 async def create_activation_token(db: AsyncSession, user_id: int) -> ActivationTokenModel:
     try:
         activation_token = ActivationTokenModel(user_id=user_id)
@@ -46,11 +160,8 @@ async def create_new_user(
     user_group_id: int
 ) -> UserModel:
     try:
-        new_user = UserModel.create(
-            email=str(user_data.email),
-            raw_password=user_data.password,
-            group_id=user_group_id,
-        )
+        new_user = UserModel(email=str(user_data.email), group_id=user_group_id)
+        await new_user.set_password_async(user_data.password)
         db.add(new_user)
         await db.flush()
         await db.commit()
@@ -89,7 +200,14 @@ async def create_refresh_token(
     user_id: int,
     days_valid: int,
     jwt_refresh_token: str,
+    max_active_tokens: Optional[int] = None,
 ) -> RefreshTokenModel:
+    """
+    Store a new refresh token for a user.
+
+    With `max_active_tokens`, the user's expired tokens and every active token beyond the
+    newest `max_active_tokens` are deleted in the same transaction.
+    """
     try:
         refresh_token = RefreshTokenModel.create(
             user_id=user_id,
@@ -98,6 +216,8 @@ async def create_refresh_token(
         )
         db.add(refresh_token)
         await db.flush()
+        if max_active_tokens is not None:
+            await prune_refresh_tokens(db, user_id, max_active_tokens)
         await db.commit()
     except SQLAlchemyError as e:
         await db.rollback()
@@ -109,3 +229,61 @@ async def get_refresh_token(db: AsyncSession, token: str) -> RefreshTokenModel:
     stmt = select(RefreshTokenModel).filter_by(token=token)
     result = await db.execute(stmt)
     return result.scalars().first()
+
+
+async def prune_refresh_tokens(db: AsyncSession, user_id: int, keep: int) -> int:
+    """
+    Delete a user's expired refresh tokens and all but the `keep` newest active ones.
+
+    Both lookups use the `(user_id, expires_at)` index. The caller commits.
+
+    :return: The number of deleted tokens.
+    """
+    newest_ids = (
+        select(RefreshTokenModel.id)
+        .where(
+            RefreshTokenModel.user_id == user_id,
+            RefreshTokenModel.expires_at >= datetime.now(timezone.utc),
+        )
+        .order_by(RefreshTokenModel.expires_at.desc(), RefreshTokenModel.id.desc())
+        .limit(keep)
+    )
+    stmt = (
+        delete(RefreshTokenModel)
+        .where(RefreshTokenModel.user_id == user_id, RefreshTokenModel.id.not_in(newest_ids))
+        .execution_options(synchronize_session=False)
+    )
+    result = await db.execute(stmt)
+    return result.rowcount
+
+
+async def delete_expired_tokens(db: AsyncSession, model: Type[TokenBaseModel], batch_size: int) -> int:
+    """
+    Delete at most `batch_size` expired rows of a token table and commit.
+
+    Candidate rows are found through the `expires_at` index and locked with `SKIP LOCKED`,
+    so sweepers of several workers never wait on each other. Their ids are collected into an
+    array and deleted with `id = ANY(...)`, which probes the primary key; an `IN (subquery)`
+    is planned as a hash join over a full scan of the table once many rows are expired.
+    SQLite has neither row locks nor arrays and takes the plain `IN (subquery)` form.
+
+    :return: The number of deleted rows.
+    """
+    expired_ids = (
+        select(model.id)
+        .where(model.expires_at < datetime.now(timezone.utc))
+        .limit(batch_size)
+        .with_for_update(skip_locked=True)
+    )
+    if is_postgresql(db):
+        expired = model.id == any_(func.array(expired_ids.scalar_subquery()))
+    else:
+        expired = model.id.in_(expired_ids)
+    stmt = delete(model).where(expired).execution_options(synchronize_session=False)
+    try:
+        result = await db.execute(stmt)
+        await db.commit()
+    except SQLAlchemyError as e:
+        await db.rollback()
+        raise e
+    return result.rowcount
@@ -1,33 +1,295 @@
 from datetime import date
-from typing import Iterable
-
-from sqlalchemy import select, func
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from sqlalchemy import (
+    select,
+    func,
+    text,
+    insert,
+    update,
+    delete,
+    exists,
+    tuple_,
+    literal,
+    literal_column,
+    and_,
+    or_,
+    Float,
+    Select,
+    RowMapping,
+)
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import joinedload
-
-from database import MovieModel, CountryModel, GenreModel, ActorModel, LanguageModel
-from schemas import MovieCreateSchema, MovieUpdateSchema
-
-
-async def get_movies_count(db: AsyncSession) -> int:
-    count_stmt = select(func.count(MovieModel.id))
+from sqlalchemy.orm import joinedload, selectinload, InstrumentedAttribute
+
+from database import (
+    MovieModel,
+    CountryModel,
+    GenreModel,
+    ActorModel,
+    LanguageModel,
+    MoviesGenresModel,
+    ActorsMoviesModel,
+    MoviesLanguagesModel,
+)
+from database.dialects import insert_with_on_conflict, is_postgresql
+from schemas import (
+    MovieCreateSchema,
+    MovieUpdateSchema,
+    MovieListFilterSchema,
+    MovieSortFieldEnum,
+    SortOrderEnum,
+)
+
+REFERENCE_CHUNK_SIZE = 5000
+MOVIE_INSERT_CHUNK_SIZE = 1000
+
+
+async def get_movies_count(db: AsyncSession, filters: Optional[MovieListFilterSchema] = None) -> int:
+    count_stmt = apply_movie_filters(select(func.count(MovieModel.id)), filters)
     result_count = await db.execute(count_stmt)
     return result_count.scalar() or 0
 
 
-async def get_paginated_movies_list(
-    db: AsyncSession, offset: int, page_size: int
-) -> Iterable[MovieModel]:
-    order_by = MovieModel.default_order_by()
-    stmt = select(MovieModel)
-    if order_by:
-        stmt = stmt.order_by(*order_by)
+async def get_movies_count_estimate(db: AsyncSession) -> Optional[int]:
+    """
+    Return the planner's row estimate for the movies table from `pg_class.reltuples`.
+
+    Returns None when the table has not been vacuumed or analyzed yet, or on databases other
+    than PostgreSQL, which keep no such estimate.
+    """
+    if not is_postgresql(db):
+        return None
+    estimate_stmt = text(
+        "SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass(:table_name)"
+    ).bindparams(table_name=MovieModel.__tablename__)
+    result_estimate = await db.execute(estimate_stmt)
+    estimate = result_estimate.scalar()
+    if estimate is None or estimate < 0:
+        return None
+    return int(estimate)
+
+
+def movie_list_columns() -> tuple:
+    """
+    Return the columns rendered by the movie list, in `MovieListItemSchema` order.
+    """
+    return (
+        MovieModel.id,
+        MovieModel.name,
+        MovieModel.date,
+        MovieModel.score,
+        MovieModel.overview,
+    )
+
 
-    stmt = stmt.offset(offset).limit(page_size)
+_SORT_COLUMNS = {
+    MovieSortFieldEnum.ID: MovieModel.id,
+    MovieSortFieldEnum.SCORE: MovieModel.score,
+    MovieSortFieldEnum.DATE: MovieModel.date,
+    MovieSortFieldEnum.REVENUE: MovieModel.revenue,
+}
+
+
+def apply_movie_filters(stmt: Select, filters: Optional[MovieListFilterSchema]) -> Select:
+    """
+    Restrict a movie statement to the given filters so that every predicate is index-backed.
+
+    Relation filters are resolved from names to ids with scalar subqueries on the unique name
+    columns. The most selective relation filter drives the query as a join through its reverse
+    `(entity_id, movie_id)` index; the remaining ones become `EXISTS` probes on the association
+    primary keys, which lead with `movie_id`. Selectivity follows the catalog shape: an actor
+    appears in few movies, a language in more and a genre in the most.
+    """
+    if filters is None:
+        return stmt
+
+    relation_filters = [
+        (filters.actor, ActorsMoviesModel, ActorsMoviesModel.c.actor_id, ActorModel),
+        (filters.language, MoviesLanguagesModel, MoviesLanguagesModel.c.language_id, LanguageModel),
+        (filters.genre, MoviesGenresModel, MoviesGenresModel.c.genre_id, GenreModel),
+    ]
+    relation_filters = [relation_filter for relation_filter in relation_filters if relation_filter[0] is not None]
+
+    for position, (name, association, entity_id_column, entity_model) in enumerate(relation_filters):
+        entity_id = select(entity_model.id).where(entity_model.name == name).scalar_subquery()
+        if position == 0:
+            stmt = stmt.join(association, association.c.movie_id == MovieModel.id).where(entity_id_column == entity_id)
+        else:
+            stmt = stmt.where(
+                exists().where(association.c.movie_id == MovieModel.id, entity_id_column == entity_id)
+            )
+
+    if filters.name_prefix is not None:
+        stmt = stmt.where(
+            func.lower(MovieModel.name).like(_escape_like(filters.name_prefix.lower()) + "%", escape="\\")
+        )
+    if filters.country is not None:
+        country_id = select(CountryModel.id).where(CountryModel.code == filters.country).scalar_subquery()
+        stmt = stmt.where(MovieModel.country_id == country_id)
+    if filters.year_from is not None:
+        stmt = stmt.where(MovieModel.date >= date(filters.year_from, 1, 1))
+    if filters.year_to is not None:
+        stmt = stmt.where(MovieModel.date <= date(filters.year_to, 12, 31))
+    if filters.score_min is not None:
+        stmt = stmt.where(MovieModel.score >= filters.score_min)
+    if filters.score_max is not None:
+        stmt = stmt.where(MovieModel.score <= filters.score_max)
+    return stmt
+
+
+def _escape_like(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def _movie_sort_key_columns(sort_by: MovieSortFieldEnum) -> list:
+    if sort_by == MovieSortFieldEnum.ID:
+        return [MovieModel.id]
+    return [_SORT_COLUMNS[sort_by], MovieModel.id]
+
+
+def _select_movie_list(sort_by: MovieSortFieldEnum) -> Select:
+    columns = [*movie_list_columns(), MovieModel.version]
+    if sort_by != MovieSortFieldEnum.ID:
+        columns.append(_SORT_COLUMNS[sort_by].label("sort_key"))
+    return select(*columns)
+
+
+def build_paginated_movies_list_stmt(
+    offset: int,
+    page_size: int,
+    filters: Optional[MovieListFilterSchema] = None,
+    sort_by: MovieSortFieldEnum = MovieSortFieldEnum.ID,
+    order: SortOrderEnum = SortOrderEnum.DESC,
+) -> Select:
+    stmt = apply_movie_filters(_select_movie_list(sort_by), filters)
+    key_columns = _movie_sort_key_columns(sort_by)
+    if order == SortOrderEnum.DESC:
+        stmt = stmt.order_by(*(column.desc() for column in key_columns))
+    else:
+        stmt = stmt.order_by(*(column.asc() for column in key_columns))
+
+    return stmt.offset(offset).limit(page_size)
+
+
+def build_movies_list_by_cursor_stmt(
+    after: Optional[Sequence[Any]],
+    page_size: int,
+    backward: bool = False,
+    filters: Optional[MovieListFilterSchema] = None,
+    sort_by: MovieSortFieldEnum = MovieSortFieldEnum.ID,
+    order: SortOrderEnum = SortOrderEnum.DESC,
+) -> Select:
+    """
+    Build a keyset page query seeking on `(sort column, id)`, or on `id` alone.
+
+    The row comparison is answered by the composite `(sort column, id)` index, so a page
+    costs the same at any depth.
+    """
+    stmt = apply_movie_filters(_select_movie_list(sort_by), filters)
+    key_columns = _movie_sort_key_columns(sort_by)
+    key = tuple_(*key_columns) if len(key_columns) > 1 else key_columns[0]
+    descending = (order == SortOrderEnum.DESC) != backward
+
+    if after is not None:
+        boundary = tuple_(*after) if len(key_columns) > 1 else after[0]
+        stmt = stmt.where(key < boundary if descending else key > boundary)
+
+    if descending:
+        stmt = stmt.order_by(*(column.desc() for column in key_columns))
+    else:
+        stmt = stmt.order_by(*(column.asc() for column in key_columns))
+
+    return stmt.limit(page_size + 1)
+
+
+def build_movies_search_stmt(
+    search_query: str, after: Optional[Tuple[float, int]], page_size: int, full_text: bool = True
+) -> Select:
+    """
+    Build a search page query ordered by relevance, then id.
+
+    Without `full_text`, for databases other than PostgreSQL, every word of the query must
+    appear in the name or the overview, and all matches rank equally, so pages follow the id.
+    """
+    if full_text:
+        ts_query = func.websearch_to_tsquery(literal_column("'english'::regconfig"), search_query)
+        rank = func.ts_rank_cd(MovieModel.search_vector, ts_query, type_=Float)
+        match = MovieModel.search_vector.op("@@")(ts_query)
+    else:
+        rank = literal(0.0, Float)
+        match = and_(*(
+            or_(
+                func.lower(MovieModel.name).like(f"%{_escape_like(word)}%", escape="\\"),
+                func.lower(MovieModel.overview).like(f"%{_escape_like(word)}%", escape="\\"),
+            )
+            for word in search_query.lower().split()
+        ))
+    stmt = select(*movie_list_columns(), MovieModel.version, rank.label("rank")).where(match)
+    if after is not None:
+        stmt = stmt.where(tuple_(rank, MovieModel.id) < tuple_(*after))
+
+    return stmt.order_by(rank.desc(), MovieModel.id.desc()).limit(page_size + 1)
 
+
+async def get_paginated_movies_list(
+    db: AsyncSession,
+    offset: int,
+    page_size: int,
+    filters: Optional[MovieListFilterSchema] = None,
+    sort_by: MovieSortFieldEnum = MovieSortFieldEnum.ID,
+    order: SortOrderEnum = SortOrderEnum.DESC,
+) -> List[RowMapping]:
+    """
+    Fetch a page of movie list rows using offset pagination.
+
+    Only the list columns, the row version and the sort key are selected and rows are returned
+    as plain mappings, bypassing ORM entity construction and the identity map.
+    """
+    stmt = build_paginated_movies_list_stmt(offset, page_size, filters, sort_by, order)
     result_movies = await db.execute(stmt)
-    return result_movies.scalars().all()
+    return list(result_movies.mappings().all())
+
+
+async def get_movies_list_by_cursor(
+    db: AsyncSession,
+    after: Optional[Sequence[Any]],
+    page_size: int,
+    backward: bool = False,
+    filters: Optional[MovieListFilterSchema] = None,
+    sort_by: MovieSortFieldEnum = MovieSortFieldEnum.ID,
+    order: SortOrderEnum = SortOrderEnum.DESC,
+) -> List[RowMapping]:
+    """
+    Fetch a page of movie list rows using keyset pagination.
+
+    Movies are ordered by the sort field with the id as a tie-breaker. `after` is the key
+    of the boundary row: when `backward` is False the page starts right after it, otherwise
+    it ends right before it. One extra row is fetched so the caller can tell whether another
+    page exists in the requested direction.
+    """
+    stmt = build_movies_list_by_cursor_stmt(after, page_size, backward, filters, sort_by, order)
+    result_movies = await db.execute(stmt)
+    movies = list(result_movies.mappings().all())
+    if backward:
+        movies.reverse()
+    return movies
+
+
+async def search_movies(
+    db: AsyncSession, search_query: str, after: Optional[Tuple[float, int]], page_size: int
+) -> List[RowMapping]:
+    """
+    Full-text search over movie names and overviews, ordered by relevance.
+
+    Matches use the GIN-indexed `search_vector` generated column, where names weigh more than
+    overviews; other databases fall back to unranked substring matching. Pages are seeked with a
+    keyset on `(rank, id)`; `after` is the key of the last row of the previous page. One extra row
+    is fetched to tell whether another page exists.
+    """
+    stmt = build_movies_search_stmt(search_query, after, page_size, full_text=is_postgresql(db))
+    result_movies = await db.execute(stmt)
+    return list(result_movies.mappings().all())
 
 
 async def get_movie_by_name_and_date(db: AsyncSession, name: str, release_date: date) -> MovieModel:
@@ -39,115 +301,246 @@ async def get_movie_by_name_and_date(db: AsyncSession, name: str, release_date:
     return existing_result.scalars().first()
 
 
-async def get_or_create_country(db: AsyncSession, country_code: str) -> CountryModel:
-    country_stmt = select(CountryModel).where(CountryModel.code == country_code)
-    country_result = await db.execute(country_stmt)
-    country = country_result.scalars().first()
-    if not country:
-        country = CountryModel(code=country_code)
-        db.add(country)
-        await db.flush()
-    return country
+async def resolve_reference_ids(
+    db: AsyncSession, column: InstrumentedAttribute, values: Iterable[str]
+) -> Dict[str, int]:
+    """
+    Map unique reference values (genre names, country codes, ...) to ids, creating missing rows.
+
+    Runs one `INSERT ... ON CONFLICT DO NOTHING` and one `SELECT` per `REFERENCE_CHUNK_SIZE`
+    values, so the cost does not depend on the number of values for a single movie. A row
+    inserted by a concurrent transaction is skipped by the insert and picked up by the select.
+    Values are inserted in sorted order so concurrent batches take their row locks in the
+    same order.
+    """
+    values = sorted(set(values))
+    model = column.class_
+    reference_ids = {}
+
+    for i in range(0, len(values), REFERENCE_CHUNK_SIZE):
+        chunk = values[i: i + REFERENCE_CHUNK_SIZE]
+        insert_stmt = (
+            insert_with_on_conflict(db, model)
+            .values([{column.key: value} for value in chunk])
+            .on_conflict_do_nothing(index_elements=[column.key])
+        )
+        await db.execute(insert_stmt)
 
+        result = await db.execute(select(column, model.id).where(column.in_(chunk)))
+        reference_ids.update(result.all())
+    return reference_ids
 
-async def get_or_create_genre(db: AsyncSession, genre_name: str) -> GenreModel:
-    genre_stmt = select(GenreModel).where(GenreModel.name == genre_name)
-    genre_result = await db.execute(genre_stmt)
-    genre = genre_result.scalars().first()
-
-    if not genre:
-        genre = GenreModel(name=genre_name)
-        db.add(genre)
-        await db.flush()
-    return genre
 
+async def create_movie_in_db(db: AsyncSession, movie_data: MovieCreateSchema) -> MovieModel:
+    """
+    Create a movie with its country, genres, actors and languages.
 
-async def get_or_create_actor(db: AsyncSession, actor_name: str) -> ActorModel:
-    actor_stmt = select(ActorModel).where(ActorModel.name == actor_name)
-    actor_result = await db.execute(actor_stmt)
-    actor = actor_result.scalars().first()
+    Reference entities are resolved per type with `resolve_reference_ids`, and association rows
+    are inserted with one statement per table, so a create costs a constant number of statements
+    whatever the size of the cast.
+    """
+    try:
+        country_ids, genre_ids, actor_ids, language_ids = await _resolve_movie_references(db, [movie_data])
 
-    if not actor:
-        actor = ActorModel(name=actor_name)
-        db.add(actor)
+        movie = MovieModel(**_movie_row(movie_data, country_ids))
+        db.add(movie)
         await db.flush()
-    return actor
 
+        await _insert_movie_associations(db, [(movie.id, movie_data)], genre_ids, actor_ids, language_ids)
+        await db.commit()
+    except IntegrityError as e:
+        await db.rollback()
+        raise e
 
-async def get_or_create_language(db: AsyncSession, language_name: str) -> LanguageModel:
-    lang_stmt = select(LanguageModel).where(LanguageModel.name == language_name)
-    lang_result = await db.execute(lang_stmt)
-    language = lang_result.scalars().first()
+    return await get_movie_by_id_from_db(db, movie.id, joined=True, populate_existing=True)
 
-    if not language:
-        language = LanguageModel(name=language_name)
-        db.add(language)
-        await db.flush()
-    return language
 
+async def bulk_create_movies_in_db(db: AsyncSession, movies_data: Sequence[MovieCreateSchema]) -> List[Optional[int]]:
+    """
+    Create many movies in one transaction.
+
+    Reference entities of the whole batch are resolved in one pass. Movies are inserted with
+    multi-row `INSERT ... ON CONFLICT (name, date) DO NOTHING RETURNING` statements, answered by
+    `unique_movie_constraint`, and association rows with one batched statement per table.
+
+    :return: The id of each created movie, in input order, or None for an item that conflicts
+        with an existing movie or with an earlier item of the batch.
+    """
+    first_index_by_key: Dict[Tuple[str, date], int] = {}
+    for index, movie_data in enumerate(movies_data):
+        first_index_by_key.setdefault((movie_data.name, movie_data.date), index)
+    unique_movies = [movies_data[index] for index in first_index_by_key.values()]
 
-async def create_movie_in_db(db: AsyncSession, movie_data: MovieCreateSchema) -> MovieModel:
     try:
-        country = await get_or_create_country(db, movie_data.country)
-        genres = []
-        for genre_name in movie_data.genres:
-            genre = await get_or_create_genre(db, genre_name)
-            genres.append(genre)
-
-        actors = []
-        for actor_name in movie_data.actors:
-            actor = await get_or_create_actor(db, actor_name)
-            actors.append(actor)
-
-        languages = []
-        for language_name in movie_data.languages:
-            language = await get_or_create_language(db, language_name)
-            languages.append(language)
-
-        movie = MovieModel(
-            name=movie_data.name,
-            date=movie_data.date,
-            score=movie_data.score,
-            overview=movie_data.overview,
-            status=movie_data.status,
-            budget=movie_data.budget,
-            revenue=movie_data.revenue,
-            country=country,
-            genres=genres,
-            actors=actors,
-            languages=languages,
-        )
-        db.add(movie)
+        country_ids, genre_ids, actor_ids, language_ids = await _resolve_movie_references(db, unique_movies)
+
+        movie_ids: Dict[Tuple[str, date], int] = {}
+        for i in range(0, len(unique_movies), MOVIE_INSERT_CHUNK_SIZE):
+            chunk = unique_movies[i: i + MOVIE_INSERT_CHUNK_SIZE]
+            insert_stmt = (
+                insert_with_on_conflict(db, MovieModel)
+                .values([_movie_row(movie_data, country_ids) for movie_data in chunk])
+                .on_conflict_do_nothing(index_elements=["name", "date"])
+                .returning(MovieModel.id, MovieModel.name, MovieModel.date)
+            )
+            result = await db.execute(insert_stmt)
+            movie_ids.update(((name, release_date), movie_id) for movie_id, name, release_date in result.all())
+
+        created = [
+            (movie_ids[(movie_data.name, movie_data.date)], movie_data)
+            for movie_data in unique_movies
+            if (movie_data.name, movie_data.date) in movie_ids
+        ]
+        await _insert_movie_associations(db, created, genre_ids, actor_ids, language_ids)
         await db.commit()
-        await db.refresh(movie, ["genres", "actors", "languages"])
-
-        return movie
     except IntegrityError as e:
         await db.rollback()
         raise e
 
+    return [
+        movie_ids.get(key) if first_index_by_key[key] == index else None
+        for index, key in enumerate((movie_data.name, movie_data.date) for movie_data in movies_data)
+    ]
+
 
-async def get_movie_by_id_from_db(db: AsyncSession, movie_id: int, joined: bool = False) -> MovieModel:
+async def _resolve_movie_references(
+    db: AsyncSession, movies_data: Sequence[MovieCreateSchema]
+) -> Tuple[Dict[str, int], Dict[str, int], Dict[str, int], Dict[str, int]]:
+    country_ids = await resolve_reference_ids(db, CountryModel.code, (m.country for m in movies_data))
+    genre_ids = await resolve_reference_ids(db, GenreModel.name, (name for m in movies_data for name in m.genres))
+    actor_ids = await resolve_reference_ids(db, ActorModel.name, (name for m in movies_data for name in m.actors))
+    language_ids = await resolve_reference_ids(
+        db, LanguageModel.name, (name for m in movies_data for name in m.languages)
+    )
+    return country_ids, genre_ids, actor_ids, language_ids
+
+
+def _movie_row(movie_data: MovieCreateSchema, country_ids: Dict[str, int]) -> dict:
+    return {
+        "name": movie_data.name,
+        "date": movie_data.date,
+        "score": movie_data.score,
+        "overview": movie_data.overview,
+        "status": movie_data.status,
+        "budget": movie_data.budget,
+        "revenue": movie_data.revenue,
+        "country_id": country_ids[movie_data.country],
+    }
+
+
+async def _insert_movie_associations(
+    db: AsyncSession,
+    movies: Sequence[Tuple[int, MovieCreateSchema]],
+    genre_ids: Dict[str, int],
+    actor_ids: Dict[str, int],
+    language_ids: Dict[str, int],
+) -> None:
+    """
+    Link created movies to their genres, actors and languages with one batched insert per table.
+    """
+    associations = [
+        (MoviesGenresModel, "genre_id", genre_ids, lambda movie_data: movie_data.genres),
+        (ActorsMoviesModel, "actor_id", actor_ids, lambda movie_data: movie_data.actors),
+        (MoviesLanguagesModel, "language_id", language_ids, lambda movie_data: movie_data.languages),
+    ]
+    for association, entity_id_key, entity_ids, get_names in associations:
+        rows = [
+            {"movie_id": movie_id, entity_id_key: entity_ids[name]}
+            for movie_id, movie_data in movies
+            for name in dict.fromkeys(get_names(movie_data))
+        ]
+        if rows:
+            await db.execute(insert(association), rows)
+
+
+async def get_movie_by_id_from_db(
+    db: AsyncSession, movie_id: int, joined: bool = False, populate_existing: bool = False
+) -> MovieModel:
+    """
+    Fetch a movie by id.
+
+    With `joined=True` the country is joined into the movie query and every collection is
+    loaded with one `selectinload` query, so a detail read always costs four statements.
+    `populate_existing=True` refreshes a movie already held by the session, e.g. after its
+    associations were written with Core statements.
+    """
     stmt = select(MovieModel).where(MovieModel.id == movie_id)
     if joined:
-        stmt.options(
+        stmt = stmt.options(
             joinedload(MovieModel.country),
-            joinedload(MovieModel.genres),
-            joinedload(MovieModel.actors),
-            joinedload(MovieModel.languages),
+            selectinload(MovieModel.genres),
+            selectinload(MovieModel.actors),
+            selectinload(MovieModel.languages),
         )
+    if populate_existing:
+        stmt = stmt.execution_options(populate_existing=True)
 
     result = await db.execute(stmt)
     return result.scalars().first()
 
 
-async def update_movie_in_db(db: AsyncSession, movie: MovieModel, movie_data: MovieUpdateSchema):
-    for field, value in movie_data.model_dump(exclude_unset=True).items():
-        setattr(movie, field, value)
+async def get_movie_version(db: AsyncSession, movie_id: int) -> Optional[int]:
+    stmt = select(MovieModel.version).where(MovieModel.id == movie_id)
+    result = await db.execute(stmt)
+    return result.scalar_one_or_none()
+
+
+async def update_movie_in_db(
+    db: AsyncSession,
+    movie_id: int,
+    movie_data: MovieUpdateSchema,
+    expected_versions: Optional[List[int]] = None,
+) -> Optional[int]:
+    """
+    Update a movie with a single conditional `UPDATE ... RETURNING` statement.
+
+    The version is bumped on every update. When `expected_versions` is given, the row is only
+    updated if its current version is one of them (optimistic concurrency).
+
+    :return: The new version, or None if no row matched the id and expected versions.
+    """
+    stmt = (
+        update(MovieModel)
+        .where(MovieModel.id == movie_id)
+        .values(**movie_data.model_dump(exclude_unset=True), version=MovieModel.version + 1)
+        .returning(MovieModel.version)
+        .execution_options(synchronize_session=False)
+    )
+    if expected_versions is not None:
+        stmt = stmt.where(MovieModel.version.in_(expected_versions))
 
     try:
+        result = await db.execute(stmt)
+        new_version = result.scalar_one_or_none()
         await db.commit()
-        await db.refresh(movie)
     except IntegrityError as e:
         await db.rollback()
         raise e
+    return new_version
+
+
+async def delete_movie_in_db(
+    db: AsyncSession,
+    movie_id: int,
+    expected_versions: Optional[List[int]] = None,
+) -> bool:
+    """
+    Delete a movie with a single conditional `DELETE ... RETURNING` statement.
+
+    Association rows are removed by the `ON DELETE CASCADE` foreign keys.
+
+    :return: True if a row matched the id and expected versions and was deleted.
+    """
+    stmt = (
+        delete(MovieModel)
+        .where(MovieModel.id == movie_id)
+        .returning(MovieModel.id)
+        .execution_options(synchronize_session=False)
+    )
+    if expected_versions is not None:
+        stmt = stmt.where(MovieModel.version.in_(expected_versions))
+
+    result = await db.execute(stmt)
+    deleted_id = result.scalar_one_or_none()
+    await db.commit()
+    return deleted_id is not None
@@ -0,0 +1,86 @@
+from datetime import datetime, timedelta, timezone
+from typing import List, Optional
+
+from sqlalchemy import select, update
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from database import EmailOutboxModel, EmailOutboxStatusEnum
+
+
+def enqueue_email(db: AsyncSession, recipient: str, template_name: str, context: dict) -> EmailOutboxModel:
+    """
+    Add an email to the outbox of the current transaction.
+
+    Nothing is sent here: the row is committed together with the caller's changes and
+    delivered later by the outbox worker, so request latency never depends on the mail server.
+    """
+    email = EmailOutboxModel(recipient=recipient, template_name=template_name, context=context)
+    db.add(email)
+    return email
+
+
+async def claim_outbox_batch(db: AsyncSession, batch_size: int, lease_seconds: float) -> List[EmailOutboxModel]:
+    """
+    Claim up to `batch_size` due emails for delivery and commit the claim.
+
+    Claimed rows get their attempt counter bumped and their next attempt pushed back by
+    `lease_seconds`, so an email whose worker crashed is retried once the lease expires.
+    Rows locked by another worker are skipped.
+    """
+    now = datetime.now(timezone.utc)
+    due_ids = (
+        select(EmailOutboxModel.id)
+        .where(
+            EmailOutboxModel.status == EmailOutboxStatusEnum.PENDING,
+            EmailOutboxModel.next_attempt_at <= now,
+        )
+        .order_by(EmailOutboxModel.next_attempt_at)
+        .limit(batch_size)
+        .with_for_update(skip_locked=True)
+    )
+    stmt = (
+        update(EmailOutboxModel)
+        .where(EmailOutboxModel.id.in_(due_ids))
+        .values(attempts=EmailOutboxModel.attempts + 1, next_attempt_at=now + timedelta(seconds=lease_seconds))
+        .returning(EmailOutboxModel)
+        .execution_options(synchronize_session=False)
+    )
+    try:
+        result = await db.execute(stmt)
+        emails = list(result.scalars().all())
+        await db.commit()
+    except SQLAlchemyError as e:
+        await db.rollback()
+        raise e
+    return emails
+
+
+async def mark_emails_sent(db: AsyncSession, email_ids: List[int]) -> None:
+    if not email_ids:
+        return
+    stmt = (
+        update(EmailOutboxModel)
+        .where(EmailOutboxModel.id.in_(email_ids))
+        .values(status=EmailOutboxStatusEnum.SENT, sent_at=datetime.now(timezone.utc), last_error=None)
+        .execution_options(synchronize_session=False)
+    )
+    await db.execute(stmt)
+
+
+async def mark_email_failed(db: AsyncSession, email_id: int, error: str, retry_at: Optional[datetime]) -> None:
+    """
+    Record a failed delivery. The email is retried at `retry_at`, or given up on if it is None.
+    """
+    values = {"last_error": error}
+    if retry_at is None:
+        values["status"] = EmailOutboxStatusEnum.FAILED
+    else:
+        values["next_attempt_at"] = retry_at
+    stmt = (
+        update(EmailOutboxModel)
+        .where(EmailOutboxModel.id == email_id)
+        .values(**values)
+        .execution_options(synchronize_session=False)
+    )
+    await db.execute(stmt)
@@ -1,3 +1,5 @@
+from config import get_settings
+from database import ddl
 from database.models.base import Base
 from database.models.accounts import (
     UserModel,
@@ -17,9 +19,12 @@ from database.models.movies import (
     ActorsMoviesModel,
     MoviesLanguagesModel
 )
+from database.models.notifications import EmailOutboxModel, EmailOutboxStatusEnum
 from database.validators import accounts as accounts_validators
 
-from database.session_postgresql import (
-    get_postgresql_db_contextmanager as get_db_contextmanager,
-    get_postgresql_db as get_db
-)
+if get_settings().DATABASE_BACKEND == "sqlite":
+    from database.session_sqlite import get_sqlite_db_contextmanager as get_db_contextmanager
+else:
+    from database.session_postgresql import get_postgresql_db_contextmanager as get_db_contextmanager
+from database.dependencies import get_db
+from database.replicas import ReplicaRouter, ReadYourWritesMiddleware, get_read_db, is_primary_session
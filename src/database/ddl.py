@@ -0,0 +1,17 @@
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.schema import CreateColumn
+
+
+@compiles(CreateColumn)
+def _create_dialect_specific_column(element, compiler, **kw):
+    """
+    Leave columns that declare `info={"dialects": (...)}` out of CREATE TABLE on other dialects.
+
+    Used for PostgreSQL-only generated columns such as the movie `search_vector`, so the same
+    metadata can still create a schema on SQLite for local benchmarks.
+    """
+    column = element.element
+    dialects = column.info.get("dialects")
+    if dialects and compiler.dialect.name not in dialects:
+        return None
+    return compiler.visit_create_column(element, **kw)
@@ -0,0 +1,19 @@
+from typing import AsyncGenerator
+
+from fastapi import Request
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from config import get_container
+
+
+async def get_db(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    """
+    Provide an asynchronous database session for the request.
+
+    The session comes from the session factory of the application container, bound to the
+    engine of the configured `DATABASE_BACKEND`. It is closed after the request.
+
+    :return: An asynchronous generator yielding an AsyncSession instance.
+    """
+    async with get_container(request).session_factory() as session:
+        yield session
@@ -0,0 +1,42 @@
+from typing import Sequence
+
+from sqlalchemy import Table
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+def dialect_name(db: AsyncSession) -> str:
+    """
+    Return the name of the dialect the session is bound to, e.g. `postgresql` or `sqlite`.
+    """
+    return db.get_bind().dialect.name
+
+
+def is_postgresql(db: AsyncSession) -> bool:
+    return dialect_name(db) == "postgresql"
+
+
+def insert_with_on_conflict(db: AsyncSession, table: Table | type):
+    """
+    Return an INSERT construct of the session's dialect, which supports `on_conflict_do_nothing`.
+
+    Both PostgreSQL and SQLite accept `ON CONFLICT (...) DO NOTHING ... RETURNING`, as long as the
+    conflict target is given as `index_elements` rather than a constraint name.
+    """
+    if dialect_name(db) == "sqlite":
+        return sqlite.insert(table)
+    return postgresql.insert(table)
+
+
+def is_unique_violation(error: IntegrityError, index_name: str, table_name: str, columns: Sequence[str]) -> bool:
+    """
+    Tell whether `error` was raised by a duplicate key in the unique index `index_name`.
+
+    PostgreSQL reports the name of the violated index; SQLite only lists its `table.column`s.
+    """
+    constraint_name = getattr(error.orig.__cause__, "constraint_name", None)
+    if constraint_name is not None:
+        return constraint_name == index_name
+    qualified_columns = ", ".join(f"{table_name}.{column}" for column in columns)
+    return f"UNIQUE constraint failed: {qualified_columns}" in str(error.orig)
@@ -1,6 +1,6 @@
 from logging.config import fileConfig
 
-from database.models import movies, accounts
+from database.models import movies, accounts, notifications
 from database.models.base import Base
 from sqlalchemy import engine_from_config
 from sqlalchemy import pool
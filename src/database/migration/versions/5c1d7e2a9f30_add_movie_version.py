@@ -0,0 +1,28 @@
+"""add movie version
+
+Revision ID: 5c1d7e2a9f30
+Revises: b37cabdae04f
+Create Date: 2026-10-18 10:12:40.512093
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5c1d7e2a9f30'
+down_revision: Union[str, None] = 'b37cabdae04f'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('movies', sa.Column('version', sa.Integer(), server_default='1', nullable=False))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('movies', 'version')
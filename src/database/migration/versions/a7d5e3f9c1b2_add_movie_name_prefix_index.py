@@ -0,0 +1,43 @@
+"""add movie name prefix index
+
+Revision ID: a7d5e3f9c1b2
+Revises: f1a9d3c6b2e8
+Create Date: 2026-10-18 16:05:12.418530
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a7d5e3f9c1b2'
+down_revision: Union[str, None] = 'f1a9d3c6b2e8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # CONCURRENTLY keeps the movies table writable during the build, but cannot run in a transaction.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_movies_lower_name_pattern',
+            'movies',
+            [sa.text('lower(name) text_pattern_ops')],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_movies_lower_name_pattern',
+            table_name='movies',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
@@ -0,0 +1,56 @@
+"""add movie filter indexes
+
+Revision ID: c3e9a1d4b5f6
+Revises: 8a4f0b6c2d17
+Create Date: 2026-10-18 12:20:51.630827
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3e9a1d4b5f6'
+down_revision: Union[str, None] = '8a4f0b6c2d17'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+FILTER_INDEXES = [
+    ('ix_movies_score_id', 'movies', ['score', 'id']),
+    ('ix_movies_date_id', 'movies', ['date', 'id']),
+    ('ix_movies_revenue_id', 'movies', ['revenue', 'id']),
+    ('ix_movies_country_id_id', 'movies', ['country_id', 'id']),
+    ('ix_movies_genres_genre_id_movie_id', 'movies_genres', ['genre_id', 'movie_id']),
+    ('ix_actors_movies_actor_id_movie_id', 'actors_movies', ['actor_id', 'movie_id']),
+    ('ix_movies_languages_language_id_movie_id', 'movies_languages', ['language_id', 'movie_id']),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # CONCURRENTLY keeps the tables writable during the builds, but cannot run in a transaction.
+    with op.get_context().autocommit_block():
+        for index_name, table_name, columns in FILTER_INDEXES:
+            op.create_index(
+                index_name,
+                table_name,
+                columns,
+                unique=False,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for index_name, table_name, _ in reversed(FILTER_INDEXES):
+            op.drop_index(
+                index_name,
+                table_name=table_name,
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
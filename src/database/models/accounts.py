@@ -10,6 +10,7 @@ from sqlalchemy import (
     Enum,
     Integer,
     func,
+    Index,
     UniqueConstraint
 )
 from sqlalchemy.orm import (
@@ -21,6 +22,7 @@ from sqlalchemy.orm import (
 
 from database import Base
 from database.validators import accounts as validators
+from security.password_service import password_service
 from security.passwords import hash_password, verify_password
 from security.utils import generate_secure_token
 
@@ -119,6 +121,25 @@ class UserModel(Base):
         """
         return verify_password(raw_password, self._hashed_password)
 
+    async def set_password_async(self, raw_password: str) -> None:
+        """
+        Set the user's password, hashing it on the password process pool.
+        """
+        validators.validate_password_strength(raw_password)
+        self._hashed_password = await password_service.hash(raw_password)
+
+    async def verify_password_async(self, raw_password: str) -> bool:
+        """
+        Verify the provided password on the password process pool, without blocking the event loop.
+
+        If the password is correct but its hash uses an outdated cost factor, the hash is replaced
+        with a fresh one; the change is saved with the next commit of the session.
+        """
+        is_valid, new_hash = await password_service.verify_and_update(raw_password, self._hashed_password)
+        if is_valid and new_hash is not None:
+            self._hashed_password = new_hash
+        return is_valid
+
     @validates("email")
     def validate_email(self, key, value):
         return validators.validate_email(value.lower())
@@ -137,6 +158,7 @@ class TokenBaseModel(Base):
     expires_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         nullable=False,
+        index=True,
         default=lambda: datetime.now(timezone.utc) + timedelta(days=1)
     )
 
@@ -176,6 +198,8 @@ class RefreshTokenModel(TokenBaseModel):
         default=generate_secure_token
     )
 
+    __table_args__ = (Index("ix_refresh_tokens_user_id_expires_at", "user_id", "expires_at"),)
+
     @classmethod
     def create(cls, user_id: int | Mapped[int], days_valid: int, token: str) -> "RefreshTokenModel":
         """
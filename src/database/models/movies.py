@@ -2,7 +2,22 @@ import datetime
 from enum import Enum
 from typing import Optional
 
-from sqlalchemy import String, Float, Text, DECIMAL, UniqueConstraint, Date, ForeignKey, Table, Column
+from sqlalchemy import (
+    String,
+    Float,
+    Text,
+    DECIMAL,
+    UniqueConstraint,
+    Date,
+    ForeignKey,
+    Table,
+    Column,
+    Integer,
+    Computed,
+    Index,
+    func,
+)
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.orm import mapped_column, Mapped, relationship
 from sqlalchemy import Enum as SQLAlchemyEnum
 
@@ -24,6 +39,7 @@ MoviesGenresModel = Table(
     Column(
         "genre_id",
         ForeignKey("genres.id", ondelete="CASCADE"), primary_key=True, nullable=False),
+    Index("ix_movies_genres_genre_id_movie_id", "genre_id", "movie_id"),
 )
 
 ActorsMoviesModel = Table(
@@ -35,6 +51,7 @@ ActorsMoviesModel = Table(
     Column(
         "actor_id",
         ForeignKey("actors.id", ondelete="CASCADE"), primary_key=True, nullable=False),
+    Index("ix_actors_movies_actor_id_movie_id", "actor_id", "movie_id"),
 )
 
 MoviesLanguagesModel = Table(
@@ -42,6 +59,7 @@ MoviesLanguagesModel = Table(
     Base.metadata,
     Column("movie_id", ForeignKey("movies.id", ondelete="CASCADE"), primary_key=True),
     Column("language_id", ForeignKey("languages.id", ondelete="CASCADE"), primary_key=True),
+    Index("ix_movies_languages_language_id_movie_id", "language_id", "movie_id"),
 )
 
 
@@ -119,6 +137,17 @@ class MovieModel(Base):
     )
     budget: Mapped[float] = mapped_column(DECIMAL(15, 2), nullable=False)
     revenue: Mapped[float] = mapped_column(Float, nullable=False)
+    version: Mapped[int] = mapped_column(Integer, nullable=False, server_default="1")
+    search_vector: Mapped[str] = mapped_column(
+        TSVECTOR,
+        Computed(
+            "setweight(to_tsvector('english', coalesce(name, '')), 'A') || "
+            "setweight(to_tsvector('english', coalesce(overview, '')), 'B')",
+            persisted=True,
+        ),
+        deferred=True,
+        info={"dialects": ("postgresql",)},
+    )
 
     country_id: Mapped[int] = mapped_column(ForeignKey("countries.id"), nullable=False)
     country: Mapped["CountryModel"] = relationship("CountryModel", back_populates="movies")
@@ -143,8 +172,20 @@ class MovieModel(Base):
 
     __table_args__ = (
         UniqueConstraint("name", "date", name="unique_movie_constraint"),
+        Index("ix_movies_search_vector", "search_vector", postgresql_using="gin").ddl_if(dialect="postgresql"),
+        Index("ix_movies_score_id", "score", "id"),
+        Index("ix_movies_date_id", "date", "id"),
+        Index("ix_movies_revenue_id", "revenue", "id"),
+        Index("ix_movies_country_id_id", "country_id", "id"),
+        Index(
+            "ix_movies_lower_name_pattern",
+            func.lower(name).label("lower_name"),
+            postgresql_ops={"lower_name": "text_pattern_ops"},
+        ).ddl_if(dialect="postgresql"),
     )
 
+    __mapper_args__ = {"version_id_col": version, "eager_defaults": False}
+
     @classmethod
     def default_order_by(cls):
         return [cls.id.desc()]
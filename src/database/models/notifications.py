@@ -0,0 +1,49 @@
+import enum
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import JSON, DateTime, Enum, Index, Integer, String, Text, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from database.models.base import Base
+
+
+class EmailOutboxStatusEnum(str, enum.Enum):
+    PENDING = "pending"
+    SENT = "sent"
+    FAILED = "failed"
+
+
+class EmailOutboxModel(Base):
+    """
+    An email waiting to be rendered and delivered by the outbox worker.
+
+    Rows are written in the transaction of the change that triggers the email, so an email
+    exists if and only if that change was committed.
+    """
+
+    __tablename__ = "email_outbox"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    recipient: Mapped[str] = mapped_column(String(255), nullable=False)
+    template_name: Mapped[str] = mapped_column(String(255), nullable=False)
+    context: Mapped[dict] = mapped_column(JSON, nullable=False)
+    status: Mapped[EmailOutboxStatusEnum] = mapped_column(
+        Enum(EmailOutboxStatusEnum),
+        nullable=False,
+        server_default=EmailOutboxStatusEnum.PENDING.name,
+    )
+    attempts: Mapped[int] = mapped_column(Integer, nullable=False, server_default="0")
+    next_attempt_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, server_default=func.now()
+    )
+    last_error: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, server_default=func.now())
+    sent_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
+
+    __table_args__ = (
+        Index("ix_email_outbox_status_next_attempt_at", "status", "next_attempt_at"),
+    )
+
+    def __repr__(self):
+        return f"<EmailOutboxModel(id={self.id}, recipient={self.recipient}, status={self.status})>"
@@ -2,6 +2,7 @@ import asyncio
 import math
 from typing import List, Dict, Tuple
 
+import numpy as np
 import pandas as pd
 from sqlalchemy import insert, select, func
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -174,6 +175,37 @@ class CSVDatabaseSeeder:
 
         await self._db_session.flush()
 
+    @staticmethod
+    def _split_column(data: pd.DataFrame, column: str) -> pd.Series:
+        """
+        Split a comma-separated column into one stripped, non-empty value per element.
+
+        The result is indexed by the position of the source row, so it can be aligned with
+        per-row arrays such as the list of inserted movie IDs.
+
+        :param data: The preprocessed DataFrame.
+        :param column: The name of the comma-separated column (e.g., "genre").
+        :return: A Series of individual values indexed by source row position.
+        """
+        values = data[column].reset_index(drop=True).str.split(',').explode().str.strip()
+        return values[values.notna() & (values != '')]
+
+    @staticmethod
+    def _map_ids(values: pd.Series, reference_map: Dict[str, object]) -> pd.Series:
+        """
+        Translate names or codes to the IDs of their model instances.
+
+        :param values: A Series of names or codes (e.g., the country code of every movie).
+        :param reference_map: A mapping of names or codes to model instances.
+        :return: A Series of integer IDs aligned with `values`.
+        :raises KeyError: If a value has no entry in `reference_map`.
+        """
+        ids = values.map({key: obj.id for key, obj in reference_map.items()})
+        missing = values[ids.isna()]
+        if not missing.empty:
+            raise KeyError(missing.iloc[0])
+        return ids.astype('int64')
+
     async def _prepare_reference_data(
         self,
         data: pd.DataFrame
@@ -187,31 +219,20 @@ class CSVDatabaseSeeder:
                  (country_map, genre_map, actor_map, language_map).
         """
         countries = list(data['country'].unique())
-        genres = {
-            genre.strip()
-            for genres_ in data['genre'].dropna() for genre in genres_.split(',')
-            if genre.strip()
-        }
-        actors = {
-            actor.strip()
-            for crew in data['crew'].dropna() for actor in crew.split(',')
-            if actor.strip()
-        }
-        languages = {
-            lang.strip()
-            for langs in data['orig_lang'].dropna() for lang in langs.split(',')
-            if lang.strip()
-        }
+        genres = list(self._split_column(data, 'genre').unique())
+        actors = list(self._split_column(data, 'crew').unique())
+        languages = list(self._split_column(data, 'orig_lang').unique())
 
         country_map = await self._get_or_create_bulk(CountryModel, countries, 'code')
-        genre_map = await self._get_or_create_bulk(GenreModel, list(genres), 'name')
-        actor_map = await self._get_or_create_bulk(ActorModel, list(actors), 'name')
-        language_map = await self._get_or_create_bulk(LanguageModel, list(languages), 'name')
+        genre_map = await self._get_or_create_bulk(GenreModel, genres, 'name')
+        actor_map = await self._get_or_create_bulk(ActorModel, actors, 'name')
+        language_map = await self._get_or_create_bulk(LanguageModel, languages, 'name')
 
         return country_map, genre_map, actor_map, language_map
 
-    @staticmethod
+    @classmethod
     def _prepare_movies_data(
+        cls,
         data: pd.DataFrame,
         country_map: Dict[str, object]
     ) -> List[Dict[str, object]]:
@@ -222,24 +243,47 @@ class CSVDatabaseSeeder:
         :param country_map: A mapping of country codes to CountryModel instances.
         :return: A list of dictionaries, each representing a new movie record.
         """
-        movies_data: List[Dict[str, object]] = []
-        for _, row in tqdm(data.iterrows(), total=data.shape[0], desc="Processing movies"):
-            country = country_map[row['country']]
-            movie = {
-                "name": row['names'],
-                "date": row['date_x'],
-                "score": float(row['score']),
-                "overview": row['overview'],
-                "status": row['status'],
-                "budget": float(row['budget_x']),
-                "revenue": float(row['revenue']),
-                "country_id": country.id
-            }
-            movies_data.append(movie)
-        return movies_data
+        movies = pd.DataFrame({
+            "name": data['names'],
+            "date": data['date_x'],
+            "score": data['score'].astype('float64'),
+            "overview": data['overview'],
+            "status": data['status'],
+            "budget": data['budget_x'].astype('float64'),
+            "revenue": data['revenue'].astype('float64'),
+            "country_id": cls._map_ids(data['country'], country_map),
+        })
+        return movies.to_dict('records')
+
+    @classmethod
+    def _prepare_association(
+        cls,
+        data: pd.DataFrame,
+        column: str,
+        movie_ids: List[int],
+        reference_map: Dict[str, object],
+        reference_key: str
+    ) -> List[Dict[str, int]]:
+        """
+        Build the rows of one many-to-many table from a comma-separated column.
 
-    @staticmethod
+        :param data: The DataFrame containing movie info.
+        :param column: The comma-separated column to split (e.g., "genre").
+        :param movie_ids: The newly inserted movie IDs, in the same order as DataFrame rows.
+        :param reference_map: A mapping of names to model instances for `column`.
+        :param reference_key: The foreign key column of the association table (e.g., "genre_id").
+        :return: A list of dictionaries for bulk insertion, without duplicate pairs.
+        """
+        values = cls._split_column(data, column)
+        associations = pd.DataFrame({
+            "movie_id": np.asarray(movie_ids, dtype=np.int64)[values.index.to_numpy()],
+            reference_key: cls._map_ids(values, reference_map).to_numpy(),
+        })
+        return associations.drop_duplicates().to_dict('records')
+
+    @classmethod
     def _prepare_associations(
+        cls,
         data: pd.DataFrame,
         movie_ids: List[int],
         genre_map: Dict[str, object],
@@ -259,31 +303,11 @@ class CSVDatabaseSeeder:
                  (movie_genres_data, movie_actors_data, movie_languages_data),
                  each containing dictionaries for bulk insertion.
         """
-        movie_genres_data: List[Dict[str, int]] = []
-        movie_actors_data: List[Dict[str, int]] = []
-        movie_languages_data: List[Dict[str, int]] = []
-
-        for i, (_, row) in enumerate(tqdm(data.iterrows(), total=data.shape[0], desc="Processing associations")):
-            movie_id = movie_ids[i]
-
-            for genre_name in row['genre'].split(','):
-                genre_name = genre_name.strip()
-                if genre_name:
-                    genre = genre_map[genre_name]
-                    movie_genres_data.append({"movie_id": movie_id, "genre_id": genre.id})
-
-            for actor_name in row['crew'].split(','):
-                actor_name = actor_name.strip()
-                if actor_name:
-                    actor = actor_map[actor_name]
-                    movie_actors_data.append({"movie_id": movie_id, "actor_id": actor.id})
-
-            for lang_name in row['orig_lang'].split(','):
-                lang_name = lang_name.strip()
-                if lang_name:
-                    language = language_map[lang_name]
-                    movie_languages_data.append({"movie_id": movie_id, "language_id": language.id})
-
+        movie_genres_data = cls._prepare_association(data, 'genre', movie_ids, genre_map, "genre_id")
+        movie_actors_data = cls._prepare_association(data, 'crew', movie_ids, actor_map, "actor_id")
+        movie_languages_data = cls._prepare_association(
+            data, 'orig_lang', movie_ids, language_map, "language_id"
+        )
         return movie_genres_data, movie_actors_data, movie_languages_data
 
     async def seed(self) -> None:
@@ -306,7 +330,7 @@ class CSVDatabaseSeeder:
             movies_data = self._prepare_movies_data(data, country_map)
 
             result = await self._db_session.execute(
-                insert(MovieModel).returning(MovieModel.id),
+                insert(MovieModel).returning(MovieModel.id, sort_by_parameter_order=True),
                 movies_data
             )
             movie_ids = list(result.scalars().all())
@@ -320,6 +344,8 @@ class CSVDatabaseSeeder:
             await self._bulk_insert(MoviesLanguagesModel, movie_languages_data)
 
             await self._db_session.commit()
+            # The seeder runs in its own process, so running API workers keep their cached movie
+            # total until MOVIES_COUNT_CACHE_TTL_SECONDS expires.
             print("Seeding completed.")
 
         except SQLAlchemyError as e:
@@ -336,6 +362,10 @@ async def main() -> None:
     Checks if the database is already populated, and if not, performs the seeding process.
     """
     settings = get_settings()
+    if settings.DATABASE_BACKEND == "sqlite":
+        from database.session_sqlite import create_sqlite_schema
+
+        await create_sqlite_schema()
     async with get_db_contextmanager() as db_session:
         seeder = CSVDatabaseSeeder(settings.PATH_TO_MOVIES_CSV, db_session)
 
@@ -0,0 +1,185 @@
+import asyncio
+import itertools
+import logging
+import time
+from typing import AsyncGenerator, List, Optional, Sequence
+
+from fastapi import Request, Response
+from sqlalchemy import text
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+from sqlalchemy.orm import sessionmaker
+from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
+from starlette.types import ASGIApp
+
+from config import get_container
+
+logger = logging.getLogger(__name__)
+
+READ_YOUR_WRITES_COOKIE = "primary_reads_until"
+WRITE_METHODS = frozenset({"POST", "PUT", "PATCH", "DELETE"})
+
+
+class ReplicaRouter:
+    """
+    Route read-only sessions round-robin across healthy read replicas.
+
+    A background task probes every replica with `SELECT 1` each `health_check_interval_seconds`;
+    a replica that fails the probe, or drops a connection during a request, is skipped until
+    it passes again. Replicas take reads only once they pass a check; until then, and whenever
+    no replica is healthy, reads fall back to the primary.
+    """
+
+    def __init__(
+        self,
+        primary_session_factory: sessionmaker,
+        replica_engines: Sequence[AsyncEngine],
+        health_check_interval_seconds: float = 5.0,
+        health_check_timeout_seconds: float = 2.0,
+    ) -> None:
+        self._primary_session_factory = primary_session_factory
+        self._engines = list(replica_engines)
+        self._session_factories = [
+            sessionmaker(  # type: ignore
+                bind=engine,
+                class_=AsyncSession,
+                autocommit=False,
+                autoflush=False,
+                expire_on_commit=False,
+            )
+            for engine in self._engines
+        ]
+        self._healthy: List[int] = []
+        self._counter = itertools.count()
+        self._health_check_interval_seconds = health_check_interval_seconds
+        self._health_check_timeout_seconds = health_check_timeout_seconds
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def healthy_replicas(self) -> int:
+        return len(self._healthy)
+
+    def start(self) -> None:
+        if self._engines and self._task is None:
+            self._task = asyncio.create_task(self._run(), name="replica-health-check")
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def close(self) -> None:
+        await self.stop()
+        for engine in self._engines:
+            await engine.dispose()
+
+    def next_replica(self) -> Optional[int]:
+        """
+        Return the index of the next healthy replica, or `None` to read from the primary.
+        """
+        healthy = self._healthy
+        if not healthy:
+            return None
+        return healthy[next(self._counter) % len(healthy)]
+
+    def session_factory(self, replica: Optional[int]) -> sessionmaker:
+        if replica is None:
+            return self._primary_session_factory
+        return self._session_factories[replica]
+
+    def mark_unhealthy(self, replica: int) -> None:
+        if replica in self._healthy:
+            self._healthy = [index for index in self._healthy if index != replica]
+            logger.warning("Read replica %d is unhealthy, routing reads elsewhere.", replica)
+
+    async def check_health(self) -> None:
+        results = await asyncio.gather(*(self._probe(engine) for engine in self._engines))
+        healthy = [index for index, ok in enumerate(results) if ok]
+        for index in set(healthy) - set(self._healthy):
+            logger.info("Read replica %d is healthy again.", index)
+        for index in set(self._healthy) - set(healthy):
+            logger.warning("Read replica %d failed its health check.", index)
+        self._healthy = healthy
+
+    async def _probe(self, engine: AsyncEngine) -> bool:
+        async def _select_one() -> None:
+            async with engine.connect() as connection:
+                await connection.execute(text("SELECT 1"))
+
+        try:
+            await asyncio.wait_for(_select_one(), self._health_check_timeout_seconds)
+        except Exception:
+            # Drivers raise their own errors for refused logins or missing databases.
+            return False
+        return True
+
+    async def _run(self) -> None:
+        while True:
+            await self.check_health()
+            await asyncio.sleep(self._health_check_interval_seconds)
+
+
+def reads_own_writes(request: Request) -> bool:
+    """
+    Tell whether the client wrote recently enough that its reads must see the primary.
+    """
+    try:
+        return float(request.cookies.get(READ_YOUR_WRITES_COOKIE, 0)) > time.time()
+    except ValueError:
+        return False
+
+
+def is_primary_session(session: AsyncSession) -> bool:
+    """
+    Tell whether `session` reads from the primary rather than from a possibly lagging replica.
+    """
+    return session.info.get("replica") is None
+
+
+async def get_read_db(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    """
+    Provide an asynchronous database session for read-only endpoints.
+
+    The session is bound to the next healthy read replica, or to the primary when no replica
+    is configured or healthy, or when the client wrote within the read-your-writes window.
+    A replica that drops its connection during the request is marked unhealthy.
+
+    :return: An asynchronous generator yielding an AsyncSession instance.
+    """
+    replicas: ReplicaRouter = get_container(request).replicas
+    replica = None if reads_own_writes(request) else replicas.next_replica()
+    async with replicas.session_factory(replica)() as session:
+        session.info["replica"] = replica
+        try:
+            yield session
+        except (OSError, DBAPIError) as e:
+            if replica is not None and (isinstance(e, OSError) or e.connection_invalidated):
+                replicas.mark_unhealthy(replica)
+            raise
+
+
+class ReadYourWritesMiddleware(BaseHTTPMiddleware):
+    """
+    Pin a client's reads to the primary for `window_seconds` after each of its successful writes,
+    so it never reads a replica that has not caught up with its own change yet.
+    """
+
+    def __init__(self, app: ASGIApp, window_seconds: int) -> None:
+        super().__init__(app)
+        self.window_seconds = window_seconds
+
+    async def dispatch(self, request: Request, call_next: RequestResponseEndpoint) -> Response:
+        response = await call_next(request)
+        if request.method in WRITE_METHODS and response.status_code < 400:
+            response.set_cookie(
+                READ_YOUR_WRITES_COOKIE,
+                str(time.time() + self.window_seconds),
+                max_age=self.window_seconds,
+                httponly=True,
+                samesite="lax",
+            )
+        return response
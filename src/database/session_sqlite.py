@@ -0,0 +1,116 @@
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from pathlib import Path
+from typing import AsyncGenerator
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import create_async_engine, AsyncEngine, AsyncSession
+from sqlalchemy.orm import sessionmaker
+
+from config import get_settings
+from database.models.base import Base
+from monitoring import InstrumentedAsyncQueuePool
+
+settings = get_settings()
+
+SQLITE_DATABASE_URL = f"sqlite+aiosqlite:///{settings.PATH_TO_DB}"
+
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+    """
+    Tune every new SQLite connection.
+
+    WAL lets readers run alongside the single writer, and `synchronous=NORMAL` is durable in WAL
+    mode except against power loss. Foreign keys are off by default in SQLite and must be enabled
+    per connection for the `ON DELETE CASCADE` rules to apply.
+    """
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA foreign_keys=ON")
+    cursor.execute(f"PRAGMA busy_timeout={int(settings.SQLITE_BUSY_TIMEOUT_MS)}")
+    cursor.execute(f"PRAGMA cache_size=-{int(settings.SQLITE_CACHE_SIZE_KIB)}")
+    cursor.execute(f"PRAGMA mmap_size={int(settings.SQLITE_MMAP_SIZE_BYTES)}")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.close()
+
+
+def create_sqlite_engine(url: str) -> AsyncEngine:
+    """
+    Create an async SQLite engine with the pool configured by the `DB_*` settings and the
+    per-connection pragmas applied.
+    """
+    engine = create_async_engine(
+        url,
+        echo=False,
+        poolclass=InstrumentedAsyncQueuePool,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT_SECONDS,
+        connect_args={"timeout": settings.SQLITE_BUSY_TIMEOUT_MS / 1000},
+    )
+    event.listen(engine.sync_engine, "connect", _set_sqlite_pragmas)
+    return engine
+
+
+@lru_cache
+def get_sqlite_engine() -> AsyncEngine:
+    """
+    Return the SQLite engine, creating it on first use.
+
+    Built lazily so that importing this module does not need the `aiosqlite` driver.
+    """
+    return create_sqlite_engine(SQLITE_DATABASE_URL)
+
+
+@lru_cache
+def get_sqlite_session_factory() -> sessionmaker:
+    """
+    Return the session factory bound to the SQLite engine, creating it on first use.
+    """
+    return sessionmaker(  # type: ignore
+        bind=get_sqlite_engine(),
+        class_=AsyncSession,
+        autocommit=False,
+        autoflush=False,
+        expire_on_commit=False,
+    )
+
+
+async def create_sqlite_schema() -> None:
+    """
+    Create the database file and every table that does not exist yet.
+
+    The Alembic migrations use PostgreSQL-only DDL, so the SQLite schema is created from the
+    models; PostgreSQL-only columns and indexes are left out.
+    """
+    Path(settings.PATH_TO_DB).parent.mkdir(parents=True, exist_ok=True)
+    async with get_sqlite_engine().begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
+
+
+async def get_sqlite_db() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Provide an asynchronous SQLite database session.
+
+    This function returns an async generator yielding a new database session.
+    It ensures that the session is properly closed after use.
+
+    :return: An asynchronous generator yielding an AsyncSession instance.
+    """
+    async with get_sqlite_session_factory()() as session:
+        yield session
+
+
+@asynccontextmanager
+async def get_sqlite_db_contextmanager() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Provide an asynchronous SQLite database session using a context manager.
+
+    This function allows for managing the database session within a `with` statement.
+    It ensures that the session is properly initialized and closed after execution.
+
+    :return: An asynchronous generator yielding an AsyncSession instance.
+    """
+    async with get_sqlite_session_factory()() as session:
+        yield session
@@ -0,0 +1,5 @@
+from etags.utils import (
+    make_etag,
+    parse_etag_header,
+    etag_matches,
+)
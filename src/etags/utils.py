@@ -0,0 +1,52 @@
+import hashlib
+from typing import Any, List, Optional
+
+ANY_ETAG = "*"
+
+
+def make_etag(*parts: Any) -> str:
+    """
+    Build a strong, quoted ETag from the given version parts.
+
+    Short tags are rendered as-is, anything longer is hashed, so an ETag derived from
+    a whole page of versions stays compact.
+
+    Example:
+        make_etag(42, 3) -> '"42-3"'
+    """
+    value = "-".join(str(part) for part in parts)
+    if len(value) > 64:
+        value = hashlib.sha256(value.encode()).hexdigest()[:32]
+    return f'"{value}"'
+
+
+def parse_etag_header(value: Optional[str]) -> List[str]:
+    """
+    Split an `If-Match`/`If-None-Match` header into its entity tags.
+
+    Weak tags keep their `W/` prefix so callers can apply strong comparison.
+    Returns ["*"] for the wildcard and an empty list when the header is missing.
+    """
+    if not value:
+        return []
+    tags = [tag.strip() for tag in value.split(",")]
+    return [tag for tag in tags if tag]
+
+
+def etag_matches(etag: str, header_value: Optional[str], weak: bool = False) -> bool:
+    """
+    Check whether `etag` matches a conditional request header.
+
+    `If-None-Match` uses weak comparison (`weak=True`), `If-Match` uses strong comparison,
+    in which a weak tag never matches.
+    """
+    for tag in parse_etag_header(header_value):
+        if tag == ANY_ETAG:
+            return True
+        if tag.startswith("W/"):
+            if weak and tag[2:] == etag:
+                return True
+            continue
+        if tag == etag:
+            return True
+    return False
@@ -3,3 +3,9 @@ from exceptions.security import (
     InvalidTokenError,
     TokenExpiredError
 )
+from exceptions.pagination import InvalidCursorError
+from exceptions.passwords import (
+    PasswordHashingError,
+    PasswordHashingBusyError,
+    PasswordHashingTimeoutError
+)
@@ -0,0 +1,5 @@
+class InvalidCursorError(Exception):
+    """Raised when a pagination cursor cannot be decoded."""
+
+    def __init__(self, message="Invalid pagination cursor."):
+        super().__init__(message)
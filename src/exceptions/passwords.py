@@ -0,0 +1,21 @@
+class PasswordHashingError(Exception):
+    """Base class for errors raised while hashing or verifying a password off the event loop."""
+
+    def __init__(self, message=None):
+        if message is None:
+            message = "Password hashing is unavailable, please retry later."
+        super().__init__(message)
+
+
+class PasswordHashingBusyError(PasswordHashingError):
+    """Raised when the password hashing queue is full."""
+
+    def __init__(self, message="Too many password operations in progress, please retry later."):
+        super().__init__(message)
+
+
+class PasswordHashingTimeoutError(PasswordHashingError):
+    """Raised when a password operation does not finish in time."""
+
+    def __init__(self, message="Password operation timed out, please retry later."):
+        super().__init__(message)
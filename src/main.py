@@ -1,9 +1,88 @@
-from fastapi import FastAPI
-from routes import accounts_router, movies_router
+from contextlib import asynccontextmanager
 
-app = FastAPI(title="Online cinema API",)
+from fastapi import Depends, FastAPI
+
+from config import get_settings
+from config.container import create_container
+from database import ReadYourWritesMiddleware
+from monitoring import QueryCountMiddleware, PrometheusMiddleware, mark_worker_stopped, set_slow_query_threshold
+from notifications import EmailOutboxWorker, EmailTemplateRenderer, SMTPConnectionPool
+from routes import accounts_router, movies_router, internal_router, metrics_router
+from security.http import get_current_admin
+from security.password_service import password_service
+from tasks import TokenSweeper
+
+settings = get_settings()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    container = create_container()
+    app.state.container = container
+    if settings.DATABASE_BACKEND == "sqlite":
+        from database.session_sqlite import create_sqlite_schema
+
+        await create_sqlite_schema()
+    await container.warm_up(settings.DB_POOL_PREWARM_CONNECTIONS)
+    container.replicas.start()
+    password_service.start()
+    token_sweeper = TokenSweeper(
+        session_factory=container.session_factory,
+        interval_seconds=settings.TOKEN_SWEEP_INTERVAL_SECONDS,
+        batch_size=settings.TOKEN_SWEEP_BATCH_SIZE,
+        max_batches=settings.TOKEN_SWEEP_MAX_BATCHES,
+    )
+    token_sweeper.start()
+    email_worker = EmailOutboxWorker(
+        session_factory=container.session_factory,
+        mailer=SMTPConnectionPool(
+            host=settings.SMTP_HOST,
+            port=settings.SMTP_PORT,
+            pool_size=settings.SMTP_POOL_SIZE,
+            username=settings.SMTP_USER,
+            password=settings.SMTP_PASSWORD,
+            use_tls=settings.SMTP_USE_TLS,
+            timeout_seconds=settings.SMTP_TIMEOUT_SECONDS,
+        ),
+        renderer=EmailTemplateRenderer(settings.PATH_TO_EMAIL_TEMPLATES_DIR),
+        sender=settings.EMAIL_FROM,
+        batch_size=settings.EMAIL_OUTBOX_BATCH_SIZE,
+        poll_interval_seconds=settings.EMAIL_OUTBOX_POLL_INTERVAL_SECONDS,
+        max_attempts=settings.EMAIL_OUTBOX_MAX_ATTEMPTS,
+        backoff_seconds=settings.EMAIL_OUTBOX_BACKOFF_SECONDS,
+        lease_seconds=settings.EMAIL_OUTBOX_LEASE_SECONDS,
+    )
+    email_worker.start()
+    yield
+    await email_worker.stop()
+    await token_sweeper.stop()
+    password_service.shutdown()
+    await container.close()
+    del app.state.container
+    mark_worker_stopped()
+
+
+app = FastAPI(title="Online cinema API", lifespan=lifespan)
+
+if settings.DB_REPLICA_URLS:
+    app.add_middleware(ReadYourWritesMiddleware, window_seconds=settings.READ_YOUR_WRITES_SECONDS)
+app.add_middleware(
+    QueryCountMiddleware,
+    debug=settings.DEBUG,
+    max_queries=settings.MAX_QUERIES_PER_REQUEST,
+    server_timing=settings.SERVER_TIMING_ENABLED,
+)
+app.add_middleware(PrometheusMiddleware, excluded_paths=frozenset({"/metrics"}))
+set_slow_query_threshold(settings.SLOW_QUERY_THRESHOLD_MS)
 
 api_version_prefix = "/api/v1"
 
 app.include_router(accounts_router, prefix=f"{api_version_prefix}/accounts", tags=["accounts"])
 app.include_router(movies_router, prefix=f"{api_version_prefix}/movies", tags=["movies"])
+app.include_router(
+    internal_router,
+    prefix=f"{api_version_prefix}/internal",
+    tags=["internal"],
+    dependencies=[Depends(get_current_admin)],
+)
+app.include_router(metrics_router)
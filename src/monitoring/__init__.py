@@ -0,0 +1,10 @@
+from monitoring.queries import (
+    QueryCounter,
+    count_queries,
+    assert_max_queries,
+    parameter_shape,
+    set_slow_query_threshold,
+)
+from monitoring.middleware import QueryCountMiddleware
+from monitoring.pool import InstrumentedAsyncQueuePool
+from monitoring.metrics import PrometheusMiddleware, render_metrics, mark_worker_stopped
@@ -0,0 +1,108 @@
+import os
+import time
+
+from fastapi import Request, Response
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
+from starlette.routing import Match
+from starlette.types import ASGIApp
+
+UNMATCHED_ROUTE = "<unmatched>"
+
+HTTP_REQUESTS = Counter(
+    "http_requests_total",
+    "HTTP requests handled, by route and status code.",
+    ["method", "route", "status"],
+)
+HTTP_REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds",
+    "HTTP request handling time, by route.",
+    ["method", "route"],
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0),
+)
+HTTP_REQUESTS_IN_PROGRESS = Gauge(
+    "http_requests_in_progress",
+    "HTTP requests being handled, by route.",
+    ["method", "route"],
+    multiprocess_mode="livesum",
+)
+
+
+def multiprocess_mode() -> bool:
+    """
+    Tell whether metrics are shared between worker processes through `PROMETHEUS_MULTIPROC_DIR`.
+
+    The directory must exist and be emptied before the workers start; each worker then writes
+    its samples there and `/metrics` sums them, whichever worker serves the scrape.
+    """
+    return bool(os.environ.get("PROMETHEUS_MULTIPROC_DIR"))
+
+
+def render_metrics() -> Response:
+    if multiprocess_mode():
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+    return Response(content=generate_latest(registry), media_type=CONTENT_TYPE_LATEST)
+
+
+def mark_worker_stopped() -> None:
+    """
+    Drop the in-progress gauges of this worker from the shared metrics on shutdown.
+    """
+    if multiprocess_mode():
+        multiprocess.mark_process_dead(os.getpid())
+
+
+def route_template(request: Request) -> str:
+    """
+    Return the path template of the route matching the request, e.g. `/api/v1/movies/movies/{movie_id}/`,
+    so metric labels stay bounded whatever ids clients request.
+    """
+    for route in request.app.router.routes:
+        match, _ = route.matches(request.scope)
+        if match == Match.FULL:
+            return route.path
+    return UNMATCHED_ROUTE
+
+
+class PrometheusMiddleware(BaseHTTPMiddleware):
+    """
+    Record the latency histogram, in-flight gauge and status code counter of every request.
+
+    Requests to `excluded_paths`, such as the metrics endpoint itself, are not recorded.
+    An exception escaping the application is counted as a 500 response.
+    """
+
+    def __init__(self, app: ASGIApp, excluded_paths: frozenset = frozenset()) -> None:
+        super().__init__(app)
+        self._excluded_paths = excluded_paths
+
+    async def dispatch(self, request: Request, call_next: RequestResponseEndpoint) -> Response:
+        if request.url.path in self._excluded_paths:
+            return await call_next(request)
+
+        method = request.method
+        route = route_template(request)
+        in_progress = HTTP_REQUESTS_IN_PROGRESS.labels(method, route)
+        in_progress.inc()
+        status_code = 500
+        started_at = time.perf_counter()
+        try:
+            response = await call_next(request)
+            status_code = response.status_code
+            return response
+        finally:
+            HTTP_REQUEST_DURATION.labels(method, route).observe(time.perf_counter() - started_at)
+            HTTP_REQUESTS.labels(method, route, str(status_code)).inc()
+            in_progress.dec()
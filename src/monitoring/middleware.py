@@ -0,0 +1,86 @@
+import logging
+import time
+from typing import Optional
+
+from fastapi import Request, Response, status
+from fastapi.responses import JSONResponse
+from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
+from starlette.types import ASGIApp
+
+from monitoring.queries import MAX_LOGGED_STATEMENT_LENGTH, QueryCounter, count_queries
+
+logger = logging.getLogger(__name__)
+
+
+class QueryCountMiddleware(BaseHTTPMiddleware):
+    """
+    Count and time the SQL statements executed while handling each request.
+
+    With `server_timing`, the statement count, total database time, slowest statement time and
+    total handling time are reported in the `Server-Timing` header, where browser developer
+    tools and tracing proxies pick them up. The same figures and the text of the slowest
+    statement are logged for every request at DEBUG level.
+
+    In debug mode the count is returned in the `X-DB-Query-Count` header, and a request that
+    exceeds `max_queries` is answered with a 500 error, so N+1 regressions fail loudly during
+    development. Outside debug mode exceeding the limit is only logged.
+    """
+
+    header_name = "X-DB-Query-Count"
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        debug: bool = False,
+        max_queries: Optional[int] = None,
+        server_timing: bool = False,
+    ) -> None:
+        super().__init__(app)
+        self._debug = debug
+        self._max_queries = max_queries
+        self._server_timing = server_timing
+
+    async def dispatch(self, request: Request, call_next: RequestResponseEndpoint) -> Response:
+        started_at = time.perf_counter()
+        with count_queries(label=f"{request.method} {request.url.path}") as counter:
+            response = await call_next(request)
+        elapsed = time.perf_counter() - started_at
+
+        if counter.slowest_statement is not None and logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "%s %s executed %d SQL statements in %.2f ms; slowest took %.2f ms: %s",
+                request.method, request.url.path, counter.count, counter.duration * 1000,
+                counter.slowest_duration * 1000,
+                " ".join(counter.slowest_statement.split())[:MAX_LOGGED_STATEMENT_LENGTH],
+            )
+
+        if self._max_queries is not None and counter.count > self._max_queries:
+            logger.error(
+                "%s %s executed %d SQL statements (limit %d).",
+                request.method, request.url.path, counter.count, self._max_queries,
+            )
+            if self._debug:
+                response = JSONResponse(
+                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                    content={
+                        "detail": f"Request executed {counter.count} SQL statements, "
+                                  f"the limit is {self._max_queries}."
+                    },
+                )
+
+        if self._debug:
+            response.headers[self.header_name] = str(counter.count)
+        if self._server_timing:
+            response.headers.append("Server-Timing", server_timing_header(counter, elapsed))
+        return response
+
+
+def server_timing_header(counter: QueryCounter, elapsed: float) -> str:
+    """
+    Format the database timings of a request as a `Server-Timing` header value, in milliseconds.
+    """
+    return (
+        f'db;dur={counter.duration * 1000:.2f};desc="{counter.count} queries", '
+        f"db-slowest;dur={counter.slowest_duration * 1000:.2f}, "
+        f"app;dur={elapsed * 1000:.2f}"
+    )
@@ -0,0 +1,137 @@
+import json
+import logging
+import time
+from collections.abc import Mapping
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Iterator, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+slow_query_logger = logging.getLogger("monitoring.slow_queries")
+
+MAX_LOGGED_STATEMENT_LENGTH = 2000
+MAX_LISTED_PARAMETERS = 20
+
+_slow_query_threshold_seconds: Optional[float] = None
+
+
+class QueryCounter:
+    """
+    Counts and times SQL statements executed while it is active.
+
+    Counters nest: a statement counted by an inner counter is counted by its parents too.
+    """
+
+    def __init__(self, parent: Optional["QueryCounter"] = None, label: Optional[str] = None) -> None:
+        self.count = 0
+        self.duration = 0.0
+        self.slowest_duration = 0.0
+        self.slowest_statement: Optional[str] = None
+        self.label = label if label is not None else (parent.label if parent is not None else None)
+        self._parent = parent
+
+    def increment(self) -> None:
+        counter = self
+        while counter is not None:
+            counter.count += 1
+            counter = counter._parent
+
+    def record(self, duration: float, statement: str) -> None:
+        counter = self
+        while counter is not None:
+            counter.duration += duration
+            if duration > counter.slowest_duration:
+                counter.slowest_duration = duration
+                counter.slowest_statement = statement
+            counter = counter._parent
+
+
+_current_counter: ContextVar[Optional[QueryCounter]] = ContextVar("current_query_counter", default=None)
+
+
+def set_slow_query_threshold(threshold_ms: Optional[float]) -> None:
+    """
+    Log every statement slower than `threshold_ms` milliseconds to the `monitoring.slow_queries`
+    logger as a JSON record; `None` disables the log.
+    """
+    global _slow_query_threshold_seconds
+    _slow_query_threshold_seconds = threshold_ms / 1000 if threshold_ms is not None else None
+
+
+def parameter_shape(parameters: Any, executemany: bool = False) -> Any:
+    """
+    Describe bound parameters by their types only, so the slow-query log never holds their values.
+    """
+    if executemany:
+        rows = list(parameters)
+        return {"rows": len(rows), "row": parameter_shape(rows[0]) if rows else None}
+    if isinstance(parameters, Mapping):
+        return {str(key): type(value).__name__ for key, value in parameters.items()}
+    if isinstance(parameters, (list, tuple)):
+        types = [type(value).__name__ for value in parameters]
+        if len(types) > MAX_LISTED_PARAMETERS:
+            return {"count": len(types), "types": sorted(set(types))}
+        return types
+    return type(parameters).__name__
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _count_statement(conn, cursor, statement, parameters, context, executemany) -> None:
+    counter = _current_counter.get()
+    if counter is not None:
+        counter.increment()
+    context.monitoring_started_at = time.perf_counter()
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _time_statement(conn, cursor, statement, parameters, context, executemany) -> None:
+    duration = time.perf_counter() - context.monitoring_started_at
+    counter = _current_counter.get()
+    if counter is not None:
+        counter.record(duration, statement)
+
+    if _slow_query_threshold_seconds is not None and duration >= _slow_query_threshold_seconds:
+        record = {
+            "event": "slow_query",
+            "duration_ms": round(duration * 1000, 3),
+            "request": counter.label if counter is not None else None,
+            "statement": " ".join(statement.split())[:MAX_LOGGED_STATEMENT_LENGTH],
+            "parameters": parameter_shape(parameters, executemany),
+        }
+        slow_query_logger.warning(json.dumps(record), extra={"slow_query": record})
+
+
+@contextmanager
+def count_queries(label: Optional[str] = None) -> Iterator[QueryCounter]:
+    """
+    Count and time the SQL statements executed by any engine within the block.
+
+    The counter is bound to the current context, so concurrent requests are counted separately.
+    The `label`, e.g. the request method and path, is attached to slow-query log records.
+
+    Example:
+        with count_queries() as counter:
+            await client.get("/api/v1/movies/movies/1/")
+        assert counter.count == 4
+    """
+    counter = QueryCounter(parent=_current_counter.get(), label=label)
+    token = _current_counter.set(counter)
+    try:
+        yield counter
+    finally:
+        _current_counter.reset(token)
+
+
+@contextmanager
+def assert_max_queries(limit: int) -> Iterator[QueryCounter]:
+    """
+    Fail with an AssertionError if the block executes more than `limit` SQL statements.
+
+    Use it in tests to turn N+1 query regressions into failures.
+    """
+    with count_queries() as counter:
+        yield counter
+    if counter.count > limit:
+        raise AssertionError(f"Expected at most {limit} SQL statements, {counter.count} were executed.")
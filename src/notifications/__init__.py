@@ -0,0 +1,3 @@
+from notifications.renderer import EmailTemplateRenderer
+from notifications.mailer import SMTPConnectionPool
+from notifications.worker import EmailOutboxWorker
@@ -0,0 +1,85 @@
+import asyncio
+import smtplib
+from email.message import EmailMessage
+from typing import Optional
+
+
+class SMTPConnectionPool:
+    """
+    A fixed-size pool of SMTP connections shared by the outbox worker.
+
+    Connections are opened lazily, reused across messages and reopened once if the server
+    dropped them. `smtplib` is blocking, so every SMTP exchange runs in a worker thread and
+    never on the event loop; at most `pool_size` exchanges run at once.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        pool_size: int = 4,
+        username: Optional[str] = None,
+        password: Optional[str] = None,
+        use_tls: bool = False,
+        timeout_seconds: float = 10.0,
+    ) -> None:
+        self._host = host
+        self._port = port
+        self._username = username
+        self._password = password
+        self._use_tls = use_tls
+        self._timeout_seconds = timeout_seconds
+        self._slots: "asyncio.Queue[Optional[smtplib.SMTP]]" = asyncio.Queue()
+        for _ in range(pool_size):
+            self._slots.put_nowait(None)
+
+    async def send(self, message: EmailMessage) -> None:
+        """
+        Send a message over a pooled connection.
+
+        :raises smtplib.SMTPException, OSError: If the message could not be delivered.
+        """
+        connection = await self._slots.get()
+        try:
+            connection = await asyncio.to_thread(self._send, connection, message)
+        except (smtplib.SMTPException, OSError):
+            connection = None
+            raise
+        finally:
+            self._slots.put_nowait(connection)
+
+    async def close(self) -> None:
+        """
+        Close every idle connection of the pool.
+        """
+        while not self._slots.empty():
+            connection = self._slots.get_nowait()
+            if connection is not None:
+                await asyncio.to_thread(self._quit, connection)
+
+    def _send(self, connection: Optional[smtplib.SMTP], message: EmailMessage) -> smtplib.SMTP:
+        if connection is not None:
+            try:
+                connection.send_message(message)
+                return connection
+            except smtplib.SMTPServerDisconnected:
+                pass
+
+        connection = self._connect()
+        connection.send_message(message)
+        return connection
+
+    def _connect(self) -> smtplib.SMTP:
+        connection = smtplib.SMTP(self._host, self._port, timeout=self._timeout_seconds)
+        if self._use_tls:
+            connection.starttls()
+        if self._username:
+            connection.login(self._username, self._password or "")
+        return connection
+
+    @staticmethod
+    def _quit(connection: smtplib.SMTP) -> None:
+        try:
+            connection.quit()
+        except (smtplib.SMTPException, OSError):
+            connection.close()
@@ -0,0 +1,38 @@
+from pathlib import Path
+from string import Template
+from typing import Dict, Tuple
+
+EMAIL_SUBJECTS = {
+    "activation_request.html": "Activate your Online Cinema account",
+    "activation_complete.html": "Your Online Cinema account is active",
+    "password_reset_request.html": "Reset your Online Cinema password",
+    "password_reset_complete.html": "Your Online Cinema password was changed",
+}
+
+
+class EmailTemplateRenderer:
+    """
+    Render HTML email templates from `PATH_TO_EMAIL_TEMPLATES_DIR`.
+
+    Templates use `string.Template` placeholders (`$email`, `$activation_token`, ...). Each file is
+    read once and kept in memory. Missing placeholders raise `KeyError`, so a broken outbox row
+    fails loudly instead of mailing a half-rendered message.
+    """
+
+    def __init__(self, templates_dir: str) -> None:
+        self._templates_dir = Path(templates_dir)
+        self._templates: Dict[str, Template] = {}
+
+    def render(self, template_name: str, context: dict) -> Tuple[str, str]:
+        """
+        Render a template.
+
+        :return: The subject and the HTML body.
+        """
+        template = self._templates.get(template_name)
+        if template is None:
+            template = Template((self._templates_dir / template_name).read_text(encoding="utf-8"))
+            self._templates[template_name] = template
+
+        subject = EMAIL_SUBJECTS.get(template_name, "Online Cinema")
+        return subject, template.substitute(context)
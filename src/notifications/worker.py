@@ -0,0 +1,125 @@
+import asyncio
+import logging
+import smtplib
+from datetime import datetime, timedelta, timezone
+from email.message import EmailMessage
+from typing import Optional
+
+from sqlalchemy.orm import sessionmaker
+
+from crud import claim_outbox_batch, mark_emails_sent, mark_email_failed
+from database import EmailOutboxModel
+from notifications.mailer import SMTPConnectionPool
+from notifications.renderer import EmailTemplateRenderer
+
+logger = logging.getLogger(__name__)
+
+
+class EmailOutboxWorker:
+    """
+    Deliver emails from the outbox in the background.
+
+    Every `poll_interval_seconds` the worker claims a batch of due emails, renders them and
+    sends them concurrently over the SMTP connection pool, then records the outcome of the
+    whole batch in one transaction. A failed email is retried after an exponential backoff
+    of `backoff_seconds * 2 ** (attempts - 1)` and marked failed after `max_attempts`.
+
+    For local development any SMTP stand-in works, e.g. `python -m aiosmtpd -n -l localhost:1025`.
+    """
+
+    def __init__(
+        self,
+        session_factory: sessionmaker,
+        mailer: SMTPConnectionPool,
+        renderer: EmailTemplateRenderer,
+        sender: str,
+        batch_size: int = 50,
+        poll_interval_seconds: float = 2.0,
+        max_attempts: int = 5,
+        backoff_seconds: float = 30.0,
+        lease_seconds: float = 300.0,
+    ) -> None:
+        self._session_factory = session_factory
+        self._mailer = mailer
+        self._renderer = renderer
+        self._sender = sender
+        self._batch_size = batch_size
+        self._poll_interval_seconds = poll_interval_seconds
+        self._max_attempts = max_attempts
+        self._backoff_seconds = backoff_seconds
+        self._lease_seconds = lease_seconds
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name="email-outbox-worker")
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self._mailer.close()
+
+    async def deliver_batch(self) -> int:
+        """
+        Claim and deliver one batch of due emails.
+
+        :return: The number of claimed emails.
+        """
+        async with self._session_factory() as session:
+            emails = await claim_outbox_batch(session, self._batch_size, self._lease_seconds)
+            if not emails:
+                return 0
+
+            outcomes = await asyncio.gather(*(self._deliver(email) for email in emails))
+
+            sent_ids = [email.id for email, error in zip(emails, outcomes) if error is None]
+            await mark_emails_sent(session, sent_ids)
+            for email, error in zip(emails, outcomes):
+                if error is not None:
+                    await mark_email_failed(session, email.id, error, self._retry_at(email))
+            await session.commit()
+
+        failed = len(emails) - len(sent_ids)
+        if failed:
+            logger.warning("Email outbox batch: %d sent, %d failed.", len(sent_ids), failed)
+        return len(emails)
+
+    async def _deliver(self, email: EmailOutboxModel) -> Optional[str]:
+        try:
+            subject, html = self._renderer.render(email.template_name, email.context)
+        except (OSError, KeyError, ValueError) as error:
+            return f"Rendering failed: {error!r}"
+
+        message = EmailMessage()
+        message["From"] = self._sender
+        message["To"] = email.recipient
+        message["Subject"] = subject
+        message.set_content(html, subtype="html")
+
+        try:
+            await self._mailer.send(message)
+        except (smtplib.SMTPException, OSError) as error:
+            return f"Delivery failed: {error!r}"
+        return None
+
+    def _retry_at(self, email: EmailOutboxModel) -> Optional[datetime]:
+        if email.attempts >= self._max_attempts:
+            return None
+        delay = self._backoff_seconds * 2 ** (email.attempts - 1)
+        return datetime.now(timezone.utc) + timedelta(seconds=delay)
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                claimed = await self.deliver_batch()
+            except Exception:
+                # Keep polling after database outages; only cancellation ends the task.
+                logger.exception("Email outbox delivery failed.")
+                claimed = 0
+            if claimed < self._batch_size:
+                await asyncio.sleep(self._poll_interval_seconds)
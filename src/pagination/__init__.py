@@ -0,0 +1,5 @@
+from pagination.cursor import (
+    CursorDirection,
+    encode_cursor,
+    decode_cursor,
+)
@@ -0,0 +1,52 @@
+import base64
+import binascii
+import enum
+import json
+from typing import Any, List, Tuple
+
+from exceptions import InvalidCursorError
+
+
+class CursorDirection(str, enum.Enum):
+    NEXT = "next"
+    PREV = "prev"
+
+
+def encode_cursor(key: List[Any], direction: CursorDirection) -> str:
+    """
+    Encode a keyset position into an opaque, URL-safe cursor string.
+
+    Args:
+        key (List[Any]): The sort key values of the boundary row (JSON-serializable).
+        direction (CursorDirection): Whether the cursor points to the next or the previous page.
+
+    Returns:
+        str: The encoded cursor.
+    """
+    payload = json.dumps({"k": key, "d": direction.value}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[List[Any], CursorDirection]:
+    """
+    Decode a cursor produced by `encode_cursor`.
+
+    Args:
+        cursor (str): The opaque cursor received from the client.
+
+    Returns:
+        Tuple[List[Any], CursorDirection]: The sort key values and the paging direction.
+
+    Raises:
+        InvalidCursorError: If the cursor is malformed.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        key = payload["k"]
+        direction = CursorDirection(payload["d"])
+    except (binascii.Error, UnicodeDecodeError, ValueError, KeyError, TypeError):
+        raise InvalidCursorError
+    if not isinstance(key, list) or not key:
+        raise InvalidCursorError
+    return key, direction
@@ -0,0 +1,2 @@
+from ratelimit.bucket import TokenBucketLimiter
+from ratelimit.accounts import auth_ip_limiter, auth_email_limiter, limit_auth_requests
@@ -0,0 +1,59 @@
+import math
+from typing import Optional
+
+from fastapi import HTTPException, Request, status
+
+from config import get_settings
+from ratelimit.bucket import TokenBucketLimiter
+
+settings = get_settings()
+
+auth_ip_limiter = TokenBucketLimiter(
+    burst=settings.AUTH_RATE_LIMIT_IP_BURST,
+    refill_per_second=settings.AUTH_RATE_LIMIT_IP_REFILL_PER_SECOND,
+    max_keys=settings.AUTH_RATE_LIMIT_MAX_KEYS,
+)
+auth_email_limiter = TokenBucketLimiter(
+    burst=settings.AUTH_RATE_LIMIT_EMAIL_BURST,
+    refill_per_second=settings.AUTH_RATE_LIMIT_EMAIL_REFILL_PER_SECOND,
+    max_keys=settings.AUTH_RATE_LIMIT_MAX_KEYS,
+)
+
+
+async def limit_auth_requests(request: Request) -> None:
+    """
+    Admit a login or registration request only if both the client IP and the email have tokens left.
+
+    The email is read from the `username` form field (login) or the `email` JSON field
+    (registration). FastAPI has already parsed the body by the time dependencies run, so
+    reading it again costs no I/O, and a rejected request never reaches bcrypt.
+
+    :raises HTTPException: 429 with a `Retry-After` header when a bucket is empty.
+    """
+    client_ip = request.client.host if request.client else "unknown"
+    retry_after = auth_ip_limiter.acquire(client_ip)
+
+    if not retry_after:
+        email = await _request_email(request)
+        if email:
+            retry_after = auth_email_limiter.acquire(email.lower())
+
+    if retry_after:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Too many requests, please retry later.",
+            headers={"Retry-After": str(math.ceil(retry_after))},
+        )
+
+
+async def _request_email(request: Request) -> Optional[str]:
+    content_type = request.headers.get("content-type", "")
+    try:
+        if content_type.startswith("application/json"):
+            body = await request.json()
+            email = body.get("email") if isinstance(body, dict) else None
+        else:
+            email = (await request.form()).get("username")
+    except ValueError:
+        return None
+    return email if isinstance(email, str) else None
@@ -0,0 +1,65 @@
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Tuple
+
+
+class TokenBucketLimiter:
+    """
+    In-process token buckets keyed by an arbitrary value (client IP, email, ...).
+
+    Every key gets a bucket of `burst` tokens refilled at `refill_per_second`. A request takes
+    one token and is rejected when the bucket is empty. At most `max_keys` buckets are kept;
+    the least recently used one is dropped first, which only ever makes a key start over with
+    a full bucket. Meant to be used from a single event loop, it performs no locking.
+    """
+
+    def __init__(self, burst: int, refill_per_second: float, max_keys: int = 100_000) -> None:
+        self._burst = burst
+        self._refill_per_second = refill_per_second
+        self._max_keys = max_keys
+        self._buckets: "OrderedDict[Hashable, Tuple[float, float]]" = OrderedDict()
+        self.allowed = 0
+        self.rejected = 0
+
+    def acquire(self, key: Hashable) -> float:
+        """
+        Take a token from the bucket of `key`.
+
+        :return: 0 if the request is allowed, otherwise the seconds until a token is available.
+        """
+        now = time.monotonic()
+        tokens, updated_at = self._buckets.get(key, (float(self._burst), now))
+        tokens = min(float(self._burst), tokens + (now - updated_at) * self._refill_per_second)
+
+        if tokens >= 1:
+            tokens -= 1
+            retry_after = 0.0
+            self.allowed += 1
+        else:
+            retry_after = (1 - tokens) / self._refill_per_second if self._refill_per_second > 0 else float("inf")
+            self.rejected += 1
+
+        self._buckets[key] = (tokens, now)
+        self._buckets.move_to_end(key)
+        while len(self._buckets) > self._max_keys:
+            self._buckets.popitem(last=False)
+        return retry_after
+
+    def reset(self) -> None:
+        """
+        Drop every bucket. Counters are kept.
+        """
+        self._buckets.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Return the number of tracked keys and the allowed/rejected counters.
+        """
+        return {
+            "keys": len(self._buckets),
+            "max_keys": self._max_keys,
+            "burst": self._burst,
+            "refill_per_second": self._refill_per_second,
+            "allowed": self.allowed,
+            "rejected": self.rejected,
+        }
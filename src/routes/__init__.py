@@ -1,2 +1,4 @@
 from .accounts import router as accounts_router
 from .movies import router as movies_router
+from .internal import router as internal_router
+from .metrics import router as metrics_router
@@ -2,21 +2,24 @@ from typing import Annotated
 
 from fastapi import APIRouter, Depends, status, HTTPException
 from fastapi.security import OAuth2PasswordRequestForm
-from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from config import get_jwt_auth_manager, get_settings, BaseAppSettings
 from crud import (
     get_user_by_email,
-    get_user_group_by_name,
-    create_new_user,
+    get_user_group_id,
+    is_duplicate_email_error,
+    create_user_with_activation_token,
     get_activation_token,
     create_refresh_token,
     get_refresh_token,
-    get_user_by_id, create_activation_token,
+    get_user_by_id,
+    enqueue_email,
 )
 from database import get_db, UserGroupEnum
-from exceptions import BaseSecurityError
+from exceptions import BaseSecurityError, PasswordHashingError
+from ratelimit import limit_auth_requests
 from schemas import (
     UserRegistrationRequestSchema,
     UserRegistrationResponseSchema,
@@ -38,6 +41,7 @@ router = APIRouter()
     summary="User Registration",
     description="Register a new user with an email and password.",
     status_code=status.HTTP_201_CREATED,
+    dependencies=[Depends(limit_auth_requests)],
     responses={
         409: {
             "description": "Conflict - User with this email already exists.",
@@ -59,22 +63,47 @@ router = APIRouter()
                 }
             },
         },
+        429: {
+            "description": "Too Many Requests - The client IP or email exceeded its rate limit.",
+            "content": {
+                "application/json": {
+                    "example": {
+                        "detail": "Too many requests, please retry later."
+                    }
+                }
+            },
+        },
+        503: {
+            "description": "Service Unavailable - Password hashing is overloaded.",
+            "content": {
+                "application/json": {
+                    "example": {
+                        "detail": "Too many password operations in progress, please retry later."
+                    }
+                }
+            },
+        },
     }
 )
 async def register_user(
     user_data: UserRegistrationRequestSchema,
     db: AsyncSession = Depends(get_db),
+    settings: BaseAppSettings = Depends(get_settings),
 ):
     """
     Endpoint for user registration.
 
-    Registers a new user, hashes their password, and assigns them to the default user group.
-    If a user with the same email already exists, an HTTP 409 error is raised.
+    Registers a new user, hashes their password off the event loop, and assigns them to the default user group.
+    The user and their activation token are inserted in a single statement and transaction, and the
+    activation email is queued in the email outbox within the same transaction.
+    If a user with the same email already exists, the unique index on `users.email` rejects the insert
+    and an HTTP 409 error is raised.
     In case of any unexpected issues during the creation process, an HTTP 500 error is returned.
 
     Args:
         user_data (UserRegistrationRequestSchema): The registration details including email and password.
         db (AsyncSession): The asynchronous database session.
+        settings (BaseAppSettings): The application settings.
 
     Returns:
         UserRegistrationResponseSchema: The newly created user's details.
@@ -82,34 +111,45 @@ async def register_user(
     Raises:
         HTTPException:
             - 409 Conflict if a user with the same email exists.
+            - 429 Too Many Requests if the client IP or email exceeded its rate limit.
             - 500 Internal Server Error if an error occurs during user creation.
+            - 503 Service Unavailable if the password cannot be hashed in time.
     """
-    existing_user = await get_user_by_email(db, user_data.email)
-    if existing_user:
-        raise HTTPException(
-            status_code=status.HTTP_409_CONFLICT,
-            detail=f"A user with this email {user_data.email} already exists."
-        )
-
-    user_group = await get_user_group_by_name(db, UserGroupEnum.USER)
-    if not user_group:
+    user_group_id = await get_user_group_id(db, UserGroupEnum.USER)
+    if user_group_id is None:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Default user group not found."
         )
 
     try:
-        new_user = await create_new_user(db, user_data, user_group.id)
-        activation_token = await create_activation_token(db, new_user.id)
+        user_id, email, activation_token = await create_user_with_activation_token(
+            db, user_data, user_group_id, activation_email_template=settings.ACTIVATION_EMAIL_TEMPLATE_NAME
+        )
+    except PasswordHashingError as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(e)
+        ) from e
+    except IntegrityError as e:
+        if not is_duplicate_email_error(e):
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail="An error occurred during user creation."
+            ) from e
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"A user with this email {user_data.email} already exists."
+        ) from e
     except SQLAlchemyError as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="An error occurred during user creation."
         ) from e
     return {
-        "id": new_user.id,
-        "email": new_user.email,
-        "activation_token": activation_token.token,
+        "id": user_id,
+        "email": email,
+        "activation_token": activation_token,
     }
 
 
@@ -147,18 +187,21 @@ async def register_user(
 async def activate_account(
     activation_data: UserActivationRequestSchema,
     db: AsyncSession = Depends(get_db),
+    settings: BaseAppSettings = Depends(get_settings),
 ) -> MessageResponseSchema:
     """
     Endpoint to activate a user's account.
 
     This endpoint verifies the activation token for a user by checking that the token record exists
     and that it has not expired. If the token is valid and the user's account is not already active,
-    the user's account is activated and the activation token is deleted. If the token is invalid, expired,
-    or if the account is already active, an HTTP 400 error is raised.
+    the user's account is activated, the activation token is deleted and a confirmation email is queued
+    in the email outbox. If the token is invalid, expired, or if the account is already active,
+    an HTTP 400 error is raised.
 
     Args:
         activation_data (UserActivationRequestSchema): Contains the user's email and activation token.
         db (AsyncSession): The asynchronous database session.
+        settings (BaseAppSettings): The application settings.
 
     Returns:
         MessageResponseSchema: A response message confirming successful activation.
@@ -184,6 +227,12 @@ async def activate_account(
 
     user.is_active = True
     await db.delete(token_record)
+    enqueue_email(
+        db,
+        recipient=user.email,
+        template_name=settings.ACTIVATION_COMPLETE_EMAIL_TEMPLATE_NAME,
+        context={"email": user.email},
+    )
     await db.commit()
 
     return MessageResponseSchema(message="User account activated successfully.")
@@ -195,6 +244,7 @@ async def activate_account(
     summary="User Login",
     description="Authenticate a user and return access and refresh tokens.",
     status_code=status.HTTP_201_CREATED,
+    dependencies=[Depends(limit_auth_requests)],
     responses={
         401: {
             "description": "Unauthorized - Invalid email or password.",
@@ -226,6 +276,26 @@ async def activate_account(
                 }
             },
         },
+        429: {
+            "description": "Too Many Requests - The client IP or email exceeded its rate limit.",
+            "content": {
+                "application/json": {
+                    "example": {
+                        "detail": "Too many requests, please retry later."
+                    }
+                }
+            },
+        },
+        503: {
+            "description": "Service Unavailable - Password hashing is overloaded.",
+            "content": {
+                "application/json": {
+                    "example": {
+                        "detail": "Too many password operations in progress, please retry later."
+                    }
+                }
+            },
+        },
     },
 )
 async def login_user(
@@ -237,8 +307,11 @@ async def login_user(
     """
     Endpoint for user login.
 
-    Authenticates a user using their email and password.
+    Authenticates a user using their email and password. The password is verified on the
+    password process pool, so a login never blocks other requests. A hash made with an outdated
+    `BCRYPT_ROUNDS` cost is replaced on a successful login and saved with the refresh token.
     If authentication is successful, creates a new refresh token and returns both access and refresh tokens.
+    Only the newest `MAX_REFRESH_TOKENS_PER_USER` refresh tokens of the user are kept.
 
     Args:
         login_data (UserLoginRequestSchema): The login credentials.
@@ -253,11 +326,21 @@ async def login_user(
         HTTPException:
             - 401 Unauthorized if the email or password is invalid.
             - 403 Forbidden if the user account is not activated.
+            - 429 Too Many Requests if the client IP or email exceeded its rate limit.
             - 500 Internal Server Error if an error occurs during token creation.
+            - 503 Service Unavailable if the password cannot be verified in time.
     """
 
     user = await get_user_by_email(db, login_data.username)
-    if not user or not user.verify_password(login_data.password):
+    try:
+        password_valid = user is not None and await user.verify_password_async(login_data.password)
+    except PasswordHashingError as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(e)
+        ) from e
+
+    if not password_valid:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid email or password.",
@@ -276,7 +359,8 @@ async def login_user(
             db=db,
             user_id=user.id,
             days_valid=settings.LOGIN_TIME_DAYS,
-            jwt_refresh_token=jwt_refresh_token
+            jwt_refresh_token=jwt_refresh_token,
+            max_active_tokens=settings.MAX_REFRESH_TOKENS_PER_USER,
         )
     except SQLAlchemyError:
         raise HTTPException(
@@ -0,0 +1,68 @@
+from typing import Dict
+
+from fastapi import APIRouter, Request
+
+from cache import movie_detail_cache, access_token_cache
+from config import get_container
+from ratelimit import auth_ip_limiter, auth_email_limiter
+from schemas import CacheStatsSchema, RateLimiterStatsSchema, DatabasePoolStatsSchema
+
+router = APIRouter()
+
+
+@router.get(
+    "/cache/",
+    response_model=Dict[str, CacheStatsSchema],
+    summary="In-process cache statistics",
+    description="<h3>Report the size and hit/miss/eviction counters of this worker's caches.</h3>",
+)
+async def get_cache_stats() -> Dict[str, CacheStatsSchema]:
+    """
+    Return the statistics of every in-process cache of the current worker.
+
+    Returns:
+        Dict[str, CacheStatsSchema]: Cache statistics keyed by cache name.
+    """
+    return {
+        "movie_detail": CacheStatsSchema(**movie_detail_cache.stats()),
+        "access_token": CacheStatsSchema(**access_token_cache.stats()),
+    }
+
+
+@router.get(
+    "/rate-limits/",
+    response_model=Dict[str, RateLimiterStatsSchema],
+    summary="Rate limiter statistics",
+    description="<h3>Report the tracked keys and allowed/rejected counters of this worker's rate limiters.</h3>",
+)
+async def get_rate_limit_stats() -> Dict[str, RateLimiterStatsSchema]:
+    """
+    Return the statistics of every rate limiter of the current worker.
+
+    Returns:
+        Dict[str, RateLimiterStatsSchema]: Rate limiter statistics keyed by limiter name.
+    """
+    return {
+        "auth_ip": RateLimiterStatsSchema(**auth_ip_limiter.stats()),
+        "auth_email": RateLimiterStatsSchema(**auth_email_limiter.stats()),
+    }
+
+
+@router.get(
+    "/db-pool/",
+    response_model=DatabasePoolStatsSchema,
+    summary="Database connection pool statistics",
+    description="<h3>Report checked-out, idle and overflow connections and checkout wait times "
+                "of this worker's database pool.</h3>",
+)
+async def get_db_pool_stats(request: Request) -> DatabasePoolStatsSchema:
+    """
+    Return the statistics of the current worker's database connection pool.
+
+    Args:
+        request (Request): The incoming request, used to reach the application container.
+
+    Returns:
+        DatabasePoolStatsSchema: Connection counts and checkout wait times of the pool.
+    """
+    return DatabasePoolStatsSchema(**get_container(request).engine.pool.stats())
@@ -0,0 +1,18 @@
+from fastapi import APIRouter, Response
+
+from monitoring import render_metrics
+
+router = APIRouter()
+
+
+@router.get("/metrics", include_in_schema=False)
+async def get_metrics() -> Response:
+    """
+    Expose request metrics in the Prometheus text format.
+
+    With `PROMETHEUS_MULTIPROC_DIR` set, the samples of every worker process are aggregated.
+
+    Returns:
+        Response: The metrics of the application.
+    """
+    return render_metrics()
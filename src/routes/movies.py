@@ -1,21 +1,44 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
+from datetime import date
+from typing import Any, List, Optional, Tuple
+from urllib.parse import urlencode
+
+from fastapi import APIRouter, Body, Depends, HTTPException, Query, Response, Header, status
+from pydantic_core import to_json
+from sqlalchemy import RowMapping
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from cache import movie_detail_cache
+from config import get_settings, BaseAppSettings
+from counters import MoviesCountModeEnum, movies_counter, get_movies_total
 from crud import (
-    get_paginated_movies_list,
     get_movies_count,
+    get_paginated_movies_list,
+    get_movies_list_by_cursor,
+    search_movies,
     create_movie_in_db,
+    bulk_create_movies_in_db,
     get_movie_by_name_and_date,
     get_movie_by_id_from_db,
-    update_movie_in_db
+    get_movie_version,
+    update_movie_in_db,
+    delete_movie_in_db,
 )
-from database import get_db
+from database import get_db, get_read_db, is_primary_session
+from etags import make_etag, parse_etag_header, etag_matches
+from exceptions import InvalidCursorError
+from pagination import CursorDirection, encode_cursor, decode_cursor
 from schemas import (
     MovieListResponseSchema,
-    MovieListItemSchema,
+    MovieListFilterSchema,
+    MovieSortFieldEnum,
+    SortOrderEnum,
+    MovieSearchResponseSchema,
     MovieDetailSchema,
     MovieCreateSchema,
+    MovieBulkCreateStatusEnum,
+    MovieBulkCreateResultSchema,
+    MovieBulkCreateResponseSchema,
     MovieUpdateSchema
 )
 from security.http import get_current_user
@@ -32,8 +55,22 @@ router = APIRouter()
             "Clients can specify the `page` number and the number of items per page using `per_page`. "
             "The response includes details about the movies, total pages, and total items, "
             "along with links to the previous and next pages if applicable.</h3>"
+            "<p>Pass the opaque `cursor` from a `next_page`/`prev_page` link to page through the "
+            "catalog with keyset pagination: every page costs the same no matter how deep it is. "
+            "The first page links to cursor pages, explicit `page` numbers keep offset links.</p>"
+            "<p>Filter by `genre`, `actor`, `language`, `country`, a `year_from`/`year_to` release "
+            "range and a `score_min`/`score_max` range, and sort by `id`, `score`, `date` or "
+            "`revenue` in either `order`.</p>"
     ),
     responses={
+        400: {
+            "description": "Invalid pagination cursor.",
+            "content": {
+                "application/json": {
+                    "example": {"detail": "Invalid pagination cursor."}
+                }
+            },
+        },
         404: {
             "description": "No movies found.",
             "content": {
@@ -47,8 +84,24 @@ router = APIRouter()
 async def get_movie_list(
     page: int = Query(1, ge=1, description="Page number (1-based index)"),
     per_page: int = Query(10, ge=1, le=20, description="Number of items per page"),
-    db: AsyncSession = Depends(get_db),
-) -> MovieListResponseSchema:
+    cursor: Optional[str] = Query(None, description="Opaque keyset cursor taken from a page link"),
+    name_prefix: Optional[str] = Query(
+        None, min_length=1, max_length=255, description="Only movies whose name starts with this, ignoring case"
+    ),
+    genre: Optional[str] = Query(None, max_length=255, description="Only movies of this genre"),
+    actor: Optional[str] = Query(None, max_length=255, description="Only movies with this actor"),
+    language: Optional[str] = Query(None, max_length=255, description="Only movies in this language"),
+    country: Optional[str] = Query(None, max_length=3, description="Only movies from this country code"),
+    year_from: Optional[int] = Query(None, ge=1800, le=2100, description="Earliest release year"),
+    year_to: Optional[int] = Query(None, ge=1800, le=2100, description="Latest release year"),
+    score_min: Optional[float] = Query(None, ge=0, le=100, description="Minimum score"),
+    score_max: Optional[float] = Query(None, ge=0, le=100, description="Maximum score"),
+    sort_by: MovieSortFieldEnum = Query(MovieSortFieldEnum.ID, description="Field to sort movies by"),
+    order: SortOrderEnum = Query(SortOrderEnum.DESC, description="Sort order"),
+    if_none_match: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_read_db),
+    settings: BaseAppSettings = Depends(get_settings),
+) -> Response:
     """
     Fetch a paginated list of movies from the database (asynchronously).
 
@@ -56,40 +109,193 @@ async def get_movie_list(
     the page number and the number of items per page. It calculates the total pages
     and provides links to the previous and next pages when applicable.
 
+    Only the list columns are selected, as plain rows, and they are serialized straight
+    to JSON: the rows already match `MovieListResponseSchema`, so neither the ORM nor
+    response model validation runs on this hot path.
+
+    Every filter and sort field is backed by an index, with the id as a tie-breaker so
+    keyset cursors stay stable. Page links carry the active filters and sort.
+
     :param page: The page number to retrieve (1-based index, must be >= 1).
     :type page: int
     :param per_page: The number of items to display per page (must be between 1 and 20).
     :type per_page: int
-    :param db: The async SQLAlchemy database session (provided via dependency injection).
+    :param cursor: An opaque keyset cursor; when given, `page` is ignored.
+    :type cursor: Optional[str]
+    :param name_prefix: Only return movies whose name starts with this prefix, ignoring case.
+    :type name_prefix: Optional[str]
+    :param genre: Only return movies of this genre.
+    :type genre: Optional[str]
+    :param actor: Only return movies featuring this actor.
+    :type actor: Optional[str]
+    :param language: Only return movies in this language.
+    :type language: Optional[str]
+    :param country: Only return movies from this country code.
+    :type country: Optional[str]
+    :param year_from: Only return movies released in or after this year.
+    :type year_from: Optional[int]
+    :param year_to: Only return movies released in or before this year.
+    :type year_to: Optional[int]
+    :param score_min: Only return movies scored at least this much.
+    :type score_min: Optional[float]
+    :param score_max: Only return movies scored at most this much.
+    :type score_max: Optional[float]
+    :param sort_by: The field to sort movies by.
+    :type sort_by: MovieSortFieldEnum
+    :param order: The sort order.
+    :type order: SortOrderEnum
+    :param if_none_match: ETags the client already holds; a match yields `304 Not Modified`.
+    :type if_none_match: Optional[str]
+    :param db: The async SQLAlchemy read session, bound to a read replica when one is healthy
+        (provided via dependency injection).
     :type db: AsyncSession
+    :param settings: The application settings, used to pick how the total is counted.
+    :type settings: BaseAppSettings
 
-    :return: A response containing the paginated list of movies and metadata.
-    :rtype: MovieListResponseSchema
+    :return: A JSON response containing the paginated list of movies and metadata.
+    :rtype: Response
 
-    :raises HTTPException: Raises a 404 error if no movies are found for the requested page.
+    :raises HTTPException: Raises a 400 error if the cursor is malformed and
+        a 404 error if no movies are found for the requested page.
     """
-    offset = (page - 1) * per_page
-
-    total_items = await get_movies_count(db)
+    filters = MovieListFilterSchema(
+        name_prefix=name_prefix,
+        genre=genre,
+        actor=actor,
+        language=language,
+        country=country,
+        year_from=year_from,
+        year_to=year_to,
+        score_min=score_min,
+        score_max=score_max,
+    )
+    if filters.is_empty():
+        filters = None
+        total_items = await get_movies_total(db, MoviesCountModeEnum(settings.MOVIES_COUNT_MODE))
+    else:
+        total_items = await get_movies_count(db, filters)
     if not total_items:
         raise HTTPException(status_code=404, detail="No movies found.")
 
-    movies = await get_paginated_movies_list(db, offset, per_page)
+    total_pages = (total_items + per_page - 1) // per_page
+    link_params = _movie_list_link_params(per_page, filters, sort_by, order)
+
+    if cursor is None and page > 1:
+        offset = (page - 1) * per_page
+        movies = await get_paginated_movies_list(db, offset, per_page, filters, sort_by, order)
+        prev_page = _movie_list_link({**link_params, "page": page - 1})
+        next_page = _movie_list_link({**link_params, "page": page + 1}) if page < total_pages else None
+    else:
+        try:
+            after, direction = _decode_movie_cursor(cursor, sort_by) if cursor else (None, CursorDirection.NEXT)
+        except InvalidCursorError as error:
+            raise HTTPException(status_code=400, detail=str(error))
+
+        backward = direction == CursorDirection.PREV
+        movies = await get_movies_list_by_cursor(db, after, per_page, backward, filters, sort_by, order)
+        has_more = len(movies) > per_page
+        if has_more:
+            movies = movies[1:] if backward else movies[:per_page]
+
+        has_prev = has_more if backward else after is not None
+        has_next = has_more if not backward else True
+        prev_page = (
+            _movie_cursor_link(link_params, _movie_cursor_key(movies[0], sort_by), CursorDirection.PREV)
+            if movies and has_prev else None
+        )
+        next_page = (
+            _movie_cursor_link(link_params, _movie_cursor_key(movies[-1], sort_by), CursorDirection.NEXT)
+            if movies and has_next else None
+        )
+
     if not movies:
         raise HTTPException(status_code=404, detail="No movies found.")
 
-    movie_list = [MovieListItemSchema.model_validate(movie) for movie in movies]
+    movie_list = [dict(movie) for movie in movies]
+    for movie in movie_list:
+        movie.pop("sort_key", None)
+    versions = [f"{movie['id']}:{movie.pop('version')}" for movie in movie_list]
+    etag = make_etag(total_items, prev_page, next_page, *versions)
+    if etag_matches(etag, if_none_match, weak=True):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+
+    response = {
+        "movies": movie_list,
+        "prev_page": prev_page,
+        "next_page": next_page,
+        "total_pages": total_pages,
+        "total_items": total_items,
+    }
+    return _json_response(response, headers={"ETag": etag})
 
-    total_pages = (total_items + per_page - 1) // per_page
 
-    response = MovieListResponseSchema(
-        movies=movie_list,
-        prev_page=f"/theater/movies/?page={page - 1}&per_page={per_page}" if page > 1 else None,
-        next_page=f"/theater/movies/?page={page + 1}&per_page={per_page}" if page < total_pages else None,
-        total_pages=total_pages,
-        total_items=total_items,
-    )
-    return response
+@router.get(
+    "/movies/search/",
+    response_model=MovieSearchResponseSchema,
+    summary="Search movies by name and overview",
+    description=(
+            "<h3>Full-text search over movie names and overviews, ordered by relevance.</h3>"
+            "<p>The query `q` supports web-search syntax: quoted phrases, `or` and `-excluded` words. "
+            "Matches in the name rank above matches in the overview. Follow the opaque `next_page` "
+            "link to get further results.</p>"
+    ),
+    responses={
+        400: {
+            "description": "Invalid pagination cursor.",
+            "content": {
+                "application/json": {
+                    "example": {"detail": "Invalid pagination cursor."}
+                }
+            },
+        },
+    }
+)
+async def search_movie_list(
+    q: str = Query(..., min_length=1, max_length=255, description="Search query"),
+    per_page: int = Query(10, ge=1, le=20, description="Number of items per page"),
+    cursor: Optional[str] = Query(None, description="Opaque keyset cursor taken from a page link"),
+    db: AsyncSession = Depends(get_db),
+) -> Response:
+    """
+    Search movies by name and overview with PostgreSQL full-text search.
+
+    The search runs on the GIN-indexed `search_vector` column and pages with a keyset on
+    `(rank, id)`, so the cost of a page does not depend on its depth.
+
+    :param q: The web-search style query.
+    :type q: str
+    :param per_page: The number of items to display per page (must be between 1 and 20).
+    :type per_page: int
+    :param cursor: An opaque keyset cursor taken from a previous `next_page` link.
+    :type cursor: Optional[str]
+    :param db: The async SQLAlchemy database session (provided via dependency injection).
+    :type db: AsyncSession
+
+    :return: A JSON response with the matching movies and the link to the next page.
+    :rtype: Response
+
+    :raises HTTPException: Raises a 400 error if the cursor is malformed.
+    """
+    after = None
+    if cursor:
+        try:
+            after = _decode_search_cursor(cursor)
+        except InvalidCursorError as error:
+            raise HTTPException(status_code=400, detail=str(error))
+
+    movies = await search_movies(db, q, after, per_page)
+    next_page = None
+    if len(movies) > per_page:
+        movies = movies[:per_page]
+        last = movies[-1]
+        next_cursor = encode_cursor([last["rank"], last["id"]], CursorDirection.NEXT)
+        next_page = f"/theater/movies/search/?{urlencode({'q': q, 'cursor': next_cursor, 'per_page': per_page})}"
+
+    movie_list = [dict(movie) for movie in movies]
+    for movie in movie_list:
+        del movie["version"], movie["rank"]
+
+    return _json_response({"movies": movie_list, "next_page": next_page})
 
 
 @router.post(
@@ -119,6 +325,7 @@ async def get_movie_list(
 )
 async def create_movie(
     movie_data: MovieCreateSchema,
+    response: Response,
     db: AsyncSession = Depends(get_db),
     user: dict = Depends(get_current_user),
 ):
@@ -131,6 +338,8 @@ async def create_movie(
 
     :param movie_data: The data required to create a new movie.
     :type movie_data: MovieCreateSchema
+    :param response: The outgoing response, used to set the `ETag` header.
+    :type response: Response
     :param db: The SQLAlchemy async database session (provided via dependency injection).
     :type db: AsyncSession
     :param user: The current user to create the movie in.
@@ -154,11 +363,93 @@ async def create_movie(
         )
 
     try:
-        return await create_movie_in_db(db, movie_data)
+        movie = await create_movie_in_db(db, movie_data)
+    except IntegrityError:
+        raise HTTPException(status_code=400, detail="Invalid input data.")
 
+    movies_counter.increment()
+    response.headers["ETag"] = _movie_etag(movie.id, movie.version)
+    return movie
+
+
+@router.post(
+    "/movies/bulk/",
+    response_model=MovieBulkCreateResponseSchema,
+    summary="Add many movies at once",
+    description=(
+        "<h3>This endpoint adds an array of movies in a single transaction. "
+        "Reference entities are created or linked for the whole batch at once.</h3>"
+        "<p>The response holds one result per item, in input order. An item that duplicates "
+        "an existing movie, or an earlier item of the batch, by name and release date is "
+        "reported as a `conflict` and the rest of the batch is still created.</p>"
+    ),
+    responses={
+        400: {
+            "description": "Invalid input.",
+            "content": {
+                "application/json": {
+                    "example": {"detail": "Invalid input data."}
+                }
+            },
+        },
+        413: {
+            "description": "Too many movies in one request.",
+            "content": {
+                "application/json": {
+                    "example": {"detail": "At most 1000 movies can be created at once."}
+                }
+            },
+        },
+    },
+)
+async def bulk_create_movies(
+    movies_data: List[MovieCreateSchema] = Body(..., min_length=1),
+    db: AsyncSession = Depends(get_db),
+    settings: BaseAppSettings = Depends(get_settings),
+    user: dict = Depends(get_current_user),
+) -> MovieBulkCreateResponseSchema:
+    """
+    Add many movies to the database at once. Only authenticated users can do this.
+
+    :param movies_data: The movies to create.
+    :type movies_data: List[MovieCreateSchema]
+    :param db: The SQLAlchemy async database session (provided via dependency injection).
+    :type db: AsyncSession
+    :param settings: The application settings, used to cap the batch size.
+    :type settings: BaseAppSettings
+    :param user: The current user to create the movies in.
+
+    :return: The number of created and conflicting movies and a result for each item.
+    :rtype: MovieBulkCreateResponseSchema
+
+    :raises HTTPException:
+        - 413 if the batch is larger than `MOVIES_BULK_CREATE_MAX_ITEMS`.
+        - 400 if input data is invalid (e.g., violating a constraint).
+    """
+    if len(movies_data) > settings.MOVIES_BULK_CREATE_MAX_ITEMS:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"At most {settings.MOVIES_BULK_CREATE_MAX_ITEMS} movies can be created at once."
+        )
+
+    try:
+        movie_ids = await bulk_create_movies_in_db(db, movies_data)
     except IntegrityError:
         raise HTTPException(status_code=400, detail="Invalid input data.")
 
+    results = [
+        MovieBulkCreateResultSchema(
+            index=index,
+            status=MovieBulkCreateStatusEnum.CONFLICT if movie_id is None else MovieBulkCreateStatusEnum.CREATED,
+            id=movie_id,
+        )
+        for index, movie_id in enumerate(movie_ids)
+    ]
+    created = sum(movie_id is not None for movie_id in movie_ids)
+    movies_counter.increment(created)
+
+    return MovieBulkCreateResponseSchema(created=created, conflicts=len(movie_ids) - created, results=results)
+
 
 @router.get(
     "/movies/{movie_id}/",
@@ -171,6 +462,9 @@ async def create_movie(
             "ID is not found, a 404 error will be returned.</h3>"
     ),
     responses={
+        304: {
+            "description": "Not Modified - the movie matches the `If-None-Match` ETag.",
+        },
         404: {
             "description": "Movie not found.",
             "content": {
@@ -183,33 +477,57 @@ async def create_movie(
 )
 async def get_movie_by_id(
     movie_id: int,
-    db: AsyncSession = Depends(get_db),
-):
+    if_none_match: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_read_db),
+) -> Response:
     """
     Retrieve detailed information about a specific movie by its ID.
 
     This function fetches detailed information about a movie identified by its unique ID.
     If the movie does not exist, a 404 error is returned.
 
+    Serialized payloads are kept in an in-process LRU cache with a TTL; movie writes
+    handled by this worker invalidate their entry explicitly, and a payload read before such
+    a write is not cached. Only payloads read from the primary are cached, so a lagging replica
+    cannot put an old version back after a write. The response carries a strong ETag built from
+    the movie version.
+
     :param movie_id: The unique identifier of the movie to retrieve.
     :type movie_id: int
-    :param db: The SQLAlchemy database session (provided via dependency injection).
+    :param if_none_match: ETags the client already holds; a match yields `304 Not Modified`.
+    :type if_none_match: Optional[str]
+    :param db: The SQLAlchemy read session, bound to a read replica when one is healthy
+        (provided via dependency injection).
     :type db: AsyncSession
 
     :return: The details of the requested movie.
-    :rtype: MovieDetailResponseSchema
+    :rtype: Response
 
     :raises HTTPException: Raises a 404 error if the movie with the given ID is not found.
     """
-    movie = await get_movie_by_id_from_db(db, movie_id, joined=True)
+    cached = movie_detail_cache.get(movie_id)
+    if cached is None:
+        generation = movie_detail_cache.generation()
+        movie = await get_movie_by_id_from_db(db, movie_id, joined=True)
+
+        if not movie:
+            raise HTTPException(
+                status_code=404,
+                detail="Movie with the given ID was not found."
+            )
 
-    if not movie:
-        raise HTTPException(
-            status_code=404,
-            detail="Movie with the given ID was not found."
+        cached = (
+            _movie_etag(movie.id, movie.version),
+            MovieDetailSchema.model_validate(movie).model_dump_json().encode(),
         )
+        if is_primary_session(db):
+            movie_detail_cache.set(movie_id, cached, generation=generation)
 
-    return movie
+    etag, payload = cached
+    if etag_matches(etag, if_none_match, weak=True):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+
+    return Response(content=payload, headers={"ETag": etag}, media_type="application/json")
 
 
 @router.delete(
@@ -219,6 +537,8 @@ async def get_movie_by_id(
             "<h3>Delete a specific movie from the database by its unique ID.</h3>"
             "<p>If the movie exists, it will be deleted. If it does not exist, "
             "a 404 error will be returned.</p>"
+            "<p>Send the movie ETag in `If-Match` to delete it only if it was not modified "
+            "in the meantime.</p>"
     ),
     responses={
         204: {
@@ -232,11 +552,20 @@ async def get_movie_by_id(
                 }
             },
         },
+        412: {
+            "description": "Precondition Failed - the movie was modified since the `If-Match` ETag.",
+            "content": {
+                "application/json": {
+                    "example": {"detail": "Movie was modified by another request."}
+                }
+            },
+        },
     },
     status_code=204
 )
 async def delete_movie(
     movie_id: int,
+    if_match: Optional[str] = Header(None),
     db: AsyncSession = Depends(get_db),
     user: dict = Depends(get_current_user),
 ):
@@ -248,25 +577,25 @@ async def delete_movie(
 
     :param movie_id: The unique identifier of the movie to delete.
     :type movie_id: int
+    :param if_match: ETags of the movie versions the client expects to delete.
+    :type if_match: Optional[str]
     :param db: The SQLAlchemy database session (provided via dependency injection).
     :type db: AsyncSession
     :param user: The current user to delete the movie in.
 
-    :raises HTTPException: Raises a 404 error if the movie with the given ID is not found.
+    :raises HTTPException: Raises a 404 error if the movie with the given ID is not found
+        and a 412 error if it does not match the `If-Match` ETag.
 
     :return: A response indicating the successful deletion of the movie.
     :rtype: None
     """
-    movie = await get_movie_by_id_from_db(db, movie_id)
+    deleted = await delete_movie_in_db(db, movie_id, _if_match_versions(movie_id, if_match))
+    movie_detail_cache.invalidate(movie_id)
 
-    if not movie:
-        raise HTTPException(
-            status_code=404,
-            detail="Movie with the given ID was not found."
-        )
+    if not deleted:
+        await _raise_movie_write_failed(db, movie_id)
 
-    await db.delete(movie)
-    await db.commit()
+    movies_counter.decrement()
 
     return {"detail": "Movie deleted successfully."}
 
@@ -278,6 +607,8 @@ async def delete_movie(
             "<h3>Update details of a specific movie by its unique ID.</h3>"
             "<p>This endpoint updates the details of an existing movie. If the movie with "
             "the given ID does not exist, a 404 error is returned.</p>"
+            "<p>Send the movie ETag in `If-Match` to update it only if it was not modified "
+            "in the meantime; the new ETag is returned in the `ETag` header.</p>"
     ),
     responses={
         200: {
@@ -296,11 +627,21 @@ async def delete_movie(
                 }
             },
         },
+        412: {
+            "description": "Precondition Failed - the movie was modified since the `If-Match` ETag.",
+            "content": {
+                "application/json": {
+                    "example": {"detail": "Movie was modified by another request."}
+                }
+            },
+        },
     }
 )
 async def update_movie(
     movie_id: int,
     movie_data: MovieUpdateSchema,
+    response: Response,
+    if_match: Optional[str] = Header(None),
     db: AsyncSession = Depends(get_db),
     user: dict = Depends(get_current_user),
 ):
@@ -314,26 +655,145 @@ async def update_movie(
     :type movie_id: int
     :param movie_data: The updated data for the movie.
     :type movie_data: MovieUpdateSchema
+    :param response: The outgoing response, used to set the new `ETag` header.
+    :type response: Response
+    :param if_match: ETags of the movie versions the client expects to update.
+    :type if_match: Optional[str]
     :param db: The SQLAlchemy database session (provided via dependency injection).
     :type db: AsyncSession
     :param user: The current user to update the movie in.
 
-    :raises HTTPException: Raises a 404 error if the movie with the given ID is not found.
+    :raises HTTPException: Raises a 404 error if the movie with the given ID is not found
+        and a 412 error if it does not match the `If-Match` ETag.
 
     :return: A response indicating the successful update of the movie.
     :rtype: None
     """
-    movie = await get_movie_by_id_from_db(db, movie_id)
+    try:
+        new_version = await update_movie_in_db(db, movie_id, movie_data, _if_match_versions(movie_id, if_match))
+    except IntegrityError:
+        raise HTTPException(status_code=400, detail="Invalid input data.")
+    finally:
+        movie_detail_cache.invalidate(movie_id)
+
+    if new_version is None:
+        await _raise_movie_write_failed(db, movie_id)
+
+    response.headers["ETag"] = _movie_etag(movie_id, new_version)
+    return {"detail": "Movie updated successfully."}
+
+
+def _decode_movie_cursor(cursor: str, sort_by: MovieSortFieldEnum) -> Tuple[List[Any], CursorDirection]:
+    """
+    Decode a movie list cursor into the keyset boundary for `sort_by`.
 
-    if not movie:
+    The key is `[id]` when sorting by id and `[sort value, id]` otherwise; dates travel as ISO strings.
+    """
+    key, direction = decode_cursor(cursor)
+    if not isinstance(key[-1], int):
+        raise InvalidCursorError
+    if sort_by == MovieSortFieldEnum.ID:
+        if len(key) != 1:
+            raise InvalidCursorError
+        return key, direction
+
+    if len(key) != 2:
+        raise InvalidCursorError
+    sort_value, movie_id = key
+    if sort_by == MovieSortFieldEnum.DATE:
+        try:
+            sort_value = date.fromisoformat(sort_value)
+        except (TypeError, ValueError):
+            raise InvalidCursorError
+    elif isinstance(sort_value, bool) or not isinstance(sort_value, (int, float)):
+        raise InvalidCursorError
+    return [sort_value, movie_id], direction
+
+
+def _decode_search_cursor(cursor: str) -> Tuple[float, int]:
+    key, direction = decode_cursor(cursor)
+    if (
+        direction != CursorDirection.NEXT
+        or len(key) != 2
+        or not isinstance(key[0], (int, float))
+        or not isinstance(key[1], int)
+    ):
+        raise InvalidCursorError
+    return float(key[0]), key[1]
+
+
+def _movie_cursor_key(movie: RowMapping, sort_by: MovieSortFieldEnum) -> List[Any]:
+    if sort_by == MovieSortFieldEnum.ID:
+        return [movie["id"]]
+    sort_value = movie["sort_key"]
+    if isinstance(sort_value, date):
+        sort_value = sort_value.isoformat()
+    return [sort_value, movie["id"]]
+
+
+def _movie_list_link_params(
+    per_page: int,
+    filters: Optional[MovieListFilterSchema],
+    sort_by: MovieSortFieldEnum,
+    order: SortOrderEnum,
+) -> dict:
+    params = {"per_page": per_page}
+    if filters is not None:
+        params.update(filters.model_dump(exclude_none=True))
+    if sort_by != MovieSortFieldEnum.ID:
+        params["sort_by"] = sort_by.value
+    if order != SortOrderEnum.DESC:
+        params["order"] = order.value
+    return params
+
+
+def _movie_list_link(params: dict) -> str:
+    return f"/theater/movies/?{urlencode(params)}"
+
+
+def _movie_cursor_link(params: dict, key: List[Any], direction: CursorDirection) -> str:
+    return _movie_list_link({"cursor": encode_cursor(key, direction), **params})
+
+
+def _json_response(content: dict, status_code: int = 200, headers: Optional[dict] = None) -> Response:
+    return Response(content=to_json(content), status_code=status_code, headers=headers, media_type="application/json")
+
+
+def _movie_etag(movie_id: int, version: int) -> str:
+    return make_etag(movie_id, version)
+
+
+async def _raise_movie_write_failed(db: AsyncSession, movie_id: int) -> None:
+    """
+    Explain why a conditional write matched no row: the movie is missing or its version changed.
+    """
+    if await get_movie_version(db, movie_id) is None:
         raise HTTPException(
             status_code=404,
             detail="Movie with the given ID was not found."
         )
+    raise HTTPException(
+        status_code=status.HTTP_412_PRECONDITION_FAILED,
+        detail="Movie was modified by another request."
+    )
 
-    try:
-        await update_movie_in_db(db, movie, movie_data)
-    except IntegrityError:
-        raise HTTPException(status_code=400, detail="Invalid input data.")
 
-    return {"detail": "Movie updated successfully."}
+def _if_match_versions(movie_id: int, if_match: Optional[str]) -> Optional[List[int]]:
+    """
+    Extract the movie versions listed in an `If-Match` header.
+
+    Returns None when the header is absent or is the `*` wildcard, meaning any version matches.
+    Weak tags and tags of other movies are ignored, as `If-Match` uses strong comparison.
+    """
+    tags = parse_etag_header(if_match)
+    if not tags or "*" in tags:
+        return None
+
+    versions = []
+    for tag in tags:
+        if tag.startswith("W/"):
+            continue
+        tag_movie_id, _, version = tag.strip('"').partition("-")
+        if tag_movie_id == str(movie_id) and version.isdigit():
+            versions.append(int(version))
+    return versions
@@ -11,7 +11,15 @@ from schemas.accounts import (
 from schemas.movies import (
     MovieListResponseSchema,
     MovieListItemSchema,
+    MovieListFilterSchema,
+    MovieSortFieldEnum,
+    SortOrderEnum,
+    MovieSearchResponseSchema,
     MovieDetailSchema,
     MovieCreateSchema,
+    MovieBulkCreateStatusEnum,
+    MovieBulkCreateResultSchema,
+    MovieBulkCreateResponseSchema,
     MovieUpdateSchema
 )
+from schemas.internal import CacheStatsSchema, RateLimiterStatsSchema, DatabasePoolStatsSchema
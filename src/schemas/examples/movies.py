@@ -18,6 +18,13 @@ movie_list_response_schema_example = {
     "total_items": 9933
 }
 
+movie_search_response_schema_example = {
+    "movies": [
+        movie_item_schema_example
+    ],
+    "next_page": "/theater/movies/search/?q=princess&cursor=eyJrIjpbMC4xLDk5MzNdLCJkIjoibmV4dCJ9&per_page=1"
+}
+
 movie_create_schema_example = {
     "name": "New Movie",
     "date": "2025-01-01",
@@ -32,6 +39,15 @@ movie_create_schema_example = {
     "languages": ["English", "French"]
 }
 
+movie_bulk_create_response_schema_example = {
+    "created": 1,
+    "conflicts": 1,
+    "results": [
+        {"index": 0, "status": "created", "id": 9934},
+        {"index": 1, "status": "conflict", "id": None},
+    ]
+}
+
 
 language_schema_example = {
     "id": 1,
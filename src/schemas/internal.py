@@ -0,0 +1,32 @@
+from pydantic import BaseModel
+
+
+class CacheStatsSchema(BaseModel):
+    size: int
+    maxsize: int
+    hits: int
+    misses: int
+    evictions: int
+    hit_ratio: float
+
+
+class RateLimiterStatsSchema(BaseModel):
+    keys: int
+    max_keys: int
+    burst: int
+    refill_per_second: float
+    allowed: int
+    rejected: int
+
+
+class DatabasePoolStatsSchema(BaseModel):
+    pool_size: int
+    max_overflow: int
+    checked_out: int
+    idle: int
+    overflow: int
+    checkouts: int
+    timeouts: int
+    wait_seconds_total: float
+    wait_seconds_max: float
+    wait_seconds_avg: float
@@ -1,4 +1,5 @@
 from datetime import date, datetime
+from enum import Enum
 from typing import Optional, List
 
 from pydantic import BaseModel, Field, field_validator, ConfigDict
@@ -11,7 +12,9 @@ from schemas.examples.movies import (
     actor_schema_example,
     movie_item_schema_example,
     movie_list_response_schema_example,
+    movie_search_response_schema_example,
     movie_create_schema_example,
+    movie_bulk_create_response_schema_example,
     movie_detail_schema_example,
     movie_update_schema_example
 )
@@ -109,6 +112,43 @@ class MovieDetailSchema(MovieBaseSchema):
     languages: List[LanguageSchema]
 
 
+class MovieSortFieldEnum(str, Enum):
+    ID = "id"
+    SCORE = "score"
+    DATE = "date"
+    REVENUE = "revenue"
+
+
+class SortOrderEnum(str, Enum):
+    ASC = "asc"
+    DESC = "desc"
+
+
+class MovieListFilterSchema(BaseModel):
+    name_prefix: Optional[str] = None
+    genre: Optional[str] = None
+    actor: Optional[str] = None
+    language: Optional[str] = None
+    country: Optional[str] = None
+    year_from: Optional[int] = None
+    year_to: Optional[int] = None
+    score_min: Optional[float] = None
+    score_max: Optional[float] = None
+
+    @field_validator("country")
+    @classmethod
+    def normalize_country(cls, value: Optional[str]) -> Optional[str]:
+        return value.upper() if value else value
+
+    @field_validator("genre", "actor", "language")
+    @classmethod
+    def normalize_names(cls, value: Optional[str]) -> Optional[str]:
+        return value.title() if value else value
+
+    def is_empty(self) -> bool:
+        return not self.model_dump(exclude_none=True)
+
+
 class MovieListItemSchema(BaseModel):
     model_config = ConfigDict(
         from_attributes=True,
@@ -135,6 +175,16 @@ class MovieListResponseSchema(BaseModel):
     total_items: int
 
 
+class MovieSearchResponseSchema(BaseModel):
+    model_config = ConfigDict(
+        from_attributes=True,
+        json_schema_extra={"examples": [movie_search_response_schema_example]}
+    )
+
+    movies: List[MovieListItemSchema]
+    next_page: Optional[str]
+
+
 class MovieCreateSchema(BaseModel):
     model_config = ConfigDict(
         from_attributes=True,
@@ -164,6 +214,27 @@ class MovieCreateSchema(BaseModel):
         return [item.title() for item in value]
 
 
+class MovieBulkCreateStatusEnum(str, Enum):
+    CREATED = "created"
+    CONFLICT = "conflict"
+
+
+class MovieBulkCreateResultSchema(BaseModel):
+    index: int
+    status: MovieBulkCreateStatusEnum
+    id: Optional[int] = None
+
+
+class MovieBulkCreateResponseSchema(BaseModel):
+    model_config = ConfigDict(
+        json_schema_extra={"examples": [movie_bulk_create_response_schema_example]}
+    )
+
+    created: int
+    conflicts: int
+    results: List[MovieBulkCreateResultSchema]
+
+
 class MovieUpdateSchema(BaseModel):
     model_config = ConfigDict(
         from_attributes=True,
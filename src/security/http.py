@@ -1,13 +1,21 @@
+import hashlib
+import time
 from typing import Annotated
 
 from fastapi import HTTPException, status, Depends
 from fastapi.security import OAuth2PasswordBearer
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from config import get_jwt_auth_manager
+from cache import access_token_cache
+from config import get_jwt_auth_manager, get_settings
+from crud import get_active_user_group
+from database import get_db, UserGroupEnum
 from exceptions import BaseSecurityError
 from security.interfaces import JWTAuthManagerInterface
 
 
+settings = get_settings()
+
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/accounts/login/")
 
 
@@ -15,12 +23,50 @@ async def get_current_user(
     token: Annotated[str, Depends(oauth2_scheme)],
     jwt_manager: JWTAuthManagerInterface = Depends(get_jwt_auth_manager),
 ):
-    try:
-        decoded_token = jwt_manager.decode_access_token(token)
-        user_id = decoded_token.get("user_id")
-    except BaseSecurityError as error:
+    """
+    Resolve the user of a bearer access token.
+
+    Decoded claims are cached under the SHA-256 digest of the token until the token expires,
+    so a client reusing one token pays for signature verification once. The raw token is
+    never kept in memory. Only successfully verified tokens are cached, and the cache key
+    includes the fingerprint of the verifying key, so rotating the access token key stops
+    tokens signed with the old one at once.
+    """
+    cache_key = (jwt_manager.access_key_id, hashlib.sha256(token.encode()).digest())
+    decoded_token = access_token_cache.get(cache_key)
+    if decoded_token is None:
+        try:
+            decoded_token = jwt_manager.decode_access_token(token)
+        except BaseSecurityError as error:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=str(error),
+            )
+
+        expires_at = decoded_token.get("exp")
+        if isinstance(expires_at, (int, float)):
+            access_token_cache.set(
+                cache_key,
+                decoded_token,
+                ttl_seconds=min(expires_at - time.time(), settings.ACCESS_TOKEN_CACHE_TTL_SECONDS),
+            )
+
+    return {"id": decoded_token.get("user_id")}
+
+
+async def get_current_admin(
+    user: dict = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Resolve the user of a bearer access token and require an active account in the admin group.
+
+    The group is read from the database on every call, so revoking admin rights takes effect
+    without waiting for the access token to expire.
+    """
+    if await get_active_user_group(db, user["id"]) != UserGroupEnum.ADMIN:
         raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(error),
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Administrator rights are required.",
         )
-    return {"id": user_id}
+    return user
@@ -50,3 +50,11 @@ class JWTAuthManagerInterface(ABC):
         Verify an access token or raise an error if invalid.
         """
         pass
+
+    @property
+    @abstractmethod
+    def access_key_id(self) -> str:
+        """
+        Identify the key that access tokens are verified with, without revealing it.
+        """
+        pass
@@ -0,0 +1,77 @@
+"""
+Calibrate the bcrypt cost factor for the current machine.
+
+Measures how long a bcrypt verification takes at each cost factor and picks the highest one
+whose verification stays within the target latency. Deploy the result as `BCRYPT_ROUNDS`;
+existing hashes are upgraded or downgraded to it as users log in.
+
+    python -m security.password_policy --target-ms 250
+"""
+import argparse
+import statistics
+import time
+from typing import Dict, Tuple
+
+from security.passwords import build_password_context
+
+MIN_BCRYPT_ROUNDS = 10
+MAX_BCRYPT_ROUNDS = 16
+CALIBRATION_PASSWORD = "Calibration-Password1!"
+
+
+def measure_verify_ms(rounds: int, samples: int = 3) -> float:
+    """
+    Return the median time, in milliseconds, of one bcrypt verification at `rounds`.
+    """
+    context = build_password_context(rounds)
+    hashed_password = context.hash(CALIBRATION_PASSWORD)
+
+    timings = []
+    for _ in range(samples):
+        start = time.perf_counter()
+        context.verify(CALIBRATION_PASSWORD, hashed_password)
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+def calibrate_bcrypt_rounds(
+    target_ms: float,
+    min_rounds: int = MIN_BCRYPT_ROUNDS,
+    max_rounds: int = MAX_BCRYPT_ROUNDS,
+    samples: int = 3,
+) -> Tuple[int, Dict[int, float]]:
+    """
+    Pick the highest cost factor whose verification takes at most `target_ms`.
+
+    Each extra round doubles the cost, so the search stops at the first cost factor over the
+    target. Never returns less than `min_rounds`, even on a machine too slow to meet the target.
+
+    :return: The chosen cost factor and the measured milliseconds per cost factor.
+    """
+    timings: Dict[int, float] = {}
+    chosen = min_rounds
+    for rounds in range(min_rounds, max_rounds + 1):
+        timings[rounds] = measure_verify_ms(rounds, samples)
+        if timings[rounds] > target_ms:
+            break
+        chosen = rounds
+    return chosen, timings
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--target-ms", type=float, default=250.0, help="Target verification latency")
+    parser.add_argument("--min-rounds", type=int, default=MIN_BCRYPT_ROUNDS)
+    parser.add_argument("--max-rounds", type=int, default=MAX_BCRYPT_ROUNDS)
+    parser.add_argument("--samples", type=int, default=3)
+    args = parser.parse_args()
+
+    chosen, timings = calibrate_bcrypt_rounds(args.target_ms, args.min_rounds, args.max_rounds, args.samples)
+    for rounds, elapsed_ms in timings.items():
+        marker = "  <- chosen" if rounds == chosen else ""
+        print(f"rounds {rounds:2d}: {elapsed_ms:9.1f} ms{marker}")
+    print(f"BCRYPT_ROUNDS={chosen}")
+
+
+if __name__ == "__main__":
+    main()
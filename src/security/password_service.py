@@ -0,0 +1,103 @@
+import asyncio
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Callable, Optional, Tuple, TypeVar
+
+from config import get_settings
+from exceptions import PasswordHashingBusyError, PasswordHashingTimeoutError
+from security.passwords import hash_password, verify_password, verify_and_update_password
+
+T = TypeVar("T")
+
+
+class PasswordService:
+    """
+    Run bcrypt hashing and verification on a process pool, off the event loop.
+
+    The pool has one worker per core by default. At most `max_workers + queue_size` operations
+    may be in flight; further calls fail fast with `PasswordHashingBusyError` instead of piling
+    up behind a login burst. Callers give up after `timeout_seconds` with
+    `PasswordHashingTimeoutError`; an operation that has not started yet is then dropped.
+
+    A worker that dies abruptly (killed for memory, crashed) breaks the whole pool. The broken
+    pool is then discarded and the next call starts a fresh one; the calls that were in flight
+    fail with `PasswordHashingBusyError`.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None, queue_size: int = 32, timeout_seconds: float = 10.0) -> None:
+        self._max_workers = max_workers or os.cpu_count() or 1
+        self._max_pending = self._max_workers + queue_size
+        self._timeout_seconds = timeout_seconds
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._pending = 0
+
+    @property
+    def pending(self) -> int:
+        return self._pending
+
+    def start(self) -> None:
+        """
+        Create the process pool. Workers are spawned, not forked, so they never inherit the
+        event loop, open sockets or database connections of the server process.
+        """
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self._max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
+    async def hash(self, password: str) -> str:
+        return await self._run(hash_password, password)
+
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        return await self._run(verify_password, plain_password, hashed_password)
+
+    async def verify_and_update(self, plain_password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+        return await self._run(verify_and_update_password, plain_password, hashed_password)
+
+    async def _run(self, func: Callable[..., T], *args) -> T:
+        if self._pending >= self._max_pending:
+            raise PasswordHashingBusyError
+
+        self.start()
+        executor = self._executor
+        loop = asyncio.get_running_loop()
+        try:
+            future = executor.submit(func, *args)
+        except BrokenProcessPool:
+            self._discard(executor)
+            raise PasswordHashingBusyError
+        self._pending += 1
+        future.add_done_callback(lambda _: loop.call_soon_threadsafe(self._release))
+
+        try:
+            return await asyncio.wait_for(asyncio.wrap_future(future), timeout=self._timeout_seconds)
+        except asyncio.TimeoutError:
+            raise PasswordHashingTimeoutError
+        except BrokenProcessPool:
+            self._discard(executor)
+            raise PasswordHashingBusyError
+
+    def _discard(self, executor: ProcessPoolExecutor) -> None:
+        if self._executor is executor:
+            self._executor = None
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _release(self) -> None:
+        self._pending -= 1
+
+
+settings = get_settings()
+
+password_service = PasswordService(
+    max_workers=settings.PASSWORD_HASH_WORKERS,
+    queue_size=settings.PASSWORD_HASH_QUEUE_SIZE,
+    timeout_seconds=settings.PASSWORD_HASH_TIMEOUT_SECONDS,
+)
@@ -1,10 +1,25 @@
+from typing import Optional, Tuple
+
 from passlib.context import CryptContext
 
-pwd_context = CryptContext(
-    schemes=["bcrypt"],
-    bcrypt__rounds=14,
-    deprecated="auto"
-)
+from config import get_settings
+
+
+def build_password_context(rounds: int) -> CryptContext:
+    """
+    Build the bcrypt password context for the given cost factor.
+
+    Hashes made with any other cost factor are reported by `needs_update`, so changing the
+    cost is rolled out by rehashing on login.
+    """
+    return CryptContext(
+        schemes=["bcrypt"],
+        bcrypt__rounds=rounds,
+        deprecated="auto"
+    )
+
+
+pwd_context = build_password_context(get_settings().BCRYPT_ROUNDS)
 
 
 def hash_password(password: str) -> str:
@@ -12,7 +27,7 @@ def hash_password(password: str) -> str:
     Hash a plain-text password using the configured password context.
 
     This function takes a plain-text password and returns its bcrypt hash.
-    The bcrypt algorithm is used with a specified number of rounds for enhanced security.
+    The bcrypt algorithm is used with the number of rounds set by `BCRYPT_ROUNDS`.
 
     Args:
         password (str): The plain-text password to hash.
@@ -38,3 +53,20 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
         bool: True if the password is correct, False otherwise.
     """
     return pwd_context.verify(plain_password, hashed_password)
+
+
+def verify_and_update_password(plain_password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+    """
+    Verify a plain-text password and rehash it if its hash is outdated.
+
+    Both steps run in one call, so the password is only checked once.
+
+    Args:
+        plain_password (str): The plain-text password provided by the user.
+        hashed_password (str): The hashed password stored in the database.
+
+    Returns:
+        Tuple[bool, Optional[str]]: Whether the password is correct and, if it is and the stored
+        hash uses an outdated cost factor, a new hash to store instead.
+    """
+    return pwd_context.verify_and_update(plain_password, hashed_password)
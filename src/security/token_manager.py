@@ -1,3 +1,4 @@
+import hashlib
 from datetime import datetime, timedelta, timezone
 from typing import Optional
 
@@ -22,6 +23,14 @@ class JWTAuthManager(JWTAuthManagerInterface):
         self._secret_key_access = secret_key_access
         self._secret_key_refresh = secret_key_refresh
         self._algorithm = algorithm
+        self._access_key_id = hashlib.sha256(f"{algorithm}:{secret_key_access}".encode()).hexdigest()
+
+    @property
+    def access_key_id(self) -> str:
+        """
+        A fingerprint of the access token key and algorithm, which changes when either is rotated.
+        """
+        return self._access_key_id
 
     def _create_token(self, data: dict, secret_key: str, expires_delta: timedelta) -> str:
         """
@@ -0,0 +1 @@
+from tasks.token_sweeper import TokenSweeper
@@ -0,0 +1,76 @@
+import asyncio
+import logging
+from typing import Dict, Optional
+
+from sqlalchemy.orm import sessionmaker
+
+from crud import delete_expired_tokens
+from database import ActivationTokenModel, PasswordResetTokenModel, RefreshTokenModel
+
+logger = logging.getLogger(__name__)
+
+SWEPT_TOKEN_MODELS = (ActivationTokenModel, PasswordResetTokenModel, RefreshTokenModel)
+
+
+class TokenSweeper:
+    """
+    Periodically delete expired activation, password reset and refresh tokens.
+
+    Every `interval_seconds` each token table is swept in batches of `batch_size` rows, one
+    transaction per batch, so no sweep holds locks for long. A table stops being swept for
+    the run once a batch comes back short or `max_batches` batches were deleted.
+    """
+
+    def __init__(
+        self,
+        session_factory: sessionmaker,
+        interval_seconds: float,
+        batch_size: int,
+        max_batches: int,
+    ) -> None:
+        self._session_factory = session_factory
+        self._interval_seconds = interval_seconds
+        self._batch_size = batch_size
+        self._max_batches = max_batches
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name="token-sweeper")
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def sweep_once(self) -> Dict[str, int]:
+        """
+        Sweep every token table once.
+
+        :return: The number of deleted rows per table.
+        """
+        deleted = {}
+        async with self._session_factory() as session:
+            for model in SWEPT_TOKEN_MODELS:
+                deleted[model.__tablename__] = 0
+                for _ in range(self._max_batches):
+                    batch_deleted = await delete_expired_tokens(session, model, self._batch_size)
+                    deleted[model.__tablename__] += batch_deleted
+                    if batch_deleted < self._batch_size:
+                        break
+        return deleted
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                deleted = await self.sweep_once()
+                if any(deleted.values()):
+                    logger.info("Deleted expired tokens: %s", deleted)
+            except Exception:
+                # Keep sweeping after database outages; only cancellation ends the task.
+                logger.exception("Expired token sweep failed.")
+            await asyncio.sleep(self._interval_seconds)
@@ -0,0 +1,107 @@
+import os
+import tempfile
+
+_test_dir = tempfile.mkdtemp(prefix="online-cinema-tests-")
+
+# The settings are read once per process, so the test environment is set before the app is imported.
+os.environ.update(
+    DATABASE_BACKEND="sqlite",
+    PATH_TO_DB=os.path.join(_test_dir, "theater.db"),
+    SECRET_KEY_ACCESS="test-access-secret-key",
+    SECRET_KEY_REFRESH="test-refresh-secret-key",
+    BCRYPT_ROUNDS="4",
+    PASSWORD_HASH_WORKERS="1",
+    DB_POOL_PREWARM_CONNECTIONS="1",
+    EMAIL_OUTBOX_POLL_INTERVAL_SECONDS="3600",
+    TOKEN_SWEEP_INTERVAL_SECONDS="3600",
+)
+os.environ.pop("PROMETHEUS_MULTIPROC_DIR", None)
+
+import asyncio  # noqa: E402
+
+import httpx  # noqa: E402
+import pytest  # noqa: E402
+from sqlalchemy import insert  # noqa: E402
+from sqlalchemy.exc import OperationalError  # noqa: E402
+
+from cache import movie_detail_cache, access_token_cache  # noqa: E402
+from counters import movies_counter  # noqa: E402
+from database import Base, UserGroupModel, UserGroupEnum  # noqa: E402
+from main import app, lifespan  # noqa: E402
+from ratelimit import auth_ip_limiter, auth_email_limiter  # noqa: E402
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+class UnreachableDatabase:
+    """
+    A session factory whose connections fail like an unreachable database server.
+    """
+
+    def __init__(self, error: Exception) -> None:
+        self.error = error
+        self.attempts = 0
+        self.retried = asyncio.Event()
+
+    def __call__(self):
+        self.attempts += 1
+        if self.attempts > 1:
+            self.retried.set()
+        raise self.error
+
+
+@pytest.fixture
+def unreachable_database(request) -> UnreachableDatabase:
+    """
+    A session factory that fails every connection, with the error given by indirect parametrization
+    or an `OperationalError` by default.
+    """
+    error = getattr(request, "param", OperationalError("SELECT 1", {}, ConnectionRefusedError()))
+    return UnreachableDatabase(error)
+
+
+@pytest.fixture
+async def client():
+    """
+    An HTTP client for the application, with its lifespan running and an empty SQLite database.
+    """
+    async with lifespan(app):
+        container = app.state.container
+        async with container.engine.begin() as connection:
+            await connection.run_sync(Base.metadata.drop_all)
+            await connection.run_sync(Base.metadata.create_all)
+        async with container.session_factory() as session:
+            await session.execute(insert(UserGroupModel).values([{"name": group} for group in UserGroupEnum]))
+            await session.commit()
+        movie_detail_cache.clear()
+        access_token_cache.clear()
+        movies_counter.invalidate()
+        auth_ip_limiter.reset()
+        auth_email_limiter.reset()
+
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as http_client:
+            yield http_client
+
+
+@pytest.fixture
+async def auth_headers(client):
+    """
+    Authorization headers of a freshly registered and activated user.
+    """
+    credentials = {"email": "user@example.com", "password": "Str0ng!Password"}
+    response = await client.post("/api/v1/accounts/register/", json=credentials)
+    assert response.status_code == 201, response.text
+    response = await client.post(
+        "/api/v1/accounts/activate/",
+        json={"email": credentials["email"], "token": response.json()["activation_token"]},
+    )
+    assert response.status_code == 200, response.text
+    response = await client.post(
+        "/api/v1/accounts/login/",
+        data={"username": credentials["email"], "password": credentials["password"]},
+    )
+    assert response.status_code == 201, response.text
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
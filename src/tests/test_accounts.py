@@ -0,0 +1,27 @@
+import pytest
+
+import routes.accounts
+
+pytestmark = pytest.mark.anyio
+
+CREDENTIALS = {"email": "reader@example.com", "password": "Str0ng!Password"}
+
+
+async def test_duplicate_registration_is_a_conflict(client):
+    assert (await client.post("/api/v1/accounts/register/", json=CREDENTIALS)).status_code == 201
+
+    response = await client.post("/api/v1/accounts/register/", json={**CREDENTIALS, "email": "Reader@Example.com"})
+
+    assert response.status_code == 409
+    assert response.json() == {"detail": "A user with this email reader@example.com already exists."}
+
+
+async def test_other_integrity_errors_are_not_reported_as_duplicates(client, monkeypatch):
+    async def missing_group(db, name):
+        return 999
+
+    monkeypatch.setattr(routes.accounts, "get_user_group_id", missing_group)
+    response = await client.post("/api/v1/accounts/register/", json=CREDENTIALS)
+
+    assert response.status_code == 500
+    assert response.json() == {"detail": "An error occurred during user creation."}
@@ -0,0 +1,51 @@
+import asyncio
+import itertools
+import logging
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from config.container import Container
+
+pytestmark = pytest.mark.anyio
+
+
+def _container(url: str) -> Container:
+    engine = create_async_engine(url, poolclass=AsyncAdaptedQueuePool, pool_size=3)
+    return Container(settings=None, engine=engine, session_factory=None, replicas=None, jwt_manager=None)
+
+
+async def test_warm_up_opens_pooled_connections(tmp_path):
+    container = _container(f"sqlite+aiosqlite:///{tmp_path / 'theater.db'}")
+
+    await container.warm_up(5)
+
+    assert container.engine.pool.checkedin() == 3
+    await container.engine.dispose()
+
+
+async def test_warm_up_survives_an_unreachable_database(tmp_path, caplog):
+    container = _container(f"sqlite+aiosqlite:///{tmp_path / 'missing' / 'theater.db'}")
+
+    with caplog.at_level(logging.WARNING, logger="config.container"):
+        await asyncio.wait_for(container.warm_up(3), timeout=5)
+
+    assert "Could not pre-warm 3 of 3 database connections" in caplog.text
+    await container.engine.dispose()
+
+
+async def test_warm_up_releases_the_other_connections_when_one_fails(tmp_path):
+    container = _container(f"sqlite+aiosqlite:///{tmp_path / 'theater.db'}")
+    attempts = itertools.count()
+
+    @event.listens_for(container.engine.sync_engine, "do_connect")
+    def _fail_second_connection(dialect, conn_rec, cargs, cparams):
+        if next(attempts) == 1:
+            raise OSError("connection refused")
+
+    await asyncio.wait_for(container.warm_up(3), timeout=5)
+
+    assert container.engine.pool.checkedout() == 0
+    await container.engine.dispose()
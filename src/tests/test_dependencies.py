@@ -0,0 +1,41 @@
+from types import SimpleNamespace
+
+import httpx
+import pytest
+
+from config import get_container, get_jwt_auth_manager, get_settings
+from config.settings import Settings
+from database import get_db
+from exceptions import BaseSecurityError
+from main import app
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_requests_without_the_lifespan_fail_with_a_clear_error():
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as http_client:
+        with pytest.raises(RuntimeError, match="container is not initialized"):
+            await http_client.get("/api/v1/movies/movies/1/")
+
+
+async def test_get_db_uses_the_session_factory_of_the_container(client):
+    request = SimpleNamespace(app=app)
+    container = get_container(request)
+
+    sessions = get_db(request)
+    session = await anext(sessions)
+
+    assert session.bind is container.engine
+    await sessions.aclose()
+
+
+async def test_jwt_manager_follows_overridden_settings(client):
+    container = get_container(SimpleNamespace(app=app))
+    overridden = Settings(SECRET_KEY_ACCESS="other-access-key", SECRET_KEY_REFRESH="other-refresh-key")
+
+    assert get_jwt_auth_manager(container, get_settings()) is container.jwt_manager
+
+    token = get_jwt_auth_manager(container, overridden).create_access_token({"user_id": 1})
+    with pytest.raises(BaseSecurityError):
+        container.jwt_manager.decode_access_token(token)
@@ -0,0 +1,137 @@
+import asyncio
+import socket
+from contextlib import nullcontext
+from types import SimpleNamespace
+
+import pytest
+from aiosmtpd.controller import Controller
+from aiosmtpd.handlers import Message
+from sqlalchemy.exc import OperationalError
+
+import notifications.worker
+from config import get_settings
+from notifications import EmailOutboxWorker, EmailTemplateRenderer, SMTPConnectionPool
+
+pytestmark = pytest.mark.anyio
+
+
+class RecordingHandler(Message):
+    def __init__(self) -> None:
+        super().__init__()
+        self.messages = []
+
+    def handle_message(self, message) -> None:
+        self.messages.append(message)
+
+
+class FakeOutbox:
+    """
+    Stands in for the outbox table and its session, recording the outcome of each email.
+    """
+
+    def __init__(self, emails) -> None:
+        self.emails = emails
+        self.sent = []
+        self.failed = {}
+        self.commits = 0
+
+    async def claim(self, session, batch_size, lease_seconds):
+        claimed, self.emails = self.emails[:batch_size], self.emails[batch_size:]
+        return claimed
+
+    async def mark_sent(self, session, email_ids) -> None:
+        self.sent.extend(email_ids)
+
+    async def mark_failed(self, session, email_id, error, retry_at) -> None:
+        self.failed[email_id] = (error, retry_at)
+
+    async def commit(self) -> None:
+        self.commits += 1
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@pytest.fixture
+def smtp_server():
+    handler = RecordingHandler()
+    controller = Controller(handler, hostname="127.0.0.1", port=_free_port())
+    controller.start()
+    yield controller
+    controller.stop()
+
+
+@pytest.fixture
+def outbox(monkeypatch):
+    email = SimpleNamespace(
+        id=1,
+        recipient="reader@example.com",
+        template_name=get_settings().ACTIVATION_EMAIL_TEMPLATE_NAME,
+        context={"email": "reader@example.com", "activation_token": "token"},
+        attempts=1,
+    )
+    fake_outbox = FakeOutbox([email])
+    monkeypatch.setattr(notifications.worker, "claim_outbox_batch", fake_outbox.claim)
+    monkeypatch.setattr(notifications.worker, "mark_emails_sent", fake_outbox.mark_sent)
+    monkeypatch.setattr(notifications.worker, "mark_email_failed", fake_outbox.mark_failed)
+    return fake_outbox
+
+
+def _worker(session_factory, port: int) -> EmailOutboxWorker:
+    return EmailOutboxWorker(
+        session_factory=session_factory,
+        mailer=SMTPConnectionPool(host="127.0.0.1", port=port, pool_size=2, timeout_seconds=5),
+        renderer=EmailTemplateRenderer(get_settings().PATH_TO_EMAIL_TEMPLATES_DIR),
+        sender="no-reply@theater.test",
+        poll_interval_seconds=0,
+        backoff_seconds=60,
+    )
+
+
+async def test_claimed_emails_are_delivered_over_smtp(outbox, smtp_server):
+    worker = _worker(lambda: nullcontext(outbox), smtp_server.port)
+
+    assert await worker.deliver_batch() == 1
+    assert await worker.deliver_batch() == 0
+    await worker.stop()
+
+    [message] = smtp_server.handler.messages
+    assert message["To"] == "reader@example.com"
+    assert message["From"] == "no-reply@theater.test"
+    assert message["Subject"] == "Activate your Online Cinema account"
+    assert outbox.sent == [1]
+    assert outbox.commits == 1
+
+
+async def test_undelivered_email_is_scheduled_for_a_retry(outbox):
+    worker = _worker(lambda: nullcontext(outbox), _free_port())
+
+    assert await worker.deliver_batch() == 1
+    await worker.stop()
+
+    error, retry_at = outbox.failed[1]
+    assert outbox.sent == []
+    assert error.startswith("Delivery failed")
+    assert retry_at is not None
+
+
+@pytest.mark.parametrize(
+    "unreachable_database",
+    [
+        OperationalError("SELECT 1", {}, ConnectionRefusedError()),
+        OSError("connection refused"),
+        asyncio.TimeoutError(),
+    ],
+    indirect=True,
+)
+async def test_worker_keeps_running_after_database_errors(unreachable_database):
+    worker = _worker(unreachable_database, _free_port())
+
+    worker.start()
+    await asyncio.wait_for(unreachable_database.retried.wait(), timeout=5)
+    await worker.stop()
+
+    assert unreachable_database.attempts > 1
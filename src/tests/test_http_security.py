@@ -0,0 +1,21 @@
+import pytest
+
+from config import get_settings
+from config.settings import Settings
+from main import app
+
+pytestmark = pytest.mark.anyio
+
+CACHE_STATS_URL = "/api/v1/internal/cache/"
+
+
+async def test_cached_access_tokens_stop_working_when_the_key_is_rotated(client, auth_headers):
+    assert (await client.get(CACHE_STATS_URL, headers=auth_headers)).status_code == 403
+
+    app.dependency_overrides[get_settings] = lambda: Settings(SECRET_KEY_ACCESS="rotated-access-key")
+    try:
+        response = await client.get(CACHE_STATS_URL, headers=auth_headers)
+    finally:
+        app.dependency_overrides.pop(get_settings)
+
+    assert response.status_code == 400
@@ -0,0 +1,38 @@
+from cache.lru import LRUCache
+
+
+def test_a_value_loaded_before_an_invalidation_is_not_stored():
+    cache = LRUCache(maxsize=4, ttl_seconds=60)
+    generation = cache.generation()
+
+    cache.invalidate("movie:1")
+    cache.set("movie:1", "stale", generation=generation)
+    cache.set("movie:2", "fresh", generation=generation)
+
+    assert cache.get("movie:1") is None
+    assert cache.get("movie:2") == "fresh"
+
+
+def test_invalidations_are_remembered_in_bounded_memory():
+    cache = LRUCache(maxsize=4, ttl_seconds=60)
+    generation = cache.generation()
+
+    for movie_id in range(1000):
+        cache.invalidate(movie_id)
+    cache.set(0, "stale", generation=generation)
+
+    assert len(cache._invalidated_at) == 4
+    assert cache.get(0) is None
+
+    cache.set(0, "fresh", generation=cache.generation())
+    assert cache.get(0) == "fresh"
+
+
+def test_clear_rejects_values_loaded_before_it():
+    cache = LRUCache(maxsize=4, ttl_seconds=60)
+    generation = cache.generation()
+
+    cache.clear()
+    cache.set("movie:1", "stale", generation=generation)
+
+    assert cache.get("movie:1") is None
@@ -0,0 +1,62 @@
+import pytest
+
+from monitoring import assert_max_queries
+
+pytestmark = pytest.mark.anyio
+
+
+def movie_payload(name: str, **overrides) -> dict:
+    payload = {
+        "name": name,
+        "date": "2020-01-01",
+        "score": 7.5,
+        "overview": "A dragon guards a mountain.",
+        "status": "Released",
+        "budget": 1_000_000,
+        "revenue": 5_000_000,
+        "country": "fr",
+        "genres": ["science fiction", "drama"],
+        "actors": ["jane doe", "john roe"],
+        "languages": ["french"],
+    }
+    payload.update(overrides)
+    return payload
+
+
+@pytest.fixture
+async def movie_id(client, auth_headers) -> int:
+    response = await client.post("/api/v1/movies/movies/", json=movie_payload("Dragon Tale"), headers=auth_headers)
+    assert response.status_code == 201, response.text
+    return response.json()["id"]
+
+
+@pytest.mark.parametrize(
+    "query",
+    ["genre=science%20fiction", "genre=DRAMA", "actor=jane%20doe", "language=French", "country=fr"],
+)
+async def test_list_filters_match_names_regardless_of_case(client, movie_id, query):
+    response = await client.get(f"/api/v1/movies/movies/?{query}")
+
+    assert response.status_code == 200, response.text
+    assert [movie["id"] for movie in response.json()["movies"]] == [movie_id]
+
+
+async def test_movie_detail_query_count_does_not_grow_with_the_cast(client, auth_headers):
+    payload = movie_payload(
+        "Ensemble Piece",
+        genres=[f"genre {i}" for i in range(5)],
+        actors=[f"actor {i}" for i in range(25)],
+        languages=["french", "german", "italian"],
+    )
+    response = await client.post("/api/v1/movies/movies/", json=payload, headers=auth_headers)
+    assert response.status_code == 201, response.text
+    movie_id = response.json()["id"]
+
+    with assert_max_queries(4):
+        response = await client.get(f"/api/v1/movies/movies/{movie_id}/")
+    assert response.status_code == 200
+    assert len(response.json()["actors"]) == 25
+
+    with assert_max_queries(0):
+        response = await client.get(f"/api/v1/movies/movies/{movie_id}/")
+    assert response.status_code == 200
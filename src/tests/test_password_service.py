@@ -0,0 +1,55 @@
+import asyncio
+import os
+import time
+
+import pytest
+
+from exceptions import PasswordHashingBusyError, PasswordHashingTimeoutError
+from security.password_service import PasswordService
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+def service():
+    password_service = PasswordService(max_workers=1, queue_size=0, timeout_seconds=30.0)
+    yield password_service
+    password_service.shutdown()
+
+
+async def test_hash_and_verify_run_on_the_pool(service):
+    hashed = await service.hash("Str0ng!Password")
+
+    assert await service.verify("Str0ng!Password", hashed)
+    assert not await service.verify("Wr0ng!Password", hashed)
+    assert service.pending == 0
+
+
+async def test_calls_beyond_the_queue_fail_fast(service):
+    running = asyncio.create_task(service._run(time.sleep, 0.5))
+    await asyncio.sleep(0)
+
+    with pytest.raises(PasswordHashingBusyError):
+        await service.hash("Str0ng!Password")
+
+    await running
+    assert service.pending == 0
+
+
+async def test_calls_give_up_after_the_timeout():
+    service = PasswordService(max_workers=1, queue_size=0, timeout_seconds=0.2)
+    try:
+        with pytest.raises(PasswordHashingTimeoutError):
+            await service._run(time.sleep, 1)
+    finally:
+        service.shutdown()
+
+
+async def test_a_dead_worker_fails_the_call_and_the_pool_is_replaced(service):
+    hashed = await service.hash("Str0ng!Password")
+
+    with pytest.raises(PasswordHashingBusyError):
+        await service._run(os._exit, 1)
+
+    assert await service.verify("Str0ng!Password", hashed)
+    assert service.pending == 0
@@ -0,0 +1,17 @@
+import logging
+
+import pytest
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_requests_log_their_slowest_statement(client, caplog):
+    with caplog.at_level(logging.DEBUG, logger="monitoring.middleware"):
+        response = await client.get("/api/v1/movies/movies/?genre=Drama")
+
+    assert response.status_code == 404
+    [record] = [record for record in caplog.records if record.name == "monitoring.middleware"]
+    assert record.getMessage().startswith("GET /api/v1/movies/movies/ executed ")
+    assert "slowest took" in record.getMessage()
+    assert "SELECT" in record.getMessage()
+    assert "db-slowest;dur=" in response.headers["Server-Timing"]
@@ -0,0 +1,19 @@
+import os
+
+import pytest
+
+from benchmarks.query_plan_check import check_query_plans
+
+pytestmark = pytest.mark.anyio
+
+QUERY_PLAN_DATABASE_URL = os.environ.get("QUERY_PLAN_DATABASE_URL")
+
+
+@pytest.mark.skipif(
+    not QUERY_PLAN_DATABASE_URL,
+    reason="Set QUERY_PLAN_DATABASE_URL to a scratch PostgreSQL database migrated to head.",
+)
+async def test_crud_queries_do_not_scan_large_tables_sequentially():
+    failures = await check_query_plans(QUERY_PLAN_DATABASE_URL, reset=True)
+
+    assert not failures, f"Sequential scans on large tables in: {', '.join(failures)}"
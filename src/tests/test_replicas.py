@@ -0,0 +1,124 @@
+import time
+from types import SimpleNamespace
+
+import httpx
+import pytest
+from fastapi import Depends, FastAPI
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from database import ReplicaRouter, ReadYourWritesMiddleware, get_read_db, is_primary_session
+from database.replicas import READ_YOUR_WRITES_COOKIE
+
+pytestmark = pytest.mark.anyio
+
+
+async def _sqlite_engine(path, name):
+    """
+    A SQLite file standing in for one database server; it knows its own name.
+    """
+    engine = create_async_engine(f"sqlite+aiosqlite:///{path}")
+    async with engine.begin() as connection:
+        await connection.execute(text("CREATE TABLE server (name TEXT)"))
+        await connection.execute(text("INSERT INTO server (name) VALUES (:name)"), {"name": name})
+    return engine
+
+
+async def _server_name(session_factory) -> str:
+    async with session_factory() as session:
+        return await session.scalar(text("SELECT name FROM server"))
+
+
+@pytest.fixture
+async def router(tmp_path):
+    primary = await _sqlite_engine(tmp_path / "primary.db", "primary")
+    replicas = [
+        await _sqlite_engine(tmp_path / "replica-0.db", "replica-0"),
+        await _sqlite_engine(tmp_path / "replica-1.db", "replica-1"),
+    ]
+    replica_router = ReplicaRouter(
+        primary_session_factory=sessionmaker(bind=primary, class_=AsyncSession),  # type: ignore
+        replica_engines=replicas,
+        health_check_timeout_seconds=1.0,
+    )
+    yield replica_router
+    await replica_router.close()
+    await primary.dispose()
+
+
+async def test_reads_use_the_primary_until_replicas_pass_a_health_check(router):
+    assert router.next_replica() is None
+    assert await _server_name(router.session_factory(router.next_replica())) == "primary"
+
+
+async def test_reads_are_spread_round_robin_over_healthy_replicas(router):
+    await router.check_health()
+
+    names = [await _server_name(router.session_factory(router.next_replica())) for _ in range(4)]
+
+    assert router.healthy_replicas == 2
+    assert names == ["replica-0", "replica-1", "replica-0", "replica-1"]
+
+
+async def test_failed_health_check_routes_reads_to_the_remaining_replica(router, tmp_path):
+    await router.check_health()
+    await router._engines[1].dispose()
+    (tmp_path / "replica-1.db").unlink()
+    (tmp_path / "replica-1.db").mkdir()
+
+    await router.check_health()
+
+    assert router.healthy_replicas == 1
+    assert {router.next_replica() for _ in range(4)} == {0}
+
+
+async def test_reads_fall_back_to_the_primary_when_no_replica_is_healthy(router):
+    await router.check_health()
+    router.mark_unhealthy(0)
+    router.mark_unhealthy(1)
+
+    assert router.next_replica() is None
+    assert await _server_name(router.session_factory(router.next_replica())) == "primary"
+
+
+@pytest.fixture
+async def client(router):
+    await router.check_health()
+    app = FastAPI()
+    app.state.container = SimpleNamespace(replicas=router)
+    app.add_middleware(ReadYourWritesMiddleware, window_seconds=5)
+
+    @app.get("/server/")
+    async def read_server(db: AsyncSession = Depends(get_read_db)):
+        return {"name": await db.scalar(text("SELECT name FROM server")), "primary": is_primary_session(db)}
+
+    @app.post("/writes/")
+    async def write():
+        return {}
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test.local") as http_client:
+        yield http_client
+
+
+async def test_reads_go_to_replicas_without_a_recent_write(client):
+    response = await client.get("/server/")
+
+    assert response.json() == {"name": "replica-0", "primary": False}
+
+
+async def test_reads_stick_to_the_primary_within_the_read_your_writes_window(client):
+    response = await client.post("/writes/")
+    assert READ_YOUR_WRITES_COOKIE in response.cookies
+
+    names = {(await client.get("/server/")).json()["name"] for _ in range(3)}
+
+    assert names == {"primary"}
+
+
+async def test_reads_return_to_replicas_once_the_window_has_passed(client):
+    client.cookies.set(READ_YOUR_WRITES_COOKIE, str(time.time() - 1), domain="test.local")
+
+    response = await client.get("/server/")
+
+    assert response.json() == {"name": "replica-0", "primary": False}
@@ -0,0 +1,47 @@
+import asyncio
+from contextlib import nullcontext
+
+import pytest
+from sqlalchemy.exc import OperationalError
+
+import tasks.token_sweeper
+from database import ActivationTokenModel, PasswordResetTokenModel, RefreshTokenModel
+from tasks import TokenSweeper
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_each_table_is_swept_in_batches_up_to_max_batches(monkeypatch):
+    expired = {ActivationTokenModel: 25, PasswordResetTokenModel: 0, RefreshTokenModel: 100}
+
+    async def delete_expired_tokens(session, model, batch_size):
+        deleted = min(expired[model], batch_size)
+        expired[model] -= deleted
+        return deleted
+
+    monkeypatch.setattr(tasks.token_sweeper, "delete_expired_tokens", delete_expired_tokens)
+    sweeper = TokenSweeper(session_factory=nullcontext, interval_seconds=0, batch_size=10, max_batches=3)
+
+    deleted = await sweeper.sweep_once()
+
+    assert deleted == {"activation_tokens": 25, "password_reset_tokens": 0, "refresh_tokens": 30}
+    assert expired[RefreshTokenModel] == 70
+
+
+@pytest.mark.parametrize(
+    "unreachable_database",
+    [
+        OperationalError("SELECT 1", {}, ConnectionRefusedError()),
+        OSError("connection refused"),
+        asyncio.TimeoutError(),
+    ],
+    indirect=True,
+)
+async def test_sweeper_keeps_running_after_database_errors(unreachable_database):
+    sweeper = TokenSweeper(session_factory=unreachable_database, interval_seconds=0, batch_size=10, max_batches=1)
+
+    sweeper.start()
+    await asyncio.wait_for(unreachable_database.retried.wait(), timeout=5)
+    await sweeper.stop()
+
+    assert unreachable_database.attempts > 1